@@ -1,23 +1,30 @@
-from typing import Dict, Optional
+import logging
+
+from typing import List, Optional
+
+from django.db import IntegrityError, transaction
 
 from activitylogs.manager import default_manager
 from constants import user_system
 from event_manager.event import Event
 from event_manager.event_service import EventService
 
+_logger = logging.getLogger('polyaxon.activitylogs')
+
 
 class ActivityLogService(EventService):
     event_manager = default_manager
 
     def __init__(self):
         self.activity_log_manager = None
+        self._batch = None
 
-    def record_event(self, event: Event) -> Optional[Dict]:
+    def record_event(self, event: Event) -> Optional['ActivityLog']:
         if not event.ref_id:
             return
         assert event.actor_id is not None
         actor_id = event.data[event.actor_id]
-        return self.activity_log_manager.create(
+        activity_log = self.activity_log_manager.model(
             ref=event.ref_id,
             event_type=event.event_type,
             actor_id=actor_id if actor_id != user_system.USER_SYSTEM_ID else None,
@@ -26,6 +33,33 @@ class ActivityLogService(EventService):
             object_id=event.instance_id,
             content_type_id=event.instance_contenttype
         )
+        # Activity logs of a batch are created at once
+        if self._batch is not None:
+            self._batch.append(activity_log)
+        else:
+            activity_log.save()
+        return activity_log
+
+    def record_batch(self, events: List[Event]) -> None:
+        self._batch = []
+        try:
+            super().record_batch(events)
+            batch = self._batch
+        finally:
+            self._batch = None
+
+        try:
+            with transaction.atomic():
+                self.activity_log_manager.bulk_create(batch)
+        except IntegrityError:
+            # Only the failing activity logs are skipped
+            for activity_log in batch:
+                try:
+                    with transaction.atomic():
+                        activity_log.save()
+                except IntegrityError:
+                    _logger.warning('Could not record the activity log of event `%s`',
+                                    activity_log.event_type)
 
     def setup(self) -> None:
         super().setup()
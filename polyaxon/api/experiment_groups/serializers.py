@@ -4,6 +4,7 @@ from rest_framework.exceptions import ValidationError
 from api.utils.serializers.bookmarks import BookmarkedSerializerMixin
 from api.utils.serializers.names import NamesMixin
 from api.utils.serializers.tags import TagsSerializerMixin
+from constants.experiments import ExperimentLifeCycle
 from db.models.experiment_groups import (
     ExperimentGroup,
     ExperimentGroupChartView,
@@ -94,25 +95,25 @@ class ExperimentGroupDetailSerializer(BookmarkedExperimentGroupSerializer,
         )
 
     def get_num_experiments(self, obj: ExperimentGroup) -> int:
-        return obj.group_experiments.count()
+        return obj.count_experiments()
 
     def get_num_pending_experiments(self, obj: ExperimentGroup) -> int:
-        return obj.pending_experiments.count()
+        return obj.count_experiments(statuses=ExperimentLifeCycle.PENDING_STATUS)
 
     def get_num_running_experiments(self, obj: ExperimentGroup) -> int:
-        return obj.running_experiments.count()
+        return obj.count_experiments(statuses=ExperimentLifeCycle.RUNNING_STATUS)
 
     def get_num_scheduled_experiments(self, obj: ExperimentGroup) -> int:
-        return obj.scheduled_experiments.count()
+        return obj.count_experiments(statuses={ExperimentLifeCycle.SCHEDULED})
 
     def get_num_succeeded_experiments(self, obj: ExperimentGroup) -> int:
-        return obj.succeeded_experiments.count()
+        return obj.count_experiments(statuses={ExperimentLifeCycle.SUCCEEDED})
 
     def get_num_failed_experiments(self, obj: ExperimentGroup) -> int:
-        return obj.failed_experiments.count()
+        return obj.count_experiments(statuses={ExperimentLifeCycle.FAILED})
 
     def get_num_stopped_experiments(self, obj: ExperimentGroup) -> int:
-        return obj.stopped_experiments.count()
+        return obj.count_experiments(statuses={ExperimentLifeCycle.STOPPED})
 
     def get_current_iteration(self, obj: ExperimentGroup):
         return obj.iterations.count()
@@ -50,6 +50,9 @@ experiments_urlpatterns = [
     re_path(r'^{}/{}/experiments/{}/metrics/?$'.format(
         OWNER_NAME_PATTERN, PROJECT_NAME_PATTERN, EXPERIMENT_ID_PATTERN),
         views.ExperimentMetricListView.as_view()),
+    re_path(r'^{}/{}/experiments/{}/metrics/query/?$'.format(
+        OWNER_NAME_PATTERN, PROJECT_NAME_PATTERN, EXPERIMENT_ID_PATTERN),
+        views.ExperimentMetricQueryView.as_view()),
     re_path(r'^{}/{}/experiments/{}/chartviews/?$'.format(
         OWNER_NAME_PATTERN, PROJECT_NAME_PATTERN, EXPERIMENT_ID_PATTERN),
         views.ExperimentChartViewListView.as_view()),
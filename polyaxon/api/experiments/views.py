@@ -93,11 +93,13 @@ from event_manager.events.experiment_job import (
 )
 from event_manager.events.project import PROJECT_EXPERIMENTS_VIEWED
 from libs.archive import archive_logs_file, archive_outputs, archive_outputs_file
+from libs.metrics import MetricsSampling, downsample_column, get_metrics_columns
 from libs.spec_validation import validate_experiment_spec_config
+from logs_handlers.buffer import buffer_experiment_logs
 from logs_handlers.log_queries.experiment import process_logs
 from logs_handlers.log_queries.experiment_job import process_logs as process_experiment_job_logs
 from polyaxon.celery_api import celery_app
-from polyaxon.settings import LogsCeleryTasks, SchedulerCeleryTasks
+from polyaxon.settings import SchedulerCeleryTasks
 from schemas.tasks import TaskType
 from scopes.authentication.ephemeral import EphemeralAuthentication
 from scopes.authentication.internal import InternalAuthentication
@@ -546,6 +548,58 @@ class ExperimentMetricListView(ExperimentResourceEndpoint,
         return response
 
 
+class ExperimentMetricQueryView(ExperimentResourceListEndpoint, ListEndpoint):
+    """
+    get:
+        Query the metrics of an experiment as columns (steps, timestamps, values),
+        downsampled to a budget of points per metric.
+        The `cursor` returned can be passed as `since` to only get the new metrics.
+    """
+    queryset = ExperimentMetric.objects
+    DEFAULT_POINTS = 1000
+    MAX_POINTS = 10000
+
+    def get_query_params(self):
+        query_params = self.request.query_params
+        names = query_params.get('metrics')
+        names = [name.strip() for name in names.split(',') if name.strip()] if names else None
+        sampling = query_params.get('sampling', MetricsSampling.LTTB)
+        if sampling not in MetricsSampling.VALUES:
+            raise ValidationError('Sampling `{}` is not supported, it must be one of {}.'.format(
+                sampling, sorted(MetricsSampling.VALUES)))
+        try:
+            points = int(query_params.get('points', self.DEFAULT_POINTS))
+            since = int(query_params['since']) if query_params.get('since') else None
+        except ValueError:
+            raise ValidationError('`points` and `since` must be integers.')
+        if points < 1:
+            raise ValidationError('`points` must be a positive integer.')
+        return names, sampling, min(points, self.MAX_POINTS), since
+
+    @gzip()
+    def get(self, request, *args, **kwargs):
+        names, sampling, points, since = self.get_query_params()
+        queryset = self.filter_queryset(self.get_queryset())
+        offset = 0
+        if since is not None:
+            offset = queryset.filter(id__lte=since).count()
+            queryset = queryset.filter(id__gt=since)
+        rows = list(queryset.order_by('id').values_list('id', 'created_at', 'values'))
+        columns = get_metrics_columns(rows=rows, offset=offset, names=names)
+        auditor.record(event_type=EXPERIMENT_METRICS_VIEWED,
+                       instance=self.experiment,
+                       actor_id=request.user.id,
+                       actor_name=request.user.username)
+        return Response(data={
+            'cursor': rows[-1][0] if rows else since,
+            'count': len(rows),
+            'metrics': {name: downsample_column(column=column,
+                                                threshold=points,
+                                                sampling=sampling)
+                        for name, column in columns.items()}
+        })
+
+
 class ExperimentStatusDetailView(ExperimentResourceEndpoint, RetrieveEndpoint):
     """Get experiment status details."""
     queryset = ExperimentStatus.objects
@@ -656,16 +710,9 @@ class ExperimentLogsView(ExperimentEndpoint, RetrieveEndpoint, PostEndpoint):
         log_lines = request.data
         if not log_lines or not isinstance(log_lines, (str, list)):
             raise ValidationError('Logs handler expects `data` to be a string or list of strings.')
-        if isinstance(log_lines, list):
-            log_lines = '\n'.join(log_lines)
-        celery_app.send_task(
-            LogsCeleryTasks.LOGS_HANDLE_EXPERIMENT_JOB,
-            kwargs={
-                'experiment_name': self.experiment.unique_name,
-                'experiment_uuid': self.experiment.uuid.hex,
-                'log_lines': log_lines,
-                'temp': True
-            })
+        buffer_experiment_logs(experiment_name=self.experiment.unique_name,
+                               experiment_uuid=self.experiment.uuid.hex,
+                               log_lines=log_lines)
         return Response(status=status.HTTP_200_OK)
 
 
@@ -18,6 +18,7 @@ auditor.subscribe(experiment_group.ExperimentGroupExperimentsViewedEvent)
 auditor.subscribe(experiment_group.ExperimentGroupStatusesViewedEvent)
 auditor.subscribe(experiment_group.ExperimentGroupMetricsViewedEvent)
 auditor.subscribe(experiment_group.ExperimentGroupIterationEvent)
+auditor.subscribe(experiment_group.ExperimentGroupExperimentsCreatedEvent)
 auditor.subscribe(experiment_group.ExperimentGroupRandomEvent)
 auditor.subscribe(experiment_group.ExperimentGroupGridEvent)
 auditor.subscribe(experiment_group.ExperimentGroupHyperbandEvent)
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 from auditor.manager import default_manager
 from event_manager.event import Event
@@ -7,7 +7,7 @@ from event_manager.event_service import EventService
 
 class AuditorService(EventService):
     """An service that just passes the event to author services."""
-    __all__ = EventService.__all__ + ('log', 'notify', 'track')
+    __all__ = EventService.__all__ + ('log', 'notify', 'track', 'flush')
 
     event_manager = default_manager
 
@@ -33,7 +33,13 @@ class AuditorService(EventService):
     def record_event(self, event: Event) -> None:
         """
         Record the event async.
+
+        The event is buffered, and the buffered events are dispatched in batches
+        by a single flush task per flush interval.
         """
+        import conf
+
+        from db.redis.events_buffer import RedisEventsBuffer
         from polyaxon.celery_api import celery_app
         from polyaxon.settings import EventsCeleryTasks
 
@@ -43,21 +49,35 @@ class AuditorService(EventService):
                                            include_actor_name=True,
                                            include_instance_info=True)
 
-        celery_app.send_task(EventsCeleryTasks.EVENTS_TRACK, kwargs={'event': serialized_event})
-        celery_app.send_task(EventsCeleryTasks.EVENTS_LOG, kwargs={'event': serialized_event})
-        celery_app.send_task(EventsCeleryTasks.EVENTS_NOTIFY, kwargs={'event': serialized_event})
+        if RedisEventsBuffer.append(event=serialized_event):
+            celery_app.send_task(EventsCeleryTasks.EVENTS_FLUSH_BUFFER,
+                                 countdown=conf.get('EVENTS_FLUSH_INTERVAL'))
         # We include the instance in the serialized event for executor
         serialized_event['instance'] = event.instance
         self.executor.record(event_type=event.event_type, event_data=serialized_event)
 
-    def notify(self, event: Dict) -> None:
-        self.notifier.record(event_type=event['type'], event_data=event)
+    def flush(self) -> None:
+        """Dispatches the buffered events, as a single batch per handling service."""
+        from db.redis.events_buffer import RedisEventsBuffer
+        from polyaxon.celery_api import celery_app
+        from polyaxon.settings import EventsCeleryTasks
+
+        events = RedisEventsBuffer.drain()
+        if not events:
+            return
+
+        celery_app.send_task(EventsCeleryTasks.EVENTS_TRACK, kwargs={'events': events})
+        celery_app.send_task(EventsCeleryTasks.EVENTS_LOG, kwargs={'events': events})
+        celery_app.send_task(EventsCeleryTasks.EVENTS_NOTIFY, kwargs={'events': events})
+
+    def notify(self, events: List[Dict]) -> None:
+        self.notifier.record_events(events_data=events)
 
-    def track(self, event: Dict) -> None:
-        self.tracker.record(event_type=event['type'], event_data=event)
+    def track(self, events: List[Dict]) -> None:
+        self.tracker.record_events(events_data=events)
 
-    def log(self, event: Dict) -> None:
-        self.activitylogs.record(event_type=event['type'], event_data=event)
+    def log(self, events: List[Dict]) -> None:
+        self.activitylogs.record_events(events_data=events)
 
     def setup(self) -> None:
         super().setup()
@@ -1,5 +1,3 @@
-import conf
-
 from crons.tasks.utils import get_date_check
 from db.models.build_jobs import BuildJob
 from db.models.experiment_groups import ExperimentGroup
@@ -9,18 +7,22 @@ from db.models.notebooks import NotebookJob
 from db.models.projects import Project
 from db.models.tensorboards import TensorboardJob
 from polyaxon.celery_api import celery_app
-from polyaxon.settings import CleaningIntervals, CronsCeleryTasks, SchedulerCeleryTasks
+from polyaxon.settings import CleaningIntervals, CronsCeleryTasks
+from scheduler.deletion import delete_in_chunks
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_PROJECTS, ignore_result=True)
 def delete_archived_projects() -> None:
     last_date = get_date_check(days=CleaningIntervals.ARCHIVED)
     ids = Project.archived.filter(updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        celery_app.send_task(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_PROJECT,
-            kwargs={'project_id': _id},
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+    delete_in_chunks(model=Project,
+                     ids=ids,
+                     children=[(Experiment, 'project'),
+                               (ExperimentGroup, 'project'),
+                               (Job, 'project'),
+                               (BuildJob, 'project'),
+                               (NotebookJob, 'project'),
+                               (TensorboardJob, 'project')])
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_EXPERIMENT_GROUPS, ignore_result=True)
@@ -30,11 +32,9 @@ def delete_archived_experiment_groups() -> None:
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
         updated_at__lte=last_date).values_list('id', flat=True)
-    for group in groups:
-        celery_app.send_task(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_EXPERIMENT_GROUP,
-            kwargs={'group_id': group},
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+    delete_in_chunks(model=ExperimentGroup,
+                     ids=groups,
+                     children=[(Experiment, 'experiment_group')])
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_EXPERIMENTS, ignore_result=True)
@@ -47,11 +47,7 @@ def delete_archived_experiments() -> None:
         # We exclude as well experiments that will be deleted in groups
         experiment_group__deleted=False,
     ).values_list('id', flat=True)
-    for _id in ids:
-        celery_app.send_task(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_EXPERIMENT,
-            kwargs={'experiment_id': _id},
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+    delete_in_chunks(model=Experiment, ids=ids)
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_JOBS, ignore_result=True)
@@ -61,11 +57,7 @@ def delete_archived_jobs() -> None:
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
         updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        celery_app.send_task(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_JOB,
-            kwargs={'job_id': _id},
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+    delete_in_chunks(model=Job, ids=ids)
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_BUILD_JOBS, ignore_result=True)
@@ -75,11 +67,7 @@ def delete_archived_build_jobs() -> None:
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
         updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        celery_app.send_task(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_BUILD_JOB,
-            kwargs={'job_id': _id},
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+    delete_in_chunks(model=BuildJob, ids=ids)
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_NOTEBOOK_JOBS, ignore_result=True)
@@ -89,11 +77,7 @@ def delete_archived_notebook_jobs() -> None:
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
         updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        celery_app.send_task(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_NOTEBOOK_JOB,
-            kwargs={'job_id': _id},
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+    delete_in_chunks(model=NotebookJob, ids=ids)
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_TENSORBOARD_JOBS, ignore_result=True)
@@ -103,8 +87,4 @@ def delete_archived_tensorboard_jobs() -> None:
         # We only check values that will not be deleted by the archived projects
         project__deleted=False,
         updated_at__lte=last_date).values_list('id', flat=True)
-    for _id in ids:
-        celery_app.send_task(
-            SchedulerCeleryTasks.DELETE_ARCHIVED_TENSORBOARD_JOB,
-            kwargs={'job_id': _id},
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+    delete_in_chunks(model=TensorboardJob, ids=ids)
@@ -0,0 +1,14 @@
+from constants.experiment_groups import ExperimentGroupLifeCycle
+from db.models.experiment_groups import ExperimentGroup, GroupTypes
+from polyaxon.celery_api import celery_app
+from polyaxon.settings import CronsCeleryTasks
+
+
+@celery_app.task(name=CronsCeleryTasks.EXPERIMENT_GROUPS_SYNC_EXPERIMENTS_COUNTS,
+                 ignore_result=True)
+def experiment_groups_sync_experiments_counts() -> None:
+    """Recomputes the experiments counts of the active groups, in case some updates were lost."""
+    experiment_groups = ExperimentGroup.objects.filter(group_type=GroupTypes.STUDY).exclude(
+        status__status__in=ExperimentGroupLifeCycle.DONE_STATUS)
+    for experiment_group in experiment_groups.only('id'):
+        experiment_group.sync_experiments_counts()
@@ -1,20 +1,50 @@
-from django.db.models import Count
-
-import conf
+from typing import Dict
 
 from constants.experiments import ExperimentLifeCycle
+from db.models.experiment_jobs import ExperimentJob
 from db.models.experiments import Experiment
 from polyaxon.celery_api import celery_app
-from polyaxon.settings import CronsCeleryTasks, SchedulerCeleryTasks
+from polyaxon.settings import CronsCeleryTasks
+from schemas.tasks import TaskType
+
+
+def get_experiments_calculated_statuses() -> Dict[int, str]:
+    """Returns the calculated statuses of the active experiments that are out of sync.
+
+    The statuses of all jobs of the active experiments are fetched in a single query,
+    and the experiments' statuses are computed in memory.
+    """
+    jobs = ExperimentJob.objects.exclude(
+        experiment__status__status__in=ExperimentLifeCycle.DONE_STATUS)
+    jobs = jobs.values_list('experiment_id', 'experiment__status__status', 'role', 'status__status')
+
+    experiments = {}
+    for experiment_id, last_status, role, job_status in jobs:
+        if experiment_id not in experiments:
+            experiments[experiment_id] = {'last_status': last_status,
+                                          'master_status': None,
+                                          'job_statuses': []}
+        if job_status is None:
+            continue
+        if role == TaskType.MASTER:
+            experiments[experiment_id]['master_status'] = job_status
+        experiments[experiment_id]['job_statuses'].append(job_status)
+
+    calculated_statuses = {}
+    for experiment_id, statuses in experiments.items():
+        calculated_status = Experiment.compute_status(**statuses)
+        if calculated_status != statuses['last_status']:
+            calculated_statuses[experiment_id] = calculated_status
+    return calculated_statuses
 
 
 @celery_app.task(name=CronsCeleryTasks.EXPERIMENTS_SYNC_JOBS_STATUSES, ignore_result=True)
 def experiments_sync_jobs_statuses() -> None:
-    experiments = Experiment.objects.exclude(
-        status__status__in=ExperimentLifeCycle.DONE_STATUS)
-    experiments = experiments.annotate(num_jobs=Count('jobs')).filter(num_jobs__gt=0)
+    calculated_statuses = get_experiments_calculated_statuses()
+    if not calculated_statuses:
+        return
+
+    experiments = Experiment.objects.filter(
+        id__in=calculated_statuses.keys()).select_related('status')
     for experiment in experiments:
-        celery_app.send_task(
-            SchedulerCeleryTasks.EXPERIMENTS_CHECK_STATUS,
-            kwargs={'experiment_id': experiment.id},
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+        experiment.update_status(calculated_status=calculated_statuses[experiment.id])
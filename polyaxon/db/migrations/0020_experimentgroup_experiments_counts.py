@@ -0,0 +1,38 @@
+# Generated by Django 2.1.7 on 2019-03-04 10:12
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations
+from django.db.models import Count
+
+
+def set_experiments_counts(apps, schema_editor):
+    ExperimentGroup = apps.get_model('db', 'ExperimentGroup')
+    Experiment = apps.get_model('db', 'Experiment')
+
+    counts = {}
+    rows = Experiment.objects.filter(
+        deleted=False,
+        experiment_group__isnull=False,
+        status__isnull=False).order_by().values_list(
+        'experiment_group_id', 'status__status').annotate(count=Count('id'))
+    for group_id, status, count in rows:
+        counts.setdefault(group_id, {})[status] = count
+
+    for group_id, group_counts in counts.items():
+        ExperimentGroup.objects.filter(id=group_id).update(experiments_counts=group_counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0019_auto_20190221_1805'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experimentgroup',
+            name='experiments_counts',
+            field=django.contrib.postgres.fields.jsonb.JSONField(blank=True, default=dict, editable=False, help_text='The number of live experiments of this group per status.'),
+        ),
+        migrations.RunPython(set_experiments_counts, migrations.RunPython.noop),
+    ]
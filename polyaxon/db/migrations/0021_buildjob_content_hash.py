@@ -0,0 +1,40 @@
+# Generated by Django 2.1.7 on 2019-03-06 09:41
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+
+def get_build_content_hash(config, code_reference_id):
+    # A frozen copy of `libs.builds.get_build_content_hash`
+    value = json.dumps({'config': config, 'code_reference': code_reference_id},
+                       sort_keys=True,
+                       separators=(',', ':'))
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+def set_content_hashes(apps, schema_editor):
+    BuildJob = apps.get_model('db', 'BuildJob')
+
+    rows = BuildJob.objects.values_list('id', 'config', 'code_reference_id')
+    for build_id, config, code_reference_id in rows.iterator():
+        BuildJob.objects.filter(id=build_id).update(
+            content_hash=get_build_content_hash(config=config,
+                                                code_reference_id=code_reference_id))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0020_experimentgroup_experiments_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='buildjob',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='The hash of the config and code reference, used to reuse the builds.', max_length=64, null=True),
+        ),
+        migrations.RunPython(set_content_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 2.1.7 on 2019-03-07 11:18
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def get_suggestion_hash(params, keys):
+    # A frozen copy of `hpsearch.search_managers.utils.get_suggestion_hash`
+    value = ','.join(['{}:{}'.format(key, params[key]) for key in sorted(keys)])
+    return hashlib.md5(value.encode('utf-8')).hexdigest()
+
+
+def set_suggestion_hashes(apps, schema_editor):
+    ExperimentGroup = apps.get_model('db', 'ExperimentGroup')
+    Experiment = apps.get_model('db', 'Experiment')
+
+    groups = ExperimentGroup.objects.filter(hptuning__isnull=False).values_list('id', 'hptuning')
+    for group_id, hptuning in groups.iterator():
+        keys = list((hptuning or {}).get('matrix') or {})
+        if not keys:
+            continue
+        experiments = Experiment.objects.filter(
+            experiment_group_id=group_id,
+            declarations__isnull=False).values_list('id', 'declarations')
+        for experiment_id, declarations in experiments.iterator():
+            if not all(key in declarations for key in keys):
+                continue
+            Experiment.objects.filter(id=experiment_id).update(
+                suggestion_hash=get_suggestion_hash(params=declarations, keys=keys))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0021_buildjob_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experiment',
+            name='suggestion_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='The hash of the matrix params suggested by the experiment group.', max_length=32, null=True),
+        ),
+        migrations.RunPython(set_suggestion_hashes, migrations.RunPython.noop),
+    ]
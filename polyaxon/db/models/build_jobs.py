@@ -24,8 +24,10 @@ from db.models.utils import (
     TagModel
 )
 from db.redis.heartbeat import RedisHeartBeat
+from libs.builds import get_build_content_hash
 from libs.paths.jobs import get_job_subpath
 from libs.spec_validation import validate_build_spec_config
+from libs.specifications_cache import get_specification
 from schemas.build_backends import BuildBackend
 from schemas.specifications import BuildSpecification
 
@@ -67,6 +69,13 @@ class BuildJob(AbstractJob,
         blank=True,
         null=True,
         help_text='The dockerfile used to create the image with this job.')
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        editable=False,
+        db_index=True,
+        help_text='The hash of the config and code reference, used to reuse the builds.')
     status = models.OneToOneField(
         'db.BuildJobStatus',
         related_name='+',
@@ -101,7 +110,7 @@ class BuildJob(AbstractJob,
 
     @cached_property
     def specification(self) -> 'BuildSpecification':
-        return BuildSpecification(values=self.config)
+        return get_specification(BuildSpecification, self.config)
 
     @property
     def has_specification(self) -> bool:
@@ -146,9 +155,12 @@ class BuildJob(AbstractJob,
              build_config.build.image_tag == LATEST_IMAGE_TAG)
         )
         if not rebuild_cond:
-            job = BuildJob.objects.filter(project=project,
-                                          config=build_config.parsed_data,
-                                          code_reference=code_reference).last()
+            content_hash = get_build_content_hash(
+                config=build_config.parsed_data,
+                code_reference_id=code_reference.id if code_reference else None)
+            job = BuildJob.objects.select_related('status').filter(
+                project=project,
+                content_hash=content_hash).last()
             if job:
                 return job, False
 
@@ -3,15 +3,15 @@ import logging
 import uuid
 
 from operator import __or__ as OR
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from hestia.datetime_typing import AwareDT
 
 from django.conf import settings
 from django.contrib.postgres.fields import JSONField
 from django.contrib.postgres.fields.jsonb import KeyTransform
-from django.db import models
-from django.db.models import Q
+from django.db import models, transaction
+from django.db.models import Count, Q
 from django.utils.functional import cached_property
 
 from constants.experiment_groups import ExperimentGroupLifeCycle
@@ -33,7 +33,8 @@ from db.models.utils import (
 )
 from libs.paths.experiment_groups import get_experiment_group_subpath
 from libs.spec_validation import validate_group_hptuning_config, validate_group_spec_content
-from schemas.hptuning import HPTuningConfig, Optimization
+from libs.specifications_cache import get_hptuning_config, get_specification
+from schemas.hptuning import HPTuningConfig, Optimization, SearchAlgorithms
 from schemas.specifications import GroupSpecification
 
 _logger = logging.getLogger('polyaxon.db.experiment_groups')
@@ -110,6 +111,15 @@ class ExperimentGroup(DiffModel,
         null=True,
         editable=True,
         on_delete=models.SET_NULL)
+    experiments_counts = JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text='The number of live experiments of this group per status.')
+
+    # Statuses of experiments that are using resources on the cluster
+    K8S_EXPERIMENTS_STATUSES = (ExperimentLifeCycle.RUNNING_STATUS |
+                                {ExperimentLifeCycle.UNKNOWN, ExperimentLifeCycle.WARNING})
 
     class Meta:
         app_label = 'db'
@@ -182,21 +192,70 @@ class ExperimentGroup(DiffModel,
         if not super().archive():
             return False
         self.experiments.update(deleted=True)
+        self.sync_experiments_counts()
         return True
 
     def restore(self) -> bool:
         if not super().restore():
             return False
         self.all_experiments.update(deleted=False)
+        self.sync_experiments_counts()
         return True
 
+    @classmethod
+    def update_experiments_counts(cls,
+                                  group_id: int,
+                                  status_from: Optional[str] = None,
+                                  status_to: Optional[str] = None,
+                                  count: int = 1) -> None:
+        """Moves `count` experiments of a group from a status to another.
+
+        The group's row is locked during the update, so that concurrent changes are not lost.
+        """
+        if status_from == status_to:
+            return
+
+        with transaction.atomic():
+            counts = cls.all.select_for_update().filter(id=group_id).values_list(
+                'experiments_counts', flat=True).first()
+            if counts is None:
+                return
+            if status_from:
+                counts[status_from] = max(counts.get(status_from, 0) - count, 0)
+            if status_to:
+                counts[status_to] = counts.get(status_to, 0) + count
+            cls.all.filter(id=group_id).update(experiments_counts=counts)
+
+    def sync_experiments_counts(self) -> None:
+        """Recomputes the experiments counts of the group with a single aggregation."""
+        self.experiments_counts = dict(
+            self.experiments.filter(status__isnull=False).order_by().values_list(
+                'status__status').annotate(count=Count('id')))
+        ExperimentGroup.all.filter(id=self.id).update(experiments_counts=self.experiments_counts)
+
+    def count_experiments(self, statuses: Optional[Set[str]] = None) -> int:
+        """Returns the number of experiments in the statuses, or of all experiments if None.
+
+        Study groups read their denormalized counts, selections count their experiments.
+        """
+        if self.is_selection:
+            experiments = self.selection_experiments
+            if statuses is not None:
+                experiments = experiments.filter(status__status__in=statuses)
+            return experiments.distinct().count()
+
+        counts = self.experiments_counts or {}
+        if statuses is None:
+            return sum(counts.values())
+        return sum(counts.get(status, 0) for status in statuses)
+
     @cached_property
     def hptuning_config(self) -> Optional['HPTuningConfig']:
-        return HPTuningConfig.from_dict(self.hptuning) if self.hptuning else None
+        return get_hptuning_config(self.hptuning) if self.hptuning else None
 
     @cached_property
     def specification(self) -> Optional['GroupSpecification']:
-        return GroupSpecification.read(self.content) if self.content else None
+        return get_specification(GroupSpecification, self.content) if self.content else None
 
     @property
     def has_specification(self) -> bool:
@@ -284,10 +343,8 @@ class ExperimentGroup(DiffModel,
 
     @property
     def k8s_experiments(self):
-        scheduled_statuses = (ExperimentLifeCycle.RUNNING_STATUS |
-                              {ExperimentLifeCycle.UNKNOWN, ExperimentLifeCycle.WARNING})
         return self.group_experiments.filter(
-            status__status__in=scheduled_statuses).distinct()
+            status__status__in=self.K8S_EXPERIMENTS_STATUSES).distinct()
 
     @property
     def done_experiments(self):
@@ -304,7 +361,7 @@ class ExperimentGroup(DiffModel,
         """We need to check if we are allowed to start the experiment
         If the polyaxonfile has concurrency we need to check how many experiments are running.
         """
-        return self.concurrency - self.k8s_experiments.count()
+        return self.concurrency - self.count_experiments(statuses=self.K8S_EXPERIMENTS_STATUSES)
 
     @property
     def iteration(self):
@@ -389,11 +446,21 @@ class ExperimentGroup(DiffModel,
                 iteration=iteration_data)
         return None
 
+    def get_issued_suggestion_hashes(self) -> Set[str]:
+        """The hashes of the matrix params already issued to the group's experiments."""
+        return set(self.experiments.filter(suggestion_hash__isnull=False).values_list(
+            'suggestion_hash', flat=True))
+
     def get_suggestions(self):
+        kwargs = {}
         iteration_config = self.iteration_config
         if iteration_config:
-            return self.search_manager.get_suggestions(iteration_config=iteration_config)
-        return self.search_manager.get_suggestions()
+            kwargs['iteration_config'] = iteration_config
+        if (SearchAlgorithms.is_random(self.search_algorithm) or
+                SearchAlgorithms.is_hyperband(self.search_algorithm)):
+            # Restarts and later brackets must not regenerate the same suggestions
+            kwargs['issued_hashes'] = self.get_issued_suggestion_hashes()
+        return self.search_manager.get_suggestions(**kwargs)
 
     def get_num_suggestions(self) -> int:
         iteration_config = self.iteration_config
@@ -17,6 +17,7 @@ from constants.jobs import JobLifeCycle
 from db.models.abstract_jobs import TensorboardJobMixin
 from db.models.charts import ChartViewModel
 from db.models.cloning_strategies import CloningStrategy
+from db.models.experiment_groups import ExperimentGroup
 from db.models.statuses import LastStatusMixin, StatusModel
 from db.models.unique_names import EXPERIMENT_UNIQUE_NAME_FORMAT
 from db.models.utils import (
@@ -36,11 +37,13 @@ from db.models.utils import (
 from db.redis.heartbeat import RedisHeartBeat
 from event_manager.events.experiment import (
     EXPERIMENT_COPIED,
+    EXPERIMENT_NEW_METRIC,
     EXPERIMENT_RESTARTED,
     EXPERIMENT_RESUMED
 )
 from libs.paths.experiments import get_experiment_subpath
 from libs.spec_validation import validate_experiment_spec_config
+from libs.specifications_cache import get_specification
 from schemas.pod_resources import PodResourcesConfig
 from schemas.specifications import ExperimentSpecification
 from schemas.tasks import TaskType
@@ -93,6 +96,13 @@ class Experiment(DiffModel,
         blank=True,
         null=True,
         help_text='The parameters used for this experiment.')
+    suggestion_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        null=True,
+        editable=False,
+        db_index=True,
+        help_text='The hash of the matrix params suggested by the experiment group.')
     config = JSONField(
         null=True,
         blank=True,
@@ -150,7 +160,7 @@ class Experiment(DiffModel,
 
     @cached_property
     def specification(self) -> 'ExperimentSpecification':
-        return ExperimentSpecification(values=self.config) if self.config else None
+        return get_specification(ExperimentSpecification, self.config) if self.config else None
 
     @property
     def has_specification(self) -> bool:
@@ -194,16 +204,25 @@ class Experiment(DiffModel,
         """"Return a boolean indicating if the experiment has any running jobs"""
         return self.jobs.exclude(status__status__in=ExperimentLifeCycle.DONE_STATUS).exists()
 
-    @property
-    def calculated_status(self) -> str:
-        master_status = self.jobs.filter(role=TaskType.MASTER)[0].last_status
+    @staticmethod
+    def compute_status(last_status: Optional[str],
+                       master_status: Optional[str],
+                       job_statuses: List[str]) -> Optional[str]:
+        """Computes the status of an experiment based on the statuses of its jobs."""
         calculated_status = master_status if JobLifeCycle.is_done(master_status) else None
         if calculated_status is None:
-            calculated_status = ExperimentLifeCycle.jobs_status(self.last_job_statuses)
+            calculated_status = ExperimentLifeCycle.jobs_status(job_statuses)
         if calculated_status is None:
-            return self.last_status
+            return last_status
         return calculated_status
 
+    @property
+    def calculated_status(self) -> str:
+        master_status = self.jobs.filter(role=TaskType.MASTER)[0].last_status
+        return self.compute_status(last_status=self.last_status,
+                                   master_status=master_status,
+                                   job_statuses=self.last_job_statuses)
+
     @property
     def is_clone(self) -> bool:
         return self.original_experiment is not None
@@ -229,9 +248,25 @@ class Experiment(DiffModel,
         """If the experiment belongs to a experiment_group or is independently created."""
         return self.experiment_group is None
 
-    def update_status(self) -> bool:
+    def archive(self) -> bool:
+        if not super().archive():
+            return False
+        if self.experiment_group_id:
+            ExperimentGroup.update_experiments_counts(group_id=self.experiment_group_id,
+                                                      status_from=self.last_status)
+        return True
+
+    def restore(self) -> bool:
+        if not super().restore():
+            return False
+        if self.experiment_group_id:
+            ExperimentGroup.update_experiments_counts(group_id=self.experiment_group_id,
+                                                      status_to=self.last_status)
+        return True
+
+    def update_status(self, calculated_status: str = None) -> bool:
         current_status = self.last_status
-        calculated_status = self.calculated_status
+        calculated_status = calculated_status or self.calculated_status
         if calculated_status != current_status:
             if calculated_status == ExperimentLifeCycle.UNSCHEDULABLE:
                 # Add details augmentation if the it's UNSCHEDULABLE
@@ -272,6 +307,24 @@ class Experiment(DiffModel,
                                             traceback=traceback,
                                             **params)
 
+    def create_metrics(self, metrics: List[Dict]) -> List['ExperimentMetric']:
+        """Bulk creates a batch of metrics.
+
+        `last_metric` is merged and saved once, and a single event is recorded for the batch.
+        """
+        if not metrics:
+            return []
+        instances = ExperimentMetric.objects.bulk_create([
+            ExperimentMetric(experiment=self, **metric) for metric in metrics
+        ])
+        last_metric = self.last_metric or {}
+        for instance in instances:
+            last_metric.update(instance.values)
+        self.last_metric = last_metric
+        self.save(update_fields=['last_metric'])
+        auditor.record(event_type=EXPERIMENT_NEW_METRIC, instance=self)
+        return instances
+
     def _clone(self,
                cloning_strategy: str,
                event_type: str,
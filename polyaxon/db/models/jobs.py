@@ -30,6 +30,7 @@ from db.redis.heartbeat import RedisHeartBeat
 from event_manager.events.job import JOB_RESTARTED
 from libs.paths.jobs import get_job_subpath
 from libs.spec_validation import validate_job_spec_config
+from libs.specifications_cache import get_specification
 from schemas.specifications import JobSpecification
 
 
@@ -110,7 +111,7 @@ class Job(AbstractJob,
 
     @cached_property
     def specification(self) -> 'JobSpecification':
-        return JobSpecification(values=self.config)
+        return get_specification(JobSpecification, self.config)
 
     @property
     def has_specification(self) -> bool:
@@ -13,6 +13,7 @@ from db.models.unique_names import NOTEBOOK_UNIQUE_NAME_FORMAT
 from db.models.utils import DataReference
 from libs.paths.jobs import get_job_subpath
 from libs.spec_validation import validate_notebook_spec_config
+from libs.specifications_cache import get_specification
 from schemas.specifications import NotebookSpecification
 
 
@@ -54,7 +55,7 @@ class NotebookJob(PluginJobBase, DataReference, JobMixin):
 
     @cached_property
     def specification(self) -> 'NotebookSpecification':
-        return NotebookSpecification(values=self.config)
+        return get_specification(NotebookSpecification, self.config)
 
     @property
     def has_specification(self) -> bool:
@@ -1,7 +1,7 @@
 import logging
 import uuid
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from celery.result import AsyncResult
 from hestia.datetime_typing import AwareDT
@@ -9,7 +9,10 @@ from hestia.datetime_typing import AwareDT
 from django.conf import settings
 from django.contrib.postgres.fields import JSONField
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.dispatch import Signal
+from django.utils import timezone
+from django.utils.functional import cached_property
 
 from constants.pipelines import OperationStatuses, PipelineStatuses, TriggerPolicy
 from db.models.statuses import LastStatusMixin, StatusModel
@@ -23,7 +26,7 @@ from db.models.utils import (
     TagModel
 )
 from polyaxon.celery_api import celery_app
-from polyaxon.settings import Intervals
+from polyaxon.settings import Intervals, PipelinesCeleryTasks
 
 _logger = logging.getLogger('db.pipelines')
 
@@ -132,17 +135,17 @@ class Pipeline(DiffModel, NameableModel, DescribableModel, TagModel, ExecutableM
             project_name=self.project.unique_name,
             id=self.id)
 
-    @property
+    @cached_property
     def dag(self) -> Tuple[Dict, Dict]:
-        """Construct the DAG of this pipeline based on the its operations and their downstream."""
-        from pipelines import dags
+        """Construct the DAG of this pipeline based on the its operations and their downstream.
 
-        operations = self.operations.all().prefetch_related('downstream_operations')
-
-        def get_downstream(op):
-            return op.downstream_operations.values_list('id', flat=True)
+        All the edges are fetched with a single query.
+        """
+        from pipelines import dags
 
-        return dags.get_dag(operations, get_downstream)
+        edges = Operation.upstream_operations.through.objects.filter(
+            to_operation__pipeline=self).values_list('to_operation_id', 'from_operation_id')
+        return dags.get_dag_from_edges(nodes=self.operations.all(), edges=edges)
 
 
 class Operation(DiffModel,
@@ -394,19 +397,19 @@ class PipelineRun(RunModel):
     class Meta:
         app_label = 'db'
 
-    @property
+    @cached_property
     def dag(self) -> Tuple[Dict, Dict]:
         """Construct the DAG of this pipeline run
         based on the its operation runs and their downstream.
+
+        All the edges are fetched with a single query.
         """
         from pipelines import dags
 
-        operation_runs = self.operation_runs.all().prefetch_related('downstream_runs')
-
-        def get_downstream(op_run):
-            return op_run.downstream_runs.values_list('id', flat=True)
-
-        return dags.get_dag(operation_runs, get_downstream)
+        edges = OperationRun.upstream_runs.through.objects.filter(
+            to_operationrun__pipeline_run=self).values_list('to_operationrun_id',
+                                                             'from_operationrun_id')
+        return dags.get_dag_from_edges(nodes=self.operation_runs.all(), edges=edges)
 
     def on_finished(self, message: str = None) -> None:
         self.set_status(status=self.STATUSES.FINISHED, message=message)
@@ -473,6 +476,102 @@ class PipelineRun(RunModel):
 
         return self.n_operation_runs_to_start > 0
 
+    def schedule_start_operation_runs(self) -> bool:
+        """Schedule all the operation runs of this pipeline run that can start, in one pass.
+
+        This is the set based version of `OperationRun.schedule_start`:
+        the statuses of the operation runs and their upstream runs are loaded once,
+        the runs to start and the runs with failed upstreams are computed in memory,
+        following the topological order and the pipeline/operations concurrency,
+        and their new statuses are created in bulk.
+
+        Returns:
+            boolean: Whether to try to schedule operation runs in the future or not.
+        """
+        from pipelines import dags
+
+        dag, op_runs = self.dag
+        statuses = dict(self.operation_runs.values_list('id', 'status__status'))
+        # Only the runs of this pipeline run count towards its concurrency
+        n_running = len([True for op_run_id in op_runs
+                         if statuses.get(op_run_id) in OperationStatuses.RUNNING_STATUS])
+        upstream_runs = {op_run_id: [] for op_run_id in op_runs}
+        edges = OperationRun.upstream_runs.through.objects.filter(
+            from_operationrun__pipeline_run=self).values_list(
+            'from_operationrun_id', 'to_operationrun_id', 'to_operationrun__status__status')
+        for op_run_id, upstream_run_id, status in edges:
+            upstream_runs[op_run_id].append(upstream_run_id)
+            # Upstream runs could be outside of this pipeline run
+            statuses[upstream_run_id] = status
+
+        created_op_runs = [op_runs[op_run_id] for op_run_id in dags.sort_topologically(dag=dag)
+                           if statuses[op_run_id] == OperationStatuses.CREATED]
+        if not created_op_runs:
+            return False
+        operations = Operation.objects.in_bulk({op_run.operation_id for op_run in created_op_runs})
+        running_by_operations = dict(OperationRun.objects.filter(
+            operation_id__in=operations.keys(),
+            status__status__in=OperationStatuses.RUNNING_STATUS).values_list(
+            'operation_id').annotate(count=models.Count('id')))
+
+        should_retry = False
+        op_runs_to_start = []
+        op_runs_upstream_failed = []
+        for op_run in created_op_runs:
+            operation = operations[op_run.operation_id]
+            op_run.operation = operation
+            upstream = [statuses[upstream_run_id] for upstream_run_id in upstream_runs[op_run.id]]
+            if not check_upstream_trigger(trigger_policy=operation.trigger_policy,
+                                          statuses=upstream):
+                if is_upstream_done(statuses=upstream):
+                    # This task cannot be scheduled anymore
+                    op_runs_upstream_failed.append(op_run)
+                    # The downstream runs are checked in this pass as well
+                    statuses[op_run.id] = OperationStatuses.UPSTREAM_FAILED
+                # Otherwise, the run will be notified once its upstream runs are done
+                continue
+
+            if self.pipeline.concurrency and n_running >= self.pipeline.concurrency:
+                should_retry = True
+                continue
+
+            n_running_by_operation = running_by_operations.get(operation.id, 0)
+            if operation.concurrency and n_running_by_operation >= operation.concurrency:
+                should_retry = True
+                continue
+
+            op_runs_to_start.append(op_run)
+            n_running += 1
+            running_by_operations[operation.id] = n_running_by_operation + 1
+
+        OperationRun.bulk_set_status(op_runs=op_runs_upstream_failed,
+                                     status=OperationStatuses.UPSTREAM_FAILED)
+        OperationRun.bulk_set_status(op_runs=op_runs_to_start,
+                                     status=OperationStatuses.SCHEDULED)
+        OperationRun.bulk_start(op_runs=op_runs_to_start)
+        return should_retry
+
+
+def is_upstream_done(statuses: List[str]) -> bool:
+    return not bool([True for status in statuses if status not in OperationStatuses.DONE_STATUS])
+
+
+def check_upstream_trigger(trigger_policy: str, statuses: List[str]) -> bool:
+    """Checks the trigger rule against the statuses of the upstream runs."""
+    if trigger_policy == TriggerPolicy.ONE_DONE:
+        return any(status in OperationStatuses.DONE_STATUS for status in statuses)
+    if trigger_policy == TriggerPolicy.ONE_SUCCEEDED:
+        return any(status == OperationStatuses.SUCCEEDED for status in statuses)
+    if trigger_policy == TriggerPolicy.ONE_FAILED:
+        return any(status == OperationStatuses.FAILED for status in statuses)
+    if trigger_policy == TriggerPolicy.ALL_DONE:
+        return all(status in OperationStatuses.DONE_STATUS for status in statuses)
+    if trigger_policy == TriggerPolicy.ALL_SUCCEEDED:
+        return all(status == OperationStatuses.SUCCEEDED for status in statuses)
+    if trigger_policy == TriggerPolicy.ALL_FAILED:
+        return all(status in OperationStatuses.FAILED_STATUS for status in statuses)
+    return False
+
 
 class OperationRun(RunModel):
     """A model that represents an execution behaviour/run of instance of an operation."""
@@ -546,34 +645,18 @@ class OperationRun(RunModel):
             status__status__in=self.STATUSES.RUNNING_STATUS).count()
         return ops_count < self.operation.concurrency
 
+    @property
+    def upstream_statuses(self) -> List[str]:
+        return list(self.upstream_runs.values_list('status__status', flat=True))
+
     def check_upstream_trigger(self) -> bool:
         """Checks the upstream and the trigger rule."""
-        if self.operation.trigger_policy == TriggerPolicy.ONE_DONE:
-            return self.upstream_runs.filter(
-                status__status__in=self.STATUSES.DONE_STATUS).exists()
-        if self.operation.trigger_policy == TriggerPolicy.ONE_SUCCEEDED:
-            return self.upstream_runs.filter(
-                status__status=self.STATUSES.SUCCEEDED).exists()
-        if self.operation.trigger_policy == TriggerPolicy.ONE_FAILED:
-            return self.upstream_runs.filter(
-                status__status=self.STATUSES.FAILED).exists()
-
-        statuses = self.upstream_runs.values_list('status__status', flat=True)
-        if self.operation.trigger_policy == TriggerPolicy.ALL_DONE:
-            return not bool([True for status in statuses
-                             if status not in self.STATUSES.DONE_STATUS])
-        if self.operation.trigger_policy == TriggerPolicy.ALL_SUCCEEDED:
-            return not bool([True for status in statuses
-                             if status != self.STATUSES.SUCCEEDED])
-        if self.operation.trigger_policy == TriggerPolicy.ALL_FAILED:
-            return not bool([True for status in statuses
-                             if status not in self.STATUSES.FAILED_STATUS])
+        return check_upstream_trigger(trigger_policy=self.operation.trigger_policy,
+                                      statuses=self.upstream_statuses)
 
     @property
     def is_upstream_done(self) -> bool:
-        statuses = self.upstream_runs.values_list('status__status', flat=True)
-        return not bool([True for status in statuses
-                         if status not in self.STATUSES.DONE_STATUS])
+        return is_upstream_done(statuses=self.upstream_statuses)
 
     def schedule_start(self) -> bool:
         """Schedule the task: check first if the task can start:
@@ -622,8 +705,7 @@ class OperationRun(RunModel):
         self.start()
         return False
 
-    def start(self) -> None:
-        """Start the celery task of this operation."""
+    def _send_task(self) -> str:
         kwargs = self.celery_task_context
         # Update we the operation run id
         kwargs['operation_run_id'] = self.id  # pylint:disable=unsupported-assignment-operation
@@ -632,9 +714,74 @@ class OperationRun(RunModel):
             self.operation.celery_task,
             kwargs=kwargs,
             **self.operation.get_run_params())
-        self.celery_task_id = async_result.id
+        return async_result.id
+
+    def start(self) -> None:
+        """Start the celery task of this operation."""
+        self.celery_task_id = self._send_task()
         self.save()
 
+    @classmethod
+    def bulk_start(cls, op_runs: List['OperationRun']) -> None:
+        """Start the celery tasks of the operation runs, and save their ids in one query."""
+        if not op_runs:
+            return
+        for op_run in op_runs:
+            op_run.celery_task_id = op_run._send_task()  # pylint:disable=protected-access
+        cls.objects.filter(id__in=[op_run.id for op_run in op_runs]).update(
+            celery_task_id=models.Case(
+                *[models.When(id=op_run.id, then=models.Value(op_run.celery_task_id))
+                  for op_run in op_runs],
+                output_field=models.CharField()))
+
+    @classmethod
+    def bulk_set_status(cls, op_runs: List['OperationRun'], status: str) -> None:
+        """Create the same new status for the operation runs in bulk.
+
+        This does the work of the status' `post_save` signal
+        (the runs' last status, started/finished times, the pipeline run's status check,
+        and the downstream runs notification) once for all the runs.
+        """
+        if not op_runs:
+            return
+        run_statuses = OperationRunStatus.objects.bulk_create([
+            OperationRunStatus(operation_run=op_run, status=status) for op_run in op_runs
+        ])
+        values = {
+            'status': models.Case(
+                *[models.When(id=run_status.operation_run_id, then=run_status.id)
+                  for run_status in run_statuses],
+                output_field=models.IntegerField())
+        }
+        current_time = timezone.now()
+        is_done = cls.STATUSES.is_done(status)
+        if is_done:
+            values['finished_at'] = Coalesce('finished_at', models.Value(current_time))
+            values['started_at'] = Coalesce('started_at', 'created_at')
+        elif status == cls.STATUSES.RUNNING:
+            values['started_at'] = Coalesce('started_at', models.Value(current_time))
+        cls.objects.filter(id__in=[op_run.id for op_run in op_runs]).update(**values)
+        for op_run, run_status in zip(op_runs, run_statuses):
+            op_run.status = run_status
+            if is_done:
+                op_run.finished_at = op_run.finished_at or current_time
+                op_run.started_at = op_run.started_at or op_run.created_at
+            elif status == cls.STATUSES.RUNNING:
+                op_run.started_at = op_run.started_at or current_time
+
+        celery_app.send_task(
+            PipelinesCeleryTasks.PIPELINES_CHECK_STATUSES,
+            kwargs={'pipeline_run_id': op_runs[0].pipeline_run_id, 'status': status})
+        if is_done:
+            # Notify the downstream runs that their dependency is done
+            downstream_runs = cls.objects.filter(
+                upstream_runs__in=op_runs,
+                status__status=cls.STATUSES.CREATED).values_list('id', flat=True).distinct()
+            for op_run_id in downstream_runs:
+                celery_app.send_task(
+                    PipelinesCeleryTasks.PIPELINES_START_OPERATION,
+                    kwargs={'operation_run_id': op_run_id})
+
     def stop(self, message: str = None) -> None:
         if self.is_stoppable:
             task = AsyncResult(self.celery_task_id)
@@ -167,7 +167,7 @@ class Project(DiffModel,
     def archive(self) -> bool:
         if not super().archive():
             return False
-        self.experiment_groups.update(deleted=True)
+        self.experiment_groups.update(deleted=True, experiments_counts={})
         self.experiments.update(deleted=True)
         self.jobs.update(deleted=True)
         self.build_jobs.update(deleted=True)
@@ -184,4 +184,6 @@ class Project(DiffModel,
         self.all_build_jobs.update(deleted=False)
         self.all_notebook_jobs.update(deleted=False)
         self.all_tensorboard_jobs.update(deleted=False)
+        for experiment_group in self.experiment_groups.all():
+            experiment_group.sync_experiments_counts()
         return True
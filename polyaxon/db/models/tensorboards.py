@@ -13,6 +13,7 @@ from db.models.plugins import PluginJobBase
 from db.models.unique_names import TENSORBOARD_UNIQUE_NAME_FORMAT
 from libs.paths.jobs import get_job_subpath
 from libs.spec_validation import validate_tensorboard_spec_config
+from libs.specifications_cache import get_specification
 from schemas.specifications import TensorboardSpecification
 
 
@@ -64,7 +65,7 @@ class TensorboardJob(PluginJobBase, JobMixin):
 
     @cached_property
     def specification(self) -> 'TensorboardSpecification':
-        return TensorboardSpecification(values=self.config)
+        return get_specification(TensorboardSpecification, self.config)
 
     @property
     def has_specification(self) -> bool:
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from db.redis.base import BaseRedisDb
 from polyaxon.settings import RedisPools
@@ -29,36 +29,76 @@ class RedisJobContainers(BaseRedisDb):
         return experiment_uuid.decode('utf-8') if experiment_uuid else None
 
     @classmethod
-    def get_job(cls, container_id: str) -> Tuple[Optional[str], Optional[str]]:
+    def get_jobs(cls,
+                 container_ids: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Maps every container to its (job, experiment) in at most two round-trips."""
+        container_ids = list(container_ids)
+        jobs = {container_id: (None, None) for container_id in container_ids}
+        if not container_ids:
+            return jobs
+
         red = cls._get_redis()
-        if red.sismember(cls.KEY_CONTAINERS, container_id):
-            job_uuid = red.hget(cls.KEY_CONTAINERS_TO_JOBS, container_id)
-            if not job_uuid:
-                return None, None
+        job_uuids = red.hmget(cls.KEY_CONTAINERS_TO_JOBS, container_ids)
+        job_uuids = {container_id: job_uuid.decode('utf-8')
+                     for container_id, job_uuid in zip(container_ids, job_uuids) if job_uuid}
+        if not job_uuids:
+            return jobs
 
-            job_uuid = job_uuid.decode('utf-8')
-            experiment_uuid = cls.get_experiment_for_job(job_uuid=job_uuid, red=red)
-            return job_uuid, experiment_uuid
-        return None, None
+        unique_job_uuids = list(set(job_uuids.values()))
+        experiment_uuids = red.hmget(cls.KEY_JOBS_TO_EXPERIMENTS, unique_job_uuids)
+        experiment_uuids = {
+            job_uuid: experiment_uuid.decode('utf-8') if experiment_uuid else None
+            for job_uuid, experiment_uuid in zip(unique_job_uuids, experiment_uuids)}
+        for container_id, job_uuid in job_uuids.items():
+            jobs[container_id] = (job_uuid, experiment_uuids[job_uuid])
+        return jobs
 
     @classmethod
-    def remove_container(cls, container_id: str, red=None) -> None:
+    def get_job(cls, container_id: str) -> Tuple[Optional[str], Optional[str]]:
+        return cls.get_jobs([container_id])[container_id]
+
+    @classmethod
+    def remove_containers(cls, container_ids: Iterable[str], red=None) -> None:
+        container_ids = list(container_ids)
+        if not container_ids:
+            return
         red = red or cls._get_redis()
-        red.srem(cls.KEY_CONTAINERS, container_id)
-        red.hdel(cls.KEY_CONTAINERS_TO_JOBS, container_id)
+        pipe = red.pipeline(transaction=False)
+        pipe.srem(cls.KEY_CONTAINERS, *container_ids)
+        pipe.hdel(cls.KEY_CONTAINERS_TO_JOBS, *container_ids)
+        pipe.execute()
 
     @classmethod
-    def remove_job(cls, job_uuid: str) -> None:
+    def remove_container(cls, container_id: str, red=None) -> None:
+        cls.remove_containers([container_id], red=red)
+
+    @classmethod
+    def remove_jobs(cls, job_uuids: Iterable[str]) -> None:
+        """Removes the jobs and all their containers in two round-trips."""
+        job_uuids = list(job_uuids)
+        if not job_uuids:
+            return
         red = cls._get_redis()
-        key_jobs_to_containers = cls.KEY_JOBS_TO_CONTAINERS.format(job_uuid)
-        containers = red.smembers(key_jobs_to_containers)
-        for container_id in containers:
-            container_id = container_id.decode('utf-8')
-            red.srem(key_jobs_to_containers, container_id)
-            cls.remove_container(container_id=container_id, red=red)
+        keys_jobs_to_containers = [cls.KEY_JOBS_TO_CONTAINERS.format(job_uuid)
+                                   for job_uuid in job_uuids]
+        pipe = red.pipeline(transaction=False)
+        for key_jobs_to_containers in keys_jobs_to_containers:
+            pipe.smembers(key_jobs_to_containers)
+        container_ids = [container_id.decode('utf-8')
+                         for containers in pipe.execute() for container_id in containers]
 
+        pipe = red.pipeline(transaction=False)
+        if container_ids:
+            pipe.srem(cls.KEY_CONTAINERS, *container_ids)
+            pipe.hdel(cls.KEY_CONTAINERS_TO_JOBS, *container_ids)
+        pipe.delete(*keys_jobs_to_containers)
         # Remove the experiment too
-        red.hdel(cls.KEY_CONTAINERS_TO_JOBS, job_uuid)
+        pipe.hdel(cls.KEY_JOBS_TO_EXPERIMENTS, *job_uuids)
+        pipe.execute()
+
+    @classmethod
+    def remove_job(cls, job_uuid: str) -> None:
+        cls.remove_jobs([job_uuid])
 
     @classmethod
     def monitor(cls, container_id: str, job_uuid: str) -> None:
@@ -71,9 +111,11 @@ class RedisJobContainers(BaseRedisDb):
             except ExperimentJob.DoesNotExist:
                 return
 
-            red.sadd(cls.KEY_CONTAINERS, container_id)
-            red.hset(cls.KEY_CONTAINERS_TO_JOBS, container_id, job_uuid)
+            pipe = red.pipeline(transaction=False)
+            pipe.sadd(cls.KEY_CONTAINERS, container_id)
+            pipe.hset(cls.KEY_CONTAINERS_TO_JOBS, container_id, job_uuid)
             # Add container for job
-            red.sadd(cls.KEY_JOBS_TO_CONTAINERS.format(job_uuid), container_id)
+            pipe.sadd(cls.KEY_JOBS_TO_CONTAINERS.format(job_uuid), container_id)
             # Add job to experiment
-            red.hset(cls.KEY_JOBS_TO_EXPERIMENTS, job_uuid, job.experiment.uuid.hex)
+            pipe.hset(cls.KEY_JOBS_TO_EXPERIMENTS, job_uuid, job.experiment.uuid.hex)
+            pipe.execute()
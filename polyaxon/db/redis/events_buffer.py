@@ -0,0 +1,45 @@
+from typing import Dict, List
+
+import conf
+
+from db.redis.base import BaseRedisDb
+from libs.json_utils import dumps, loads
+from polyaxon.settings import RedisPools
+
+
+class RedisEventsBuffer(BaseRedisDb):
+    """
+    RedisEventsBuffer buffers the auditor events before they get dispatched in batches.
+    """
+    KEY_EVENTS = 'events.buffer'  # Redis list: serialized events
+    KEY_FLUSH = 'events.flush'  # Set while a flush of the buffer is scheduled
+
+    REDIS_POOL = RedisPools.TO_STREAM
+
+    @classmethod
+    def append(cls, event: Dict) -> bool:
+        """Appends the serialized event to the buffer.
+
+        Returns True if no flush was scheduled, i.e. the caller must schedule one.
+        """
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        pipe.rpush(cls.KEY_EVENTS, dumps(event))
+        # The flag expires in case the flush task is lost
+        pipe.set(cls.KEY_FLUSH, 1, ex=conf.get('EVENTS_FLUSH_INTERVAL') * 10, nx=True)
+        _, should_flush = pipe.execute()
+        return bool(should_flush)
+
+    @classmethod
+    def drain(cls) -> List[Dict]:
+        """Atomically pops all the buffered events.
+
+        Events appended afterwards will schedule a new flush.
+        """
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=True)
+        pipe.delete(cls.KEY_FLUSH)
+        pipe.lrange(cls.KEY_EVENTS, 0, -1)
+        pipe.delete(cls.KEY_EVENTS)
+        _, events, _ = pipe.execute()
+        return [loads(event.decode('utf-8')) for event in events]
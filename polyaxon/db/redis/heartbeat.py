@@ -1,3 +1,5 @@
+from typing import Iterable, List
+
 import conf
 
 from db.redis.base import BaseRedisDb
@@ -97,3 +99,26 @@ class RedisHeartBeat(BaseRedisDb):
     def build_is_alive(cls, build_id) -> bool:
         heart_beat = RedisHeartBeat(build=build_id)
         return heart_beat.is_alive()
+
+    @classmethod
+    def _get_dead(cls, key: str, ids: Iterable[int]) -> List[int]:
+        """Returns the ids that did not report a heartbeat, using a single MGET."""
+        ids = list(ids)
+        if not ids:
+            return []
+
+        red = cls._get_redis()
+        values = red.mget([key.format(_id) for _id in ids])
+        return [_id for _id, value in zip(ids, values) if not value]
+
+    @classmethod
+    def get_dead_experiments(cls, experiment_ids: Iterable[int]) -> List[int]:
+        return cls._get_dead(key=cls.KEY_EXPERIMENT, ids=experiment_ids)
+
+    @classmethod
+    def get_dead_jobs(cls, job_ids: Iterable[int]) -> List[int]:
+        return cls._get_dead(key=cls.KEY_JOB, ids=job_ids)
+
+    @classmethod
+    def get_dead_builds(cls, build_ids: Iterable[int]) -> List[int]:
+        return cls._get_dead(key=cls.KEY_BUILD, ids=build_ids)
@@ -0,0 +1,75 @@
+from typing import Iterable, List, Union
+
+import conf
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisLogsBuffer(BaseRedisDb):
+    """
+    RedisLogsBuffer buffers the log lines of runs before they get persisted in batches.
+    """
+    KEY_LOGS = 'logs.buffer.{}:{}'  # Redis list: log lines of a run
+    KEY_FLUSH = 'logs.flush.{}:{}'  # Set while a flush of the run's buffer is scheduled
+
+    REDIS_POOL = RedisPools.TO_STREAM
+
+    @classmethod
+    def get_logs_key(cls, kind: str, run_uuid: str) -> str:
+        return cls.KEY_LOGS.format(kind, run_uuid)
+
+    @classmethod
+    def get_flush_key(cls, kind: str, run_uuid: str) -> str:
+        return cls.KEY_FLUSH.format(kind, run_uuid)
+
+    @classmethod
+    def append(cls, kind: str, run_uuid: str, log_lines: Union[str, Iterable[str]]) -> bool:
+        """Appends the log lines to the run's buffer.
+
+        Returns True if no flush was scheduled for this run, i.e. the caller must schedule one.
+        """
+        if isinstance(log_lines, str):
+            log_lines = [log_lines]
+        log_lines = [log_line for log_line in log_lines if log_line]
+        if not log_lines:
+            return False
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        pipe.rpush(cls.get_logs_key(kind=kind, run_uuid=run_uuid), *log_lines)
+        # The flag expires in case the flush task is lost
+        pipe.set(cls.get_flush_key(kind=kind, run_uuid=run_uuid),
+                 1,
+                 ex=conf.get('LOGS_FLUSH_INTERVAL') * 10,
+                 nx=True)
+        _, should_flush = pipe.execute()
+        return bool(should_flush)
+
+    @classmethod
+    def get_log_lines(cls, kind: str, run_uuid: str) -> List[str]:
+        """Returns the buffered log lines of the run without removing them.
+
+        The lines must be trimmed once they are persisted.
+        """
+        red = cls._get_redis()
+        log_lines = red.lrange(cls.get_logs_key(kind=kind, run_uuid=run_uuid), 0, -1)
+        return [log_line.decode('utf-8') for log_line in log_lines]
+
+    @classmethod
+    def trim(cls, kind: str, run_uuid: str, count: int) -> bool:
+        """Removes the first `count` persisted log lines of the run's buffer.
+
+        Returns True if lines were appended in the meantime, i.e. the caller must schedule
+        a new flush.
+        """
+        logs_key = cls.get_logs_key(kind=kind, run_uuid=run_uuid)
+        flush_key = cls.get_flush_key(kind=kind, run_uuid=run_uuid)
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=True)
+        pipe.ltrim(logs_key, count, -1)
+        pipe.delete(flush_key)
+        pipe.llen(logs_key)
+        _, _, remaining = pipe.execute()
+        if not remaining:
+            return False
+        return bool(red.set(flush_key, 1, ex=conf.get('LOGS_FLUSH_INTERVAL') * 10, nx=True))
@@ -0,0 +1,58 @@
+from typing import Any, Dict, List, Optional
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisStatuses(BaseRedisDb):
+    """
+    Publishes the status transitions of runs, keyed by the runs' uuids.
+
+    The last status of every run is also kept for a while,
+    so that new listeners can get the current status without hitting the db.
+    """
+
+    KEY_STATUS = 'RUN_STATUS:{}'  # Redis key: run's last status
+    KEY_STATUS_CHANNEL = 'RUN_STATUS_CHANNEL:{}'  # Redis channel: run's status transitions
+
+    STATUS_TTL = 60 * 60 * 24
+
+    REDIS_POOL = RedisPools.TO_STREAM
+
+    @classmethod
+    def get_status_key(cls, run_uuid: str) -> str:
+        return cls.KEY_STATUS.format(run_uuid)
+
+    @classmethod
+    def get_status_channel(cls, run_uuid: str) -> str:
+        return cls.KEY_STATUS_CHANNEL.format(run_uuid)
+
+    @classmethod
+    def get_run_uuid(cls, channel: str) -> str:
+        return channel.split(':', 1)[1]
+
+    @classmethod
+    def publish_status(cls, run_uuid: str, status: str) -> None:
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        pipe.setex(cls.get_status_key(run_uuid), cls.STATUS_TTL, status)
+        pipe.publish(cls.get_status_channel(run_uuid), status)
+        pipe.execute()
+
+    @classmethod
+    def get_statuses(cls, run_uuids: List[str]) -> Dict[str, Optional[str]]:
+        """Returns the last known status of the runs with a single `MGET`."""
+        run_uuids = list(run_uuids)
+        if not run_uuids:
+            return {}
+        red = cls._get_redis()
+        statuses = red.mget([cls.get_status_key(run_uuid) for run_uuid in run_uuids])
+        return {run_uuid: status.decode('utf-8') if status else None
+                for run_uuid, status in zip(run_uuids, statuses)}
+
+    @classmethod
+    def subscribe(cls) -> Any:
+        """Subscribes to the status transitions of all runs."""
+        pubsub = cls._get_redis().pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(cls.get_status_channel('*'))
+        return pubsub
@@ -1,6 +1,6 @@
 import json
 
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from db.redis.base import BaseRedisDb
 from polyaxon.settings import RedisPools
@@ -17,6 +17,9 @@ class RedisToStream(BaseRedisDb):
     KEY_JOB_LOGS = 'JOB_LOGS'  # Redis set: job ids that we need to stream logs for
     KEY_EXPERIMENT_LOGS = 'EXPERIMENT_LOGS'  # Redis set: xp ids that we need to stream logs for
     KEY_JOB_LATEST_STATS = 'JOB_LATEST_STATS'  # Redis hash, maps job id to dict of stats
+    KEY_JOB_RESOURCES_CHANNEL = 'JOB_RESOURCES_CHANNEL:{}'  # Redis channel: job's stats
+    KEY_EXPERIMENT_RESOURCES_CHANNEL = 'EXPERIMENT_RESOURCES_CHANNEL:{}'  # Redis channel: xp's
+    # jobs' stats
     # We don't need a key for experiment because we will just aggregate jobs' stats
     # N.B: for logs, since we need to send all data since the tracking we will publish the data
     # Through an exchange
@@ -100,16 +103,27 @@ class RedisToStream(BaseRedisDb):
             return resources if as_json else json.dumps(resources)
         return None
 
+    @classmethod
+    def get_latest_resources(cls, job_uuids: List[str]) -> Dict[str, Dict]:
+        """Returns the latest stats of all the jobs with a single `HMGET`."""
+        job_uuids = list(job_uuids)
+        if not job_uuids:
+            return {}
+        red = cls._get_redis()
+        resources = red.hmget(cls.KEY_JOB_LATEST_STATS, job_uuids)
+        return {job_uuid: json.loads(job_resources.decode('utf-8'))
+                for job_uuid, job_resources in zip(job_uuids, resources) if job_resources}
+
     @classmethod
     def get_latest_experiment_resources(cls,
                                         jobs: List[Dict],
                                         as_json: bool = False) -> List[Optional[Union[str, Dict]]]:
+        resources = cls.get_latest_resources([job['uuid'] for job in jobs])
         stats = []
         for job in jobs:
-            job_resources = cls.get_latest_job_resources(job=job['uuid'],
-                                                         job_name=job['name'],
-                                                         as_json=True)
+            job_resources = resources.get(job['uuid'])
             if job_resources:
+                job_resources['job_name'] = job['name']
                 stats.append(job_resources)
         return stats if as_json else json.dumps(stats)
 
@@ -117,3 +131,49 @@ class RedisToStream(BaseRedisDb):
     def set_latest_job_resources(cls, job: str, payload: Dict) -> None:
         red = cls._get_redis()
         red.hset(cls.KEY_JOB_LATEST_STATS, job, json.dumps(payload))
+
+    @classmethod
+    def get_job_resources_channel(cls, job_uuid: str) -> str:
+        return cls.KEY_JOB_RESOURCES_CHANNEL.format(job_uuid)
+
+    @classmethod
+    def get_experiment_resources_channel(cls, experiment_uuid: str) -> str:
+        return cls.KEY_EXPERIMENT_RESOURCES_CHANNEL.format(experiment_uuid)
+
+    @classmethod
+    def get_monitored_resources(cls) -> Tuple[Set[str], Set[str]]:
+        """Returns the job and experiment uuids currently monitored in a single round-trip."""
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        pipe.smembers(cls.KEY_JOB_RESOURCES)
+        pipe.smembers(cls.KEY_EXPERIMENT_RESOURCES)
+        job_uuids, experiment_uuids = pipe.execute()
+        return ({job_uuid.decode('utf-8') for job_uuid in job_uuids},
+                {experiment_uuid.decode('utf-8') for experiment_uuid in experiment_uuids})
+
+    @classmethod
+    def publish_resources(cls, payloads: List[Dict]) -> None:
+        """Sets the latest stats of the jobs and publishes them to the jobs' and
+        experiments' channels.
+
+        Everything is sent in a single pipeline.
+        """
+        if not payloads:
+            return
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        for payload in payloads:
+            job_uuid = payload['job_uuid']
+            experiment_uuid = payload.get('experiment_uuid')
+            payload = json.dumps(payload)
+            pipe.hset(cls.KEY_JOB_LATEST_STATS, job_uuid, payload)
+            pipe.publish(cls.get_job_resources_channel(job_uuid), payload)
+            if experiment_uuid:
+                pipe.publish(cls.get_experiment_resources_channel(experiment_uuid), payload)
+        pipe.execute()
+
+    @classmethod
+    def subscribe(cls, channel: str) -> Any:
+        pubsub = cls._get_redis().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel)
+        return pubsub
@@ -1,10 +1,10 @@
-from typing import Any, Mapping
+from typing import Any, Iterable, List, Mapping
 
 from hestia.service_interface import Service
 
 
 class EventService(Service):
-    __all__ = ('record',)
+    __all__ = ('record', 'record_events')
 
     event_manager = None
 
@@ -51,3 +51,26 @@ class EventService(Service):
         >>> record_event(Event())
         """
         pass
+
+    def record_events(self, events_data: Iterable[Mapping]) -> List['Event']:
+        """ Validate and record a batch of serialized events.
+
+        >>> record_events([event_data1, event_data2])
+        """
+        if not self.is_setup:
+            return []
+
+        events = [self.get_event(event_type=event_data['type'], event_data=event_data)
+                  for event_data in events_data
+                  if self.can_handle(event_type=event_data['type'])]
+        if events:
+            self.record_batch(events)
+        return events
+
+    def record_batch(self, events: List['Event']) -> None:
+        """ Record a batch of events, services can override it to persist the batch at once.
+
+        >>> record_batch([Event(), Event()])
+        """
+        for event in events:
+            self.record_event(event)
@@ -28,6 +28,7 @@ EXPERIMENT_GROUP_NEW_STATUS = '{}.{}'.format(event_subjects.EXPERIMENT_GROUP,
 EXPERIMENT_GROUP_EXPERIMENTS_VIEWED = '{}.{}'.format(event_subjects.EXPERIMENT_GROUP,
                                                      event_actions.EXPERIMENTS_VIEWED)
 EXPERIMENT_GROUP_ITERATION = '{}.new_iteration'.format(event_subjects.EXPERIMENT_GROUP)
+EXPERIMENT_GROUP_EXPERIMENTS_CREATED = '{}.new_experiments'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_RANDOM = '{}.random'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_GRID = '{}.grid'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_HYPERBAND = '{}.hyperband'.format(event_subjects.EXPERIMENT_GROUP)
@@ -264,6 +265,22 @@ class ExperimentGroupIterationEvent(Event):
     )
 
 
+class ExperimentGroupExperimentsCreatedEvent(Event):
+    event_type = EXPERIMENT_GROUP_EXPERIMENTS_CREATED
+    attributes = (
+        Attribute('id'),
+        Attribute('project.id'),
+        Attribute('project.user.id'),
+        Attribute('user.id'),
+        Attribute('updated_at', is_datetime=True),
+        Attribute('concurrency', is_required=False),
+        Attribute('search_algorithm', is_required=False),
+        Attribute('has_description', attr_type=bool),
+        Attribute('last_status'),
+        Attribute('num_experiments', attr_type=int),
+    )
+
+
 class ExperimentGroupExperimentsViewedEvent(Event):
     event_type = EXPERIMENT_GROUP_EXPERIMENTS_VIEWED
     actor = True
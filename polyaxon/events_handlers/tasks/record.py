@@ -1,4 +1,4 @@
-from django.db import IntegrityError
+from typing import Dict, List, Optional
 
 import auditor
 
@@ -6,19 +6,28 @@ from polyaxon.celery_api import celery_app
 from polyaxon.settings import EventsCeleryTasks
 
 
+def get_events(events: Optional[List[Dict]], event: Optional[Dict]) -> List[Dict]:
+    # Tasks queued before the upgrade still send a single `event`
+    if event is not None:
+        return [event]
+    return events
+
+
 @celery_app.task(name=EventsCeleryTasks.EVENTS_NOTIFY, ignore_result=True)
-def events_notify(event: 'Event') -> None:
-    auditor.notify(event)
+def events_notify(events: List[Dict] = None, event: Dict = None) -> None:
+    auditor.notify(get_events(events=events, event=event))
 
 
-@celery_app.task(name=EventsCeleryTasks.EVENTS_LOG,
-                 autoretry_for=(IntegrityError,),
-                 max_retries=3,
-                 ignore_result=True)
-def events_log(event: 'Event') -> None:
-    auditor.log(event)
+@celery_app.task(name=EventsCeleryTasks.EVENTS_LOG, ignore_result=True)
+def events_log(events: List[Dict] = None, event: Dict = None) -> None:
+    auditor.log(get_events(events=events, event=event))
 
 
 @celery_app.task(name=EventsCeleryTasks.EVENTS_TRACK, ignore_result=True)
-def events_track(event: 'Event') -> None:
-    auditor.track(event)
+def events_track(events: List[Dict] = None, event: Dict = None) -> None:
+    auditor.track(get_events(events=events, event=event))
+
+
+@celery_app.task(name=EventsCeleryTasks.EVENTS_FLUSH_BUFFER, ignore_result=True)
+def events_flush_buffer() -> None:
+    auditor.flush()
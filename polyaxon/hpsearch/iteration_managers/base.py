@@ -54,6 +54,13 @@ class BaseIterationManager(object):
         iteration_config.num_suggestions = num_suggestions
         self._update_config(iteration_config)
 
+    def update_iteration_cursor(self, cursor):
+        """Update iteration's cursor, i.e. the position of the next suggestion to create."""
+        iteration_config = self.experiment_group.iteration_config
+
+        iteration_config.cursor = cursor
+        self._update_config(iteration_config)
+
     def add_iteration_experiments(self, experiment_ids):
         iteration = self.experiment_group.iteration
         if not iteration:
@@ -6,7 +6,7 @@ class BOIterationManager(BaseIterationManager):
     def get_metric_name(self):
         return self.experiment_group.hptuning_config.bo.metric.name
 
-    def create_iteration(self, num_suggestions):
+    def create_iteration(self, num_suggestions, kernel_theta=None):
         """Create an iteration for the experiment group."""
         from db.models.experiment_groups import ExperimentGroupIteration
 
@@ -32,6 +32,7 @@ class BOIterationManager(BaseIterationManager):
             old_experiments_metrics=old_experiments_metrics,
             experiment_ids=[],
             experiments_configs=[],
+            kernel_theta=kernel_theta,
         )
         return ExperimentGroupIteration.objects.create(
             experiment_group=self.experiment_group,
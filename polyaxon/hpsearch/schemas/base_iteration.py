@@ -7,6 +7,7 @@ class BaseIterationSchema(BaseSchema):
     iteration = fields.Int()
     num_suggestions = fields.Int()
     experiment_ids = fields.List(fields.Int(), allow_none=True)
+    cursor = fields.Int(allow_none=True)
 
     @staticmethod
     def schema_config():
@@ -16,7 +17,9 @@ class BaseIterationSchema(BaseSchema):
 class BaseIterationConfig(BaseConfig):
     SCHEMA = BaseIterationSchema
 
-    def __init__(self, iteration, num_suggestions, experiment_ids=None):
+    def __init__(self, iteration, num_suggestions, experiment_ids=None, cursor=None):
         self.iteration = iteration
         self.num_suggestions = num_suggestions
         self.experiment_ids = experiment_ids
+        # Position of the next suggestion to create, for searches creating suggestions lazily
+        self.cursor = cursor
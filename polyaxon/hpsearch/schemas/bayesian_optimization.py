@@ -17,6 +17,7 @@ class BOIterationSchema(BaseIterationSchema):
     experiments_metrics = fields.List(
         fields.List(fields.Raw(), validate=validate.Length(equal=2)),
         allow_none=True)
+    kernel_theta = fields.List(fields.Float(), allow_none=True)
 
     @post_load
     def make(self, data):
@@ -38,15 +39,20 @@ class BOIterationConfig(BaseIterationConfig):
                  old_experiments_configs=None,
                  experiment_ids=None,
                  experiments_metrics=None,
-                 experiments_configs=None):
+                 experiments_configs=None,
+                 kernel_theta=None,
+                 cursor=None):
         super().__init__(iteration=iteration,
                          num_suggestions=num_suggestions,
-                         experiment_ids=experiment_ids)
+                         experiment_ids=experiment_ids,
+                         cursor=cursor)
         self.old_experiment_ids = old_experiment_ids
         self.old_experiments_metrics = old_experiments_metrics
         self.old_experiments_configs = old_experiments_configs
         self.experiments_configs = experiments_configs
         self.experiments_metrics = experiments_metrics
+        # The gaussian process' fitted hyperparameters, to warm start the next iteration
+        self.kernel_theta = kernel_theta
 
     @property
     def combined_experiment_ids(self):
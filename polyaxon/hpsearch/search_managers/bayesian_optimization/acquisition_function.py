@@ -2,6 +2,7 @@ import numpy as np
 
 from scipy.optimize import minimize
 from scipy.stats import norm
+from sklearn.externals.joblib import Parallel, delayed
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import RBF, Matern
 
@@ -14,9 +15,33 @@ from schemas.hptuning import (
 )
 
 
+def _minimize_batch(utility_function, x_seeds, y_max, bounds):
+    """Runs L-BFGS-B from all the seeds at once.
+
+    The seeds are optimized jointly as a single flat vector, since the objective is
+    the sum of independent terms, each iteration evaluates the acquisition function
+    and its gradient on the whole batch with a single `predict`.
+    """
+    n_seeds, dim = x_seeds.shape
+
+    def objective(x):
+        values, gradients = utility_function.compute_with_gradient(x.reshape(n_seeds, dim),
+                                                                    y_max=y_max)
+        return -values.sum(), -gradients.ravel()
+
+    res = minimize(objective,
+                   x_seeds.ravel(),
+                   jac=True,
+                   bounds=np.tile(bounds, (n_seeds, 1)),
+                   method="L-BFGS-B")
+    x_tries = np.clip(res.x.reshape(n_seeds, dim), bounds[:, 0], bounds[:, 1])
+    return x_tries, utility_function.compute(x_tries, y_max=y_max)
+
+
 class UtilityFunction(object):
+    GRADIENT_STEP = 1e-6
 
-    def __init__(self, config, seed=None):
+    def __init__(self, config, seed=None, kernel_theta=None):
         if not isinstance(config, UtilityFunctionConfig):
             raise ValueError('Received a non valid configuration.')
 
@@ -26,10 +51,11 @@ class UtilityFunction(object):
         self.acquisition_function = config.acquisition_function
         self.random_generator = get_random_generator(seed=seed)
         self.gaussian_process = self.get_gaussian_process(config=config.gaussian_process,
-                                                          random_generator=self.random_generator)
+                                                          random_generator=self.random_generator,
+                                                          kernel_theta=kernel_theta)
 
     @staticmethod
-    def get_gaussian_process(config, random_generator):
+    def get_gaussian_process(config, random_generator, kernel_theta=None):
         if not isinstance(config, GaussianProcessConfig):
             raise ValueError('Received a non valid configuration.')
 
@@ -39,6 +65,10 @@ class UtilityFunction(object):
             kernel = Matern(length_scale=config.length_scale,
                             nu=config.nu)
 
+        if kernel_theta is not None:
+            # Warm start the hyperparameters' optimization from a previous fit
+            kernel = kernel.clone_with_theta(np.asarray(kernel_theta))
+
         return GaussianProcessRegressor(
             kernel=kernel,
             n_restarts_optimizer=config.n_restarts_optimizer,
@@ -67,19 +97,39 @@ class UtilityFunction(object):
         if AcquisitionFunctions.is_poi(self.acquisition_function):
             return self._compute_poi(x=x, y_max=y_max)
 
-    def max_compute(self, y_max, bounds, n_warmup=100000, n_iter=250):
+    @property
+    def kernel_theta(self):
+        """The fitted kernel's hyperparameters (log-transformed), used for warm starts."""
+        kernel = getattr(self.gaussian_process, 'kernel_', None)
+        return kernel.theta.tolist() if kernel is not None else None
+
+    def compute_with_gradient(self, x, y_max):
+        """Returns the values and the (forward differences) gradients for a batch of points.
+
+        All the shifted points are evaluated with a single call to the gaussian process.
+        """
+        n_points, dim = x.shape
+        shifted = x[np.newaxis, :, :] + self.GRADIENT_STEP * np.eye(dim)[:, np.newaxis, :]
+        ys = self.compute(np.vstack([x, shifted.reshape(-1, dim)]), y_max=y_max)
+        values = ys[:n_points]
+        gradients = (ys[n_points:].reshape(dim, n_points).T - values[:, np.newaxis])
+        return values, gradients / self.GRADIENT_STEP
+
+    def max_compute(self, y_max, bounds, n_warmup=100000, n_iter=250, n_jobs=1):
         """A function to find the maximum of the acquisition function
 
         It uses a combination of random sampling (cheap) and the 'L-BFGS-B' optimization method.
 
         First by sampling `n_warmup` (1e5) points at random,
-        and then running L-BFGS-B from `n_iter` (250) random starting points.
+        and then running L-BFGS-B from `n_iter` (250) random starting points,
+        the starting points are optimized in batches, split over `n_jobs` processes.
 
         Params:
             y_max: The current maximum known value of the target function.
             bounds: The variables bounds to limit the search of the acq max.
             n_warmup: The number of times to randomly sample the acquisition function
-            n_iter: The number of times to run scipy.minimize
+            n_iter: The number of starting points for scipy.minimize
+            n_jobs: The number of processes to run the L-BFGS-B batches.
 
         Returns
             x_max: The arg max of the acquisition function.
@@ -94,21 +144,18 @@ class UtilityFunction(object):
         # Explore the parameter space more throughly
         x_seeds = self.random_generator.uniform(bounds[:, 0], bounds[:, 1],
                                                 size=(n_iter, bounds.shape[0]))
-        for x_try in x_seeds:
-            # Find the minimum of minus the acquisition function
-            res = minimize(lambda x: -self.compute(x.reshape(1, -1), y_max=y_max),
-                           x_try.reshape(1, -1),
-                           bounds=bounds,
-                           method="L-BFGS-B")
-
-            # See if success
-            if not res.success:
-                continue
-
-            # Store it if better than previous minimum(maximum).
-            if max_acq is None or -res.fun[0] >= max_acq:
-                x_max = res.x
-                max_acq = -res.fun[0]
+        batches = [batch for batch in np.array_split(x_seeds, max(n_jobs, 1)) if len(batch)]
+        if len(batches) > 1:
+            results = Parallel(n_jobs=len(batches))(
+                delayed(_minimize_batch)(self, batch, y_max, bounds) for batch in batches)
+        else:
+            results = [_minimize_batch(self, x_seeds, y_max, bounds)]
+
+        # Store it if better than previous minimum(maximum).
+        for x_tries, ys in results:
+            if ys.max() >= max_acq:
+                x_max = x_tries[ys.argmax()]
+                max_acq = ys.max()
 
         # Clip output to make sure it lies within the bounds. Due to floating
         # point technicalities this is not always the case.
@@ -1,3 +1,5 @@
+import conf
+
 from hpsearch.search_managers.base import BaseSearchAlgorithmManager
 from hpsearch.search_managers.bayesian_optimization.optimizer import BOOptimizer
 from hpsearch.search_managers.utils import get_random_suggestions
@@ -13,6 +15,8 @@ class BOSearchManager(BaseSearchAlgorithmManager):
         super().__init__(hptuning_config=hptuning_config)
         self.n_initial_trials = self.hptuning_config.bo.n_initial_trials
         self.n_iterations = self.hptuning_config.bo.n_iterations
+        # The fitted hyperparameters of the last optimizer, to warm start the next iteration
+        self.kernel_theta = None
 
     def get_suggestions(self, iteration_config=None):
         if not iteration_config:
@@ -31,10 +35,15 @@ class BOSearchManager(BaseSearchAlgorithmManager):
 
         if not configs or not metrics:
             return None
-        optimizer = BOOptimizer(hptuning_config=self.hptuning_config)
+        optimizer = BOOptimizer(hptuning_config=self.hptuning_config,
+                                kernel_theta=iteration_config.kernel_theta,
+                                n_jobs=conf.get('HP_BO_N_JOBS'))
         optimizer.add_observations(configs=configs, metrics=metrics)
-        suggestion = optimizer.get_suggestion()
-        return [suggestion] if suggestion else None
+        # Fill all the concurrency slots with one iteration
+        suggestions = optimizer.get_suggestions(
+            n_suggestions=self.hptuning_config.concurrency or 1)
+        self.kernel_theta = optimizer.kernel_theta
+        return suggestions or None
 
     def should_reschedule(self, iteration):
         """Return a boolean to indicate if we need to reschedule another iteration."""
@@ -1,28 +1,40 @@
+import numpy as np
+
 from hpsearch.search_managers.bayesian_optimization.acquisition_function import UtilityFunction
 from hpsearch.search_managers.bayesian_optimization.space import SearchSpace
 
 
 class BOOptimizer(object):
 
-    def __init__(self, hptuning_config):
+    def __init__(self, hptuning_config, kernel_theta=None, n_jobs=1):
         self.hptuning_config = hptuning_config
         self.n_initial_trials = self.hptuning_config.bo.n_initial_trials
         self.space = SearchSpace(hptuning_config=hptuning_config)
         self.utility_function = UtilityFunction(
-            config=hptuning_config.bo.utility_function, seed=hptuning_config.seed)
+            config=hptuning_config.bo.utility_function,
+            seed=hptuning_config.seed,
+            kernel_theta=kernel_theta)
         self.n_warmup = hptuning_config.bo.utility_function.n_warmup or 5
         self.n_iter = hptuning_config.bo.utility_function.n_iter or 10
+        self.n_jobs = n_jobs
+
+    @property
+    def kernel_theta(self):
+        return self.utility_function.kernel_theta
 
-    def _maximize(self):
+    def _maximize(self, x=None, y=None):
         """ Find argmax of the acquisition function."""
         if not self.space.is_observations_valid():
             return None
-        y_max = self.space.y.max()
-        self.utility_function.gaussian_process.fit(self.space.x, self.space.y)
+        x = self.space.x if x is None else x
+        y = self.space.y if y is None else y
+        y_max = y.max()
+        self.utility_function.gaussian_process.fit(x, y)
         return self.utility_function.max_compute(y_max=y_max,
                                                  bounds=self.space.bounds,
                                                  n_warmup=self.n_warmup,
-                                                 n_iter=self.n_iter)
+                                                 n_iter=self.n_iter,
+                                                 n_jobs=self.n_jobs)
 
     def add_observations(self, configs, metrics):
         # Turn configs and metrics into data points
@@ -31,3 +43,37 @@ class BOOptimizer(object):
     def get_suggestion(self):
         x = self._maximize()
         return self.space.get_suggestion(x)
+
+    def get_suggestions(self, n_suggestions):
+        """Returns a batch of suggestions using the constant liar strategy.
+
+        After every suggestion, a fake observation with the current minimum value
+        is added at the suggested point, so that the next suggestion explores elsewhere.
+        The gaussian process' hyperparameters are only optimized for the first suggestion,
+        and suggestions that map to an already suggested config are dropped.
+        """
+        if n_suggestions <= 1:
+            suggestion = self.get_suggestion()
+            return [suggestion] if suggestion else []
+
+        x_max = self._maximize()
+        if x_max is None:
+            return []
+        x, y = self.space.x, self.space.y
+        y_lie = y.min()
+        suggestions = [self.space.get_suggestion(x_max)]
+        gaussian_process = self.utility_function.gaussian_process
+        optimizer = gaussian_process.optimizer
+        gaussian_process.kernel = gaussian_process.kernel_
+        gaussian_process.optimizer = None
+        try:
+            for _ in range(n_suggestions - 1):
+                x = np.vstack([x, x_max])
+                y = np.append(y, y_lie)
+                x_max = self._maximize(x=x, y=y)
+                suggestion = self.space.get_suggestion(x_max)
+                if suggestion not in suggestions:
+                    suggestions.append(suggestion)
+        finally:
+            gaussian_process.optimizer = optimizer
+        return suggestions
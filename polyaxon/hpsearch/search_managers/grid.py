@@ -1,14 +1,62 @@
-import itertools
+import functools
+import operator
 
+from hpsearch.exceptions import ExperimentGroupException
 from hpsearch.search_managers.base import BaseSearchAlgorithmManager
 from schemas.hptuning import SearchAlgorithms
 
 
 class GridSearchManager(BaseSearchAlgorithmManager):
-    """Grid search algorithm manager for hyperparameter optimization."""
+    """Grid search algorithm manager for hyperparameter optimization.
+
+    Suggestions are generated lazily, the grid is never materialized:
+    the suggestion at a given position is decoded directly from the matrix values.
+    """
 
     NAME = SearchAlgorithms.GRID
 
+    def _get_grid(self):
+        matrix = self.hptuning_config.matrix or {}
+        distributions = sorted(key for key, value in matrix.items() if value.is_distribution)
+        if distributions:
+            raise ExperimentGroupException(
+                '`{}` define distributions, grid search requires discrete values.'.format(
+                    '`, `'.join(distributions)))
+        keys = list(matrix.keys())
+        values = [v.to_numpy() for v in matrix.values()]
+        return keys, values
+
+    def _get_grid_size(self, values):
+        size = functools.reduce(operator.mul, [len(v) for v in values], 1) if values else 0
+        if self.hptuning_config.grid_search:
+            n_suggestions = self.hptuning_config.grid_search.n_experiments
+            if n_suggestions:
+                return min(size, n_suggestions)
+        return size
+
+    @staticmethod
+    def _get_suggestion(keys, values, index):
+        """Returns the suggestion at the index, following the `itertools.product` order."""
+        suggestion = {}
+        for key, key_values in zip(reversed(keys), reversed(values)):
+            index, value_index = divmod(index, len(key_values))
+            suggestion[key] = key_values[value_index]
+        return {key: suggestion[key] for key in keys}
+
+    def get_grid_size(self):
+        """Return the number of suggestions of the grid search.
+
+        Raises `ExperimentGroupException` if the matrix is not a grid, i.e. defines distributions.
+        """
+        _, values = self._get_grid()
+        return self._get_grid_size(values)
+
+    def iter_suggestions(self, offset=0):
+        """Return an iterator over the grid search suggestions starting from the offset."""
+        keys, values = self._get_grid()
+        for index in range(offset, self._get_grid_size(values)):
+            yield self._get_suggestion(keys=keys, values=values, index=index)
+
     def get_suggestions(self, iteration_config=None):
         """Return a list of suggestions based on grid search.
 
@@ -16,16 +64,4 @@ class GridSearchManager(BaseSearchAlgorithmManager):
             matrix: `dict` representing the {hyperparam: hyperparam matrix config}.
             n_suggestions: number of suggestions to make.
         """
-        matrix = self.hptuning_config.matrix
-
-        suggestions = []
-        keys = list(matrix.keys())
-        values = [v.to_numpy() for v in matrix.values()]
-        for v in itertools.product(*values):
-            suggestions.append(dict(zip(keys, v)))
-
-        if self.hptuning_config.grid_search:
-            n_suggestions = self.hptuning_config.grid_search.n_experiments
-            if n_suggestions:
-                return suggestions[:n_suggestions]
-        return suggestions
+        return list(self.iter_suggestions())
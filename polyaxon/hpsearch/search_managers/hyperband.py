@@ -112,8 +112,11 @@ class HyperbandSearchManager(BaseSearchAlgorithmManager):
         n_resources = self.get_resources(bracket=bracket)
         return self.get_n_resources(n_resources=n_resources, bracket_iteration=bracket_iteration)
 
-    def get_suggestions(self, iteration_config=None):
-        """Return a list of suggestions/arms based on hyperband."""
+    def get_suggestions(self, iteration_config=None, issued_hashes=None):
+        """Return a list of suggestions/arms based on hyperband.
+
+        The configs issued by previous brackets (`issued_hashes`) are not suggested again.
+        """
         if not iteration_config or not isinstance(iteration_config, HyperbandIterationConfig):
             raise ValueError('Hyperband get suggestions requires an iteration.')
         bracket = self.get_bracket(iteration=iteration_config.iteration)
@@ -128,7 +131,8 @@ class HyperbandSearchManager(BaseSearchAlgorithmManager):
         return get_random_suggestions(matrix=self.hptuning_config.matrix,
                                       n_suggestions=n_configs,
                                       suggestion_params=suggestion_params,
-                                      seed=self.hptuning_config.seed)
+                                      seed=self.hptuning_config.seed,
+                                      issued_hashes=issued_hashes)
 
     def should_reschedule(self, iteration, bracket_iteration):
         """Return a boolean to indicate if we need to reschedule another iteration."""
@@ -8,14 +8,18 @@ class RandomSearchManager(BaseSearchAlgorithmManager):
 
     NAME = SearchAlgorithms.RANDOM
 
-    def get_suggestions(self, iteration_config=None):
+    def get_suggestions(self, iteration_config=None, issued_hashes=None):
         """Return a list of suggestions based on random search.
 
         Params:
             matrix: `dict` representing the {hyperparam: hyperparam matrix config}.
             n_suggestions: number of suggestions to make.
+            issued_hashes: hashes of the suggestions issued previously, never suggested again.
         """
         matrix = self.hptuning_config.matrix
         n_suggestions = self.hptuning_config.random_search.n_experiments
         seed = self.hptuning_config.seed
-        return get_random_suggestions(matrix=matrix, n_suggestions=n_suggestions, seed=seed)
+        return get_random_suggestions(matrix=matrix,
+                                      n_suggestions=n_suggestions,
+                                      seed=seed,
+                                      issued_hashes=issued_hashes)
@@ -1,48 +1,51 @@
-import copy
+import hashlib
 import numpy as np
-import uuid
 
 from functools import reduce
 from operator import mul
 
 
-class Suggestion(object):
-    """A structure that defines an experiment hyperparam suggestion."""
-
-    def __init__(self, params):
-        self.params = params
+def get_random_generator(seed=None):
+    return np.random.RandomState(seed) if seed else np.random
 
-    def __eq__(self, other):
-        if self.params.keys() != other.params.keys():
-            return False
 
-        for key, value in self.params.items():
-            if value != other.params[key]:
-                return False
+def get_suggestion_hash(params, keys=None):
+    """Returns a stable hash of the suggestion's params, optionally restricted to some keys."""
+    keys = sorted(keys or params.keys())
+    value = ','.join(['{}:{}'.format(key, params[key]) for key in keys])
+    return hashlib.md5(value.encode('utf-8')).hexdigest()
 
-        return True
 
-    def __repr__(self):
-        return ','.join([
-            '{}:{}'.format(key, val)
-            for (key, val) in sorted(self.params.items())])
+def sample_values(matrix_config, size, rand_generator):
+    """Returns `size` independent samples of a matrix param.
 
-    def __hash__(self):
-        return hash(self.__repr__())
+    The params are sampled in a single batch when possible, params whose values are lists
+    can only be sampled one value at a time.
+    """
+    values = matrix_config.sample(size=size, rand_generator=rand_generator)
+    if isinstance(values, np.ndarray) and values.ndim == 1 and len(values) == size:
+        return values
+    values = [values]
+    for _ in range(size - 1):
+        values.append(matrix_config.sample(rand_generator=rand_generator))
+    return values
 
-    def uuid(self):
-        return uuid.uuid5(uuid.NAMESPACE_DNS, self.__repr__())
 
+def get_random_suggestions(matrix,
+                           n_suggestions,
+                           suggestion_params=None,
+                           seed=None,
+                           issued_hashes=None):
+    """Samples unique suggestions from the matrix.
 
-def get_random_generator(seed=None):
-    return np.random.RandomState(seed) if seed else np.random
-
-
-def get_random_suggestions(matrix, n_suggestions, suggestion_params=None, seed=None):
+    The matrix params are sampled in batches, and suggestions are deduplicated by their hash.
+    `issued_hashes` are the hashes of the suggestions (restricted to the matrix keys)
+    issued previously, these are never suggested again.
+    """
     if not n_suggestions:
         raise ValueError('This search algorithm requires `n_experiments`.')
-    suggestions = []
     suggestion_params = suggestion_params or {}
+    issued_hashes = set(issued_hashes or [])
     rand_generator = get_random_generator(seed=seed)
     # Validate number of suggestions and total space
     all_discrete = True
@@ -52,13 +55,24 @@ def get_random_suggestions(matrix, n_suggestions, suggestion_params=None, seed=N
             break
     if all_discrete:
         space = reduce(mul, [v.length for v in matrix.values()])
+        space = max(space - len(issued_hashes), 0)
         n_suggestions = n_suggestions if n_suggestions <= space else space
 
-    while n_suggestions > 0:
-        params = copy.deepcopy(suggestion_params)
-        params.update({k: v.sample(rand_generator=rand_generator) for k, v in matrix.items()})
-        suggestion = Suggestion(params=params)
-        if suggestion not in suggestions:
-            suggestions.append(suggestion)
-            n_suggestions -= 1
-    return [suggestion.params for suggestion in suggestions]
+    keys = list(matrix.keys())
+    suggestions = []
+    while len(suggestions) < n_suggestions:
+        batch_size = n_suggestions - len(suggestions)
+        samples = [sample_values(matrix[key], size=batch_size, rand_generator=rand_generator)
+                   for key in keys]
+        for values in zip(*samples):
+            sample = dict(zip(keys, values))
+            suggestion_hash = get_suggestion_hash(sample)
+            if suggestion_hash in issued_hashes:
+                continue
+            issued_hashes.add(suggestion_hash)
+            params = dict(suggestion_params)
+            params.update(sample)
+            suggestions.append(params)
+            if len(suggestions) == n_suggestions:
+                break
+    return suggestions
@@ -3,15 +3,25 @@ import traceback
 from hestia.np_utils import sanitize_np_types
 from rest_framework.exceptions import ValidationError
 
+from django.db import models, transaction
+
+import auditor
 import conf
 
 from constants.experiment_groups import ExperimentGroupLifeCycle
-from db.models.experiments import Experiment
+from constants.experiments import ExperimentLifeCycle
+from db.models.experiment_groups import ExperimentGroup
+from db.models.experiments import Experiment, ExperimentStatus
 from db.redis.group_check import GroupChecks
+from event_manager.events.experiment_group import EXPERIMENT_GROUP_EXPERIMENTS_CREATED
 from hpsearch.exceptions import ExperimentGroupException
+from hpsearch.search_managers.utils import get_suggestion_hash
 from hpsearch.tasks.logger import logger
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import SchedulerCeleryTasks
+from signals.outputs import set_outputs, set_outputs_refs
+from signals.persistence import set_persistence
+from signals.tags import set_tags
 
 
 def get_suggestions(experiment_group):
@@ -25,33 +35,84 @@ def get_suggestions(experiment_group):
                      extra={'stack': True})
         return
 
+    return sanitize_suggestions(suggestions)
+
+
+def sanitize_suggestions(suggestions):
     # We sanitize numpy types to be able to jsonify and split the scheduling of different tasks
     return [{k: sanitize_np_types(v) for k, v in suggestion.items()} for suggestion in suggestions]
 
 
+def get_group_experiment(experiment_group, specification, suggestion):
+    """Returns an unsaved experiment for the suggestion.
+
+    This does the work of the experiment's `pre_save` signal,
+    since the group experiments are bulk created without signals.
+    """
+    experiment_spec = specification.get_experiment_spec(matrix_declaration=suggestion)
+    experiment = Experiment(
+        project_id=experiment_group.project_id,
+        user_id=experiment_group.user_id,
+        experiment_group=experiment_group,
+        config=experiment_spec.parsed_data,
+        declarations=experiment_spec.declarations,
+        suggestion_hash=get_suggestion_hash(
+            params=suggestion,
+            keys=list(experiment_group.hptuning_config.matrix.keys())),
+        code_reference_id=experiment_group.code_reference_id)
+    # Avoid parsing the config again
+    experiment.specification = experiment_spec
+    set_tags(instance=experiment)
+    set_persistence(instance=experiment)
+    set_outputs(instance=experiment)
+    set_outputs_refs(instance=experiment)
+    return experiment
+
+
 def create_group_experiments(experiment_group, suggestions):
+    """Bulk creates the experiments of the suggestions and their initial statuses.
+
+    The experiments are created in a single transaction,
+    and one event is recorded for all of them.
+    """
     # Parse polyaxonfile content and create the experiments
     specification = experiment_group.specification
 
-    experiments = []
-    for suggestion in suggestions:
-        # We need to check if we should create or restart
-        try:
-            experiment = Experiment.objects.create(
-                project_id=experiment_group.project_id,
-                user_id=experiment_group.user_id,
-                experiment_group=experiment_group,
-                config=specification.get_experiment_spec(matrix_declaration=suggestion).parsed_data,
-                code_reference_id=experiment_group.code_reference_id)
-        except ValidationError:
-            experiment_group.set_status(
-                ExperimentGroupLifeCycle.FAILED,
-                message='Experiment group could not create experiments, '
-                        'encountered a validation error.',
-                traceback=traceback.format_exc())
-            raise ExperimentGroupException()
-        experiments.append(experiment)
-
+    try:
+        experiments = [get_group_experiment(experiment_group=experiment_group,
+                                            specification=specification,
+                                            suggestion=suggestion)
+                       for suggestion in suggestions]
+    except ValidationError:
+        experiment_group.set_status(
+            ExperimentGroupLifeCycle.FAILED,
+            message='Experiment group could not create experiments, '
+                    'encountered a validation error.',
+            traceback=traceback.format_exc())
+        raise ExperimentGroupException()
+
+    if not experiments:
+        return experiments
+
+    with transaction.atomic():
+        experiments = Experiment.objects.bulk_create(experiments)
+        statuses = ExperimentStatus.objects.bulk_create([
+            ExperimentStatus(experiment=experiment, status=ExperimentLifeCycle.CREATED)
+            for experiment in experiments
+        ])
+        Experiment.objects.filter(id__in=[experiment.id for experiment in experiments]).update(
+            status=models.Case(*[models.When(id=status.experiment_id, then=status.id)
+                                 for status in statuses],
+                               output_field=models.IntegerField()))
+        ExperimentGroup.update_experiments_counts(group_id=experiment_group.id,
+                                                  status_to=ExperimentLifeCycle.CREATED,
+                                                  count=len(experiments))
+    for experiment, status in zip(experiments, statuses):
+        experiment.status = status
+
+    auditor.record(event_type=EXPERIMENT_GROUP_EXPERIMENTS_CREATED,
+                   instance=experiment_group,
+                   num_experiments=len(experiments))
     return experiments
 
 
@@ -67,13 +128,14 @@ def start_group_experiments(experiment_group):
         return
 
     experiment_to_start = experiment_group.n_experiments_to_start
+    n_pending_experiment = experiment_group.count_experiments(
+        statuses=ExperimentLifeCycle.PENDING_STATUS)
     if experiment_to_start <= 0:
         # This could happen due to concurrency or not created yet experiments
-        return (experiment_group.pending_experiments.exists() or
+        return (n_pending_experiment > 0 or
                 not experiment_group.scheduled_all_suggestions())
     pending_experiments = experiment_group.pending_experiments.values_list(
         'id', flat=True)[:experiment_to_start]
-    n_pending_experiment = experiment_group.pending_experiments.count()
 
     for experiment in pending_experiments:
         celery_app.send_task(
@@ -18,7 +18,9 @@ def create(experiment_group):
                                     message='Experiment group could not create new suggestions.')
         return
 
-    experiment_group.iteration_manager.create_iteration(num_suggestions=len(suggestions))
+    experiment_group.iteration_manager.create_iteration(
+        num_suggestions=len(suggestions),
+        kernel_theta=experiment_group.search_manager.kernel_theta)
 
     def send_chunk():
         celery_app.send_task(
@@ -1,7 +1,12 @@
+import itertools
+
+from django.db import transaction
+
 import conf
 
 from constants.experiment_groups import ExperimentGroupLifeCycle
 from db.getters.experiment_groups import get_running_experiment_group
+from db.models.experiment_groups import ExperimentGroup
 from hpsearch.exceptions import ExperimentGroupException
 from hpsearch.tasks import base
 from hpsearch.tasks.logger import logger
@@ -10,32 +15,28 @@ from polyaxon.settings import HPCeleryTasks, Intervals
 
 
 def create(experiment_group):
-    suggestions = base.get_suggestions(experiment_group=experiment_group)
-    if not suggestions:
+    try:
+        num_suggestions = experiment_group.search_manager.get_grid_size()
+    except ExperimentGroupException as e:
+        logger.error('Experiment group `%s` has an invalid grid: %s', experiment_group.id, e)
+        experiment_group.set_status(ExperimentGroupLifeCycle.FAILED,
+                                    message='Experiment group has an invalid grid: {}'.format(e))
+        return
+
+    if not num_suggestions:
         logger.error('Experiment group `%s` could not create any suggestion.',
                      experiment_group.id)
         experiment_group.set_status(ExperimentGroupLifeCycle.FAILED,
                                     message='Experiment group could not create new suggestions.')
         return
 
-    experiment_group.iteration_manager.create_iteration(num_suggestions=len(suggestions))
-
-    def send_chunk():
-        celery_app.send_task(
-            HPCeleryTasks.HP_GRID_SEARCH_CREATE_EXPERIMENTS,
-            kwargs={'experiment_group_id': experiment_group.id,
-                    'suggestions': chunk_suggestions},
-            countdown=1)
-
-    chunk_suggestions = []
-    for suggestion in suggestions:
-        chunk_suggestions.append(suggestion)
-        if len(chunk_suggestions) == conf.get('GROUP_CHUNKS'):
-            send_chunk()
-            chunk_suggestions = []
+    experiment_group.iteration_manager.create_iteration(num_suggestions=num_suggestions)
 
-    if chunk_suggestions:
-        send_chunk()
+    # The suggestions are created chunk by chunk, every chunk schedules the next one
+    celery_app.send_task(
+        HPCeleryTasks.HP_GRID_SEARCH_CREATE_EXPERIMENTS,
+        kwargs={'experiment_group_id': experiment_group.id},
+        countdown=1)
 
     celery_app.send_task(
         HPCeleryTasks.HP_GRID_SEARCH_START,
@@ -44,19 +45,43 @@ def create(experiment_group):
 
 
 @celery_app.task(name=HPCeleryTasks.HP_GRID_SEARCH_CREATE_EXPERIMENTS, ignore_result=True)
-def hp_grid_search_create_experiments(experiment_group_id, suggestions):
+def hp_grid_search_create_experiments(experiment_group_id):
     experiment_group = get_running_experiment_group(experiment_group_id=experiment_group_id)
     if not experiment_group:
         return
 
-    try:
-        experiments = base.create_group_experiments(experiment_group=experiment_group,
-                                                    suggestions=suggestions)
-    except ExperimentGroupException:  # The experiments will be stopped
-        return
-
-    experiment_group.iteration_manager.add_iteration_experiments(
-        experiment_ids=[xp.id for xp in experiments])
+    with transaction.atomic():
+        # The group is locked and the cursor is persisted with the experiments,
+        # so that a chunk is never created twice
+        ExperimentGroup.objects.select_for_update().filter(
+            id=experiment_group.id).values_list('id', flat=True).first()
+        iteration_config = experiment_group.iteration_config
+        if not iteration_config:
+            return
+
+        cursor = iteration_config.cursor or 0
+        suggestions = base.sanitize_suggestions(itertools.islice(
+            experiment_group.search_manager.iter_suggestions(offset=cursor),
+            conf.get('GROUP_CHUNKS')))
+        if not suggestions:
+            return
+
+        try:
+            experiments = base.create_group_experiments(experiment_group=experiment_group,
+                                                        suggestions=suggestions)
+        except ExperimentGroupException:  # The experiments will be stopped
+            return
+
+        experiment_group.iteration_manager.add_iteration_experiments(
+            experiment_ids=[xp.id for xp in experiments])
+        cursor += len(suggestions)
+        experiment_group.iteration_manager.update_iteration_cursor(cursor=cursor)
+
+    if cursor < iteration_config.num_suggestions:
+        celery_app.send_task(
+            HPCeleryTasks.HP_GRID_SEARCH_CREATE_EXPERIMENTS,
+            kwargs={'experiment_group_id': experiment_group.id},
+            countdown=1)
 
     celery_app.send_task(
         HPCeleryTasks.HP_GRID_SEARCH_START,
@@ -1,4 +1,6 @@
-from typing import Any, Dict
+import uuid
+
+from typing import Any, Callable, Dict, List
 
 from django.db import IntegrityError
 
@@ -23,6 +25,61 @@ def set_node_scheduling(job: Any, node_name: str) -> None:
     job.save(update_fields=['node_scheduled'])
 
 
+def set_experiment_job_status(job: ExperimentJob, payload: Dict) -> None:
+    details = payload['details']
+    set_node_scheduling(job, details['node_name'])
+    job.set_status(status=payload['status'],
+                   message=payload['message'],
+                   created_at=payload.get('created_at'),
+                   traceback=payload.get('traceback'),
+                   details=details)
+
+
+def set_job_status(job: Any, payload: Dict) -> None:
+    details = payload['details']
+    set_node_scheduling(job, details['node_name'])
+    job.set_status(status=payload['status'],
+                   message=payload['message'],
+                   traceback=payload.get('traceback'),
+                   details=details)
+
+
+def get_job_uuid(payload: Dict) -> str:
+    return uuid.UUID(str(payload['details']['labels']['job_uuid'])).hex
+
+
+def get_jobs(queryset: Any, payloads: List[Dict]) -> Dict[str, Any]:
+    """Fetches the jobs of all the payloads with a single query."""
+    job_uuids = {get_job_uuid(payload) for payload in payloads}
+    return {job.uuid.hex: job for job in queryset.filter(uuid__in=job_uuids)}
+
+
+def handle_statuses_batch(payloads: List[Dict],
+                          jobs: Dict[str, Any],
+                          set_status: Callable,
+                          task: str) -> None:
+    """Sets the statuses of a batch of jobs fetched beforehand.
+
+    The jobs' in memory statuses are updated by the statuses' signals,
+    so several statuses of the same job are handled without refetching it.
+    A status that could not be set because of concurrency is retried with the single task.
+    """
+    for payload in payloads:
+        job = jobs.get(get_job_uuid(payload))
+        if job is None:
+            logger.debug('Job uuid`%s` does not exist', get_job_uuid(payload))
+            continue
+
+        try:
+            set_status(job=job, payload=payload)
+        except IntegrityError:
+            # Due to concurrency this could happen, we just retry it
+            logger.info('Retry job status %s handling %s', payload['status'], job.uuid.hex)
+            celery_app.send_task(task,
+                                 kwargs={'payload': payload},
+                                 countdown=Intervals.EXPERIMENTS_SCHEDULER)
+
+
 @celery_app.task(name=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES,
                  bind=True,
                  max_retries=3,
@@ -51,12 +108,7 @@ def k8s_events_handle_experiment_job_statuses(self: 'celery_app.task', payload:
 
     # Set the new status
     try:
-        set_node_scheduling(job, details['node_name'])
-        job.set_status(status=payload['status'],
-                       message=payload['message'],
-                       created_at=payload.get('created_at'),
-                       traceback=payload.get('traceback'),
-                       details=details)
+        set_experiment_job_status(job=job, payload=payload)
         logger.debug('status %s is set for job %s %s', payload['status'], job_uuid, job.id)
     except IntegrityError:
         # Due to concurrency this could happen, we just retry it
@@ -90,11 +142,7 @@ def k8s_events_handle_job_statuses(self: 'celery_app.task', payload: Dict) -> No
 
     # Set the new status
     try:
-        set_node_scheduling(job, details['node_name'])
-        job.set_status(status=payload['status'],
-                       message=payload['message'],
-                       traceback=payload.get('traceback'),
-                       details=details)
+        set_job_status(job=job, payload=payload)
     except IntegrityError:
         # Due to concurrency this could happen, we just retry it
         self.retry(countdown=Intervals.EXPERIMENTS_SCHEDULER)
@@ -132,11 +180,7 @@ def k8s_events_handle_plugin_job_statuses(self: 'celery_app.task', payload: Dict
 
     # Set the new status
     try:
-        set_node_scheduling(job, details['node_name'])
-        job.set_status(status=payload['status'],
-                       message=payload['message'],
-                       traceback=payload.get('traceback'),
-                       details=details)
+        set_job_status(job=job, payload=payload)
     except IntegrityError:
         # Due to concurrency this could happen, we just retry it
         self.retry(countdown=Intervals.EXPERIMENTS_SCHEDULER)
@@ -168,11 +212,74 @@ def k8s_events_handle_build_job_statuses(self: 'celery_app.task', payload: Dict)
 
     # Set the new status
     try:
-        set_node_scheduling(build_job, details['node_name'])
-        build_job.set_status(status=payload['status'],
-                             message=payload['message'],
-                             traceback=payload.get('traceback'),
-                             details=details)
+        set_job_status(job=build_job, payload=payload)
     except IntegrityError:
         # Due to concurrency this could happen, we just retry it
         self.retry(countdown=Intervals.EXPERIMENTS_SCHEDULER)
+
+
+@celery_app.task(name=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES_BATCH,
+                 ignore_result=True)
+def k8s_events_handle_experiment_job_statuses_batch(payloads: List[Dict]) -> None:
+    """Experiment jobs statuses, coalesced by the statuses monitor"""
+    jobs = get_jobs(ExperimentJob.objects.select_related('status', 'experiment'), payloads)
+
+    # Jobs without a status yet are still being created, their statuses are handled later
+    pending_jobs = {job_uuid for job_uuid, job in jobs.items() if job.last_status is None}
+    for payload in payloads:
+        if get_job_uuid(payload) in pending_jobs:
+            celery_app.send_task(K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES,
+                                 kwargs={'payload': payload},
+                                 countdown=1)
+    handle_statuses_batch(
+        payloads=[payload for payload in payloads if get_job_uuid(payload) not in pending_jobs],
+        jobs=jobs,
+        set_status=set_experiment_job_status,
+        task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES)
+
+
+@celery_app.task(name=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES_BATCH,
+                 ignore_result=True)
+def k8s_events_handle_job_statuses_batch(payloads: List[Dict]) -> None:
+    """Project jobs statuses, coalesced by the statuses monitor"""
+    handle_statuses_batch(
+        payloads=payloads,
+        jobs=get_jobs(Job.objects.select_related('status', 'project'), payloads),
+        set_status=set_job_status,
+        task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES)
+
+
+@celery_app.task(name=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES_BATCH,
+                 ignore_result=True)
+def k8s_events_handle_plugin_job_statuses_batch(payloads: List[Dict]) -> None:
+    """Project Plugin jobs statuses, coalesced by the statuses monitor"""
+    models = {
+        conf.get('APP_LABELS_TENSORBOARD'): TensorboardJob,
+        conf.get('APP_LABELS_NOTEBOOK'): NotebookJob,
+    }
+    payloads_by_app = {}
+    for payload in payloads:
+        app = payload['details']['labels']['app']
+        if app not in models:
+            logger.info('Plugin job `%s` does not exist', app)
+            continue
+        payloads_by_app.setdefault(app, []).append(payload)
+
+    for app, app_payloads in payloads_by_app.items():
+        queryset = models[app].objects.select_related('status', 'project')
+        handle_statuses_batch(
+            payloads=app_payloads,
+            jobs=get_jobs(queryset, app_payloads),
+            set_status=set_job_status,
+            task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES)
+
+
+@celery_app.task(name=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES_BATCH,
+                 ignore_result=True)
+def k8s_events_handle_build_job_statuses_batch(payloads: List[Dict]) -> None:
+    """Build jobs statuses, coalesced by the statuses monitor"""
+    handle_statuses_batch(
+        payloads=payloads,
+        jobs=get_jobs(BuildJob.objects.select_related('status', 'project'), payloads),
+        set_status=set_job_status,
+        task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES)
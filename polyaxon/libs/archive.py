@@ -75,6 +75,12 @@ def archive_logs_file(log_path: str, namepath: str, persistence_logs: str = 'def
     check_or_create_path(download_dir)
     try:
         store_manager = stores.get_logs_store(persistence_logs=persistence_logs)
+        # Logs uploaded incrementally are stitched from their segments
+        if not store_manager.store.is_local_store and stores.download_logs_segments(
+                logs_path=log_path,
+                download_path=download_filepath,
+                persistence=persistence_logs):
+            return download_filepath
         store_manager.download_file(log_path, download_filepath)
     except (PolyaxonStoresException, VolumeNotFoundError) as e:
         raise ValidationError(e)
@@ -0,0 +1,15 @@
+import hashlib
+import json
+
+from typing import Dict, Optional
+
+
+def get_build_content_hash(config: Dict, code_reference_id: Optional[int]) -> str:
+    """Returns a canonical hash of a build's config and code reference.
+
+    The config includes the build's environment, i.e. the secret and config map refs.
+    """
+    value = json.dumps({'config': config, 'code_reference': code_reference_id},
+                       sort_keys=True,
+                       separators=(',', ':'))
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
@@ -0,0 +1,103 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from hestia.datetime_typing import AwareDT
+
+
+class MetricsSampling(object):
+    LTTB = 'lttb'
+    MIN_MAX = 'minmax'
+
+    VALUES = {LTTB, MIN_MAX}
+
+
+def is_metric_value(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def get_metrics_columns(rows: Iterable[Tuple[int, AwareDT, Dict]],
+                        offset: int = 0,
+                        names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, List]]:
+    """Transposes metric rows (id, created_at, values) to per metric columns.
+
+    Every metric gets the steps, timestamps, and values of the rows it was reported in,
+    the step of a row is its position in the experiment's metrics, starting from `offset`.
+    """
+    names = set(names) if names else None
+    columns = {}
+    for step, (_, created_at, values) in enumerate(rows, offset):
+        for name, value in (values or {}).items():
+            if names is not None and name not in names:
+                continue
+            if not is_metric_value(value):
+                continue
+            if name not in columns:
+                columns[name] = {'steps': [], 'timestamps': [], 'values': []}
+            column = columns[name]
+            column['steps'].append(step)
+            column['timestamps'].append(created_at)
+            column['values'].append(value)
+    return columns
+
+
+def get_lttb_indices(x: List[float], y: List[float], threshold: int) -> List[int]:
+    """Largest-Triangle-Three-Buckets: selects the points that keep the shape of the series."""
+    n = len(y)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1][:threshold]
+
+    indices = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        next_size = next_end - end
+        avg_x = sum(x[end:next_end]) / next_size
+        avg_y = sum(y[end:next_end]) / next_size
+
+        max_area = -1
+        max_index = start
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > max_area:
+                max_area = area
+                max_index = j
+        indices.append(max_index)
+        a = max_index
+    indices.append(n - 1)
+    return indices
+
+
+def get_min_max_indices(y: List[float], threshold: int) -> List[int]:
+    """Keeps the min and the max of every bucket, so that no spike is lost."""
+    n = len(y)
+    if threshold >= n:
+        return list(range(n))
+
+    n_buckets = max(threshold // 2, 1)
+    bucket_size = n / n_buckets
+    indices = []
+    for i in range(n_buckets):
+        bucket = range(int(i * bucket_size), int((i + 1) * bucket_size))
+        if not bucket:
+            continue
+        min_index = min(bucket, key=y.__getitem__)
+        max_index = max(bucket, key=y.__getitem__)
+        indices += sorted({min_index, max_index})
+    return indices
+
+
+def downsample_column(column: Dict[str, List],
+                      threshold: int,
+                      sampling: str = MetricsSampling.LTTB) -> Dict[str, List]:
+    if len(column['values']) <= threshold:
+        return column
+
+    if sampling == MetricsSampling.MIN_MAX:
+        indices = get_min_max_indices(y=column['values'], threshold=threshold)
+    else:
+        indices = get_lttb_indices(x=column['steps'], y=column['values'], threshold=threshold)
+    return {key: [values[i] for i in indices] for key, values in column.items()}
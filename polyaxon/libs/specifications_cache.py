@@ -0,0 +1,84 @@
+import hashlib
+import json
+import threading
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+import conf
+
+from schemas.hptuning import HPTuningConfig
+
+
+class SpecificationsCache(object):
+    """A process wide LRU cache of parsed specifications, keyed by a hash of their content.
+
+    The cached specifications are shared by all the instances with the same content,
+    so they must be treated as immutable by the callers.
+    """
+
+    def __init__(self, maxsize: int = None) -> None:
+        self._maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            self._maxsize = conf.get('SPECIFICATIONS_CACHE_SIZE')
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @staticmethod
+    def get_key(kind: type, content: Any) -> str:
+        if not isinstance(content, str):
+            content = json.dumps(content, sort_keys=True, default=str)
+        return '{}.{}'.format(kind.__name__, hashlib.md5(content.encode('utf-8')).hexdigest())
+
+    def get(self, kind: type, content: Any, parse: Callable) -> Any:
+        key = self.get_key(kind=kind, content=content)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        # Parsing is done outside of the lock, a concurrent miss parses the content twice
+        value = parse(content)
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return value
+
+    def cache_info(self) -> Dict[str, int]:
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._cache),
+                'maxsize': self.maxsize}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+specifications_cache = SpecificationsCache()
+
+
+def get_specification(spec_class: type, content: Any) -> Any:
+    """Returns the specification of the content (a polyaxonfile content or a config)."""
+    return specifications_cache.get(kind=spec_class, content=content, parse=spec_class.read)
+
+
+def get_hptuning_config(content: Any) -> HPTuningConfig:
+    return specifications_cache.get(kind=HPTuningConfig,
+                                    content=content,
+                                    parse=HPTuningConfig.from_dict)
@@ -0,0 +1,58 @@
+from typing import Iterable, Optional, Union
+
+import conf
+
+from constants import content_types
+from db.redis.logs_buffer import RedisLogsBuffer
+from polyaxon.celery_api import celery_app
+from polyaxon.settings import LogsCeleryTasks
+
+
+def schedule_logs_flush(kind: str, run_uuid: str, run_name: str) -> None:
+    celery_app.send_task(
+        LogsCeleryTasks.LOGS_FLUSH_BUFFER,
+        kwargs={
+            'kind': kind,
+            'run_uuid': run_uuid,
+            'run_name': run_name,
+        },
+        countdown=conf.get('LOGS_FLUSH_INTERVAL'))
+
+
+def buffer_logs(kind: str,
+                run_uuid: str,
+                run_name: str,
+                log_lines: Optional[Union[str, Iterable[str]]]) -> None:
+    """Buffers the log lines and makes sure a single flush is scheduled for the run."""
+    if not log_lines:
+        return
+
+    if RedisLogsBuffer.append(kind=kind, run_uuid=run_uuid, log_lines=log_lines):
+        schedule_logs_flush(kind=kind, run_uuid=run_uuid, run_name=run_name)
+
+
+def buffer_experiment_logs(experiment_name: str,
+                           experiment_uuid: str,
+                           log_lines: Optional[Union[str, Iterable[str]]]) -> None:
+    buffer_logs(kind=content_types.EXPERIMENT,
+                run_uuid=experiment_uuid,
+                run_name=experiment_name,
+                log_lines=log_lines)
+
+
+def buffer_job_logs(job_uuid: str,
+                    job_name: str,
+                    log_lines: Optional[Union[str, Iterable[str]]]) -> None:
+    buffer_logs(kind=content_types.JOB,
+                run_uuid=job_uuid,
+                run_name=job_name,
+                log_lines=log_lines)
+
+
+def buffer_build_job_logs(job_uuid: str,
+                          job_name: str,
+                          log_lines: Optional[Union[str, Iterable[str]]]) -> None:
+    buffer_logs(kind=content_types.BUILD_JOB,
+                run_uuid=job_uuid,
+                run_name=job_name,
+                log_lines=log_lines)
@@ -1,17 +1,35 @@
 from typing import Iterable, Optional, Union
 
+from django.core.cache import cache
+
+import conf
+
+from constants import content_types
 from db.models.build_jobs import BuildJob
 from db.models.experiments import Experiment
 from db.models.jobs import Job
+from db.redis.logs_buffer import RedisLogsBuffer
+from logs_handlers.buffer import schedule_logs_flush
 from logs_handlers.tasks.logger import logger
 from logs_handlers.utils import safe_log_experiment, safe_log_job
 
 
+def run_exists(model, run_uuid: str) -> bool:
+    """Checks if the run exists, positive checks are cached to avoid a query per log batch."""
+    cache_key = 'logs_handlers.{}:{}'.format(model.__name__, run_uuid)
+    if cache.get(cache_key):
+        return True
+    if not model.objects.filter(uuid=run_uuid).exists():
+        return False
+    cache.set(cache_key, True, conf.get('TTL_LOGS_RUN_CHECK'))
+    return True
+
+
 def handle_experiment_job_log(experiment_name: str,
                               experiment_uuid: str,
                               log_lines: Optional[Union[str, Iterable[str]]],
                               temp: bool = True) -> None:
-    if not Experiment.objects.filter(uuid=experiment_uuid).exists():
+    if not run_exists(Experiment, experiment_uuid):
         return
 
     logger.debug('handling log event for %s', experiment_uuid)
@@ -25,7 +43,7 @@ def handle_job_logs(job_uuid: str,
                     job_name: str,
                     log_lines: Optional[Union[str, Iterable[str]]],
                     temp: bool = True) -> None:
-    if not Job.objects.filter(uuid=job_uuid).exists():
+    if not run_exists(Job, job_uuid):
         return
 
     logger.debug('handling log event for %s', job_name)
@@ -36,8 +54,30 @@ def handle_build_job_logs(job_uuid: str,
                           job_name: str,
                           log_lines: Optional[Union[str, Iterable[str]]],
                           temp: bool = True) -> None:
-    if not BuildJob.objects.filter(uuid=job_uuid).exists():
+    if not run_exists(BuildJob, job_uuid):
         return
 
     logger.debug('handling log event for %s', job_name)
     safe_log_job(job_name=job_name, log_lines=log_lines, temp=temp, append=True)
+
+
+def handle_buffered_logs(kind: str, run_uuid: str, run_name: str) -> None:
+    # The lines are only removed from the buffer once they are persisted
+    log_lines = RedisLogsBuffer.get_log_lines(kind=kind, run_uuid=run_uuid)
+    if not log_lines:
+        return
+
+    logger.debug('flushing %s buffered log lines for %s', len(log_lines), run_name)
+    count = len(log_lines)
+    log_lines = '\n'.join(log_lines)
+    if kind == content_types.EXPERIMENT:
+        handle_experiment_job_log(experiment_name=run_name,
+                                  experiment_uuid=run_uuid,
+                                  log_lines=log_lines)
+    elif kind == content_types.JOB:
+        handle_job_logs(job_uuid=run_uuid, job_name=run_name, log_lines=log_lines)
+    elif kind == content_types.BUILD_JOB:
+        handle_build_job_logs(job_uuid=run_uuid, job_name=run_name, log_lines=log_lines)
+
+    if RedisLogsBuffer.trim(kind=kind, run_uuid=run_uuid, count=count):
+        schedule_logs_flush(kind=kind, run_uuid=run_uuid, run_name=run_name)
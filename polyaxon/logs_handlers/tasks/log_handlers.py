@@ -1,6 +1,11 @@
 from typing import Iterable, Optional, Union
 
-from logs_handlers.handlers import handle_build_job_logs, handle_experiment_job_log, handle_job_logs
+from logs_handlers.handlers import (
+    handle_buffered_logs,
+    handle_build_job_logs,
+    handle_experiment_job_log,
+    handle_job_logs
+)
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import LogsCeleryTasks
 
@@ -39,3 +44,9 @@ def logs_handle_build_job(job_uuid: str,
                           job_name=job_name,
                           log_lines=log_lines,
                           temp=temp)
+
+
+@celery_app.task(name=LogsCeleryTasks.LOGS_FLUSH_BUFFER, ignore_result=True)
+def logs_flush_buffer(kind: str, run_uuid: str, run_name: str) -> None:
+    """Task persisting the buffered logs of a run in a single batch."""
+    handle_buffered_logs(kind=kind, run_uuid=run_uuid, run_name=run_name)
@@ -1,19 +1,64 @@
 import fcntl
+import os
 
-from typing import Iterable, Optional, Union
+from collections import OrderedDict
+from typing import IO, Iterable, Optional, Union
 
 import stores
 
+MAX_OPEN_LOG_FILES = 128
+
+# Log files opened in append mode, kept open across batches and closed in LRU order
+_log_files = OrderedDict()
+
+
+def _get_log_file(log_path: str) -> IO:
+    log_file = _log_files.pop(log_path, None)
+    if log_file is not None:
+        try:
+            # The file could have been deleted or replaced since it was opened
+            if os.fstat(log_file.fileno()).st_ino != os.stat(log_path).st_ino:
+                log_file.close()
+                log_file = None
+        except OSError:
+            log_file.close()
+            log_file = None
+
+    if log_file is None:
+        log_file = open(log_path, 'a')
+
+    _log_files[log_path] = log_file
+    while len(_log_files) > MAX_OPEN_LOG_FILES:
+        _, stale_log_file = _log_files.popitem(last=False)
+        stale_log_file.close()
+    return log_file
+
+
+def close_log_file(log_path: str) -> None:
+    log_file = _log_files.pop(log_path, None)
+    if log_file is not None:
+        log_file.close()
+
 
 def _lock_log(log_path: str,
               log_lines: Optional[Union[str, Iterable[str]]],
               append: bool = False) -> None:
     if not log_lines:
         return
-    write_mode = 'a' if append else 'w'
-    with open(log_path, write_mode) as log_file:
-        fcntl.flock(log_file, fcntl.LOCK_EX)
+    if not append:
+        close_log_file(log_path)
+        with open(log_path, 'w') as log_file:
+            fcntl.flock(log_file, fcntl.LOCK_EX)
+            log_file.write(log_lines + '\n')
+            fcntl.flock(log_file, fcntl.LOCK_UN)
+        return
+
+    log_file = _get_log_file(log_path)
+    fcntl.flock(log_file, fcntl.LOCK_EX)
+    try:
         log_file.write(log_lines + '\n')
+        log_file.flush()
+    finally:
         fcntl.flock(log_file, fcntl.LOCK_UN)
 
 
@@ -37,7 +82,8 @@ def safe_log_job(job_name: str,
     else:
         # We are storing a file to bucket; Store the file as temp and then upload it
         _safe_log_job(True)
-        stores.upload_job_logs(job_name=job_name)  # Add to stores
+        # Add to stores
+        stores.upload_job_logs(job_name=job_name, rewrite=bool(log_lines) and not append)
 
 
 def safe_log_experiment(experiment_name: str,
@@ -65,7 +111,8 @@ def safe_log_experiment(experiment_name: str,
     else:
         # We are storing a file to bucket; Store the file as temp and then upload it
         _safe_log_experiment(True)
-        stores.upload_experiment_logs(experiment_name=experiment_name)
+        stores.upload_experiment_logs(experiment_name=experiment_name,
+                                      rewrite=bool(log_lines) and not append)
 
 
 def safe_log_experiment_job(experiment_job_name: str,
@@ -91,4 +138,5 @@ def safe_log_experiment_job(experiment_job_name: str,
     else:
         # We are storing a file to bucket; Store the file as temp and then upload it
         _safe_log_experiment_job(True)
-        stores.upload_experiment_job_logs(experiment_job_name=experiment_job_name)
+        stores.upload_experiment_job_logs(experiment_job_name=experiment_job_name,
+                                          rewrite=bool(log_lines) and not append)
@@ -0,0 +1,78 @@
+import logging
+import threading
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from polyaxon.celery_api import celery_app
+from polyaxon.settings import K8SEventsCeleryTasks
+
+_logger = logging.getLogger('polyaxon.monitors.namespace')
+
+
+class EventsAggregator(object):
+    """Deduplicates the namespace's warning events and publishes them at a bounded rate.
+
+    The events are aggregated by (involved object, reason) over `interval` seconds,
+    every aggregated event is published once with the number of occurrences.
+    At most `max_events` events are published per interval, the remaining ones
+    are kept for the next intervals, and at most `max_pending` events are kept.
+    """
+
+    def __init__(self, cluster_id: int, interval: float, max_events: int, max_pending: int) -> None:
+        self.cluster_id = cluster_id
+        self.interval = interval
+        self.max_events = max_events
+        self.max_pending = max_pending
+        # Maps every (kind, name, reason) to its first payload and its number of occurrences
+        self._pending = OrderedDict()
+        self.n_dropped = 0
+        self._lock = threading.Lock()
+        self._timer = None
+
+    @staticmethod
+    def get_key(payload: Dict) -> Tuple:
+        involved_object = payload['meta'].get('involved_object', {})
+        return (involved_object.get('kind'),
+                involved_object.get('namespace'),
+                involved_object.get('name'),
+                payload['data'].get('reason'))
+
+    def add(self, payload: Dict) -> None:
+        key = self.get_key(payload)
+        with self._lock:
+            if key in self._pending:
+                self._pending[key][1] += 1
+            elif len(self._pending) >= self.max_pending:
+                self.n_dropped += 1
+            else:
+                self._pending[key] = [payload, 1]
+            self._schedule()
+
+    def _schedule(self) -> None:
+        if self._timer is None and self._pending:
+            self._timer = threading.Timer(self.interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._timer = None
+            events = []
+            while self._pending and len(events) < self.max_events:
+                events.append(self._pending.popitem(last=False)[1])
+            n_dropped = self.n_dropped
+            self.n_dropped = 0
+            # The events above the rate are published in the next intervals
+            self._schedule()
+
+        if n_dropped:
+            _logger.warning('Dropped %s namespace events, too many distinct events', n_dropped)
+
+        for payload, count in events:
+            if count > 1:
+                payload['data']['count'] = count
+            _logger.debug('Publishing event: %s', payload['data'])
+            celery_app.send_task(
+                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_NAMESPACE,
+                kwargs={'cluster_id': self.cluster_id, 'payload': payload})
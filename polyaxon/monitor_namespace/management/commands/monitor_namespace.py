@@ -11,6 +11,7 @@ import conf
 from db.models.clusters import Cluster
 from libs.base_monitor import BaseMonitorCommand
 from monitor_namespace import monitor
+from monitor_namespace.aggregator import EventsAggregator
 from polyaxon_k8s.manager import K8SManager
 
 
@@ -41,12 +42,19 @@ class Command(BaseMonitorCommand):
             # End process
             return
 
+        watcher = monitor.NamespaceWatcher(k8s_manager=k8s_manager)
+        aggregator = EventsAggregator(cluster_id=cluster.id,
+                                      interval=conf.get('NAMESPACE_EVENTS_INTERVAL'),
+                                      max_events=conf.get('NAMESPACE_EVENTS_MAX_PUBLISH'),
+                                      max_pending=conf.get('NAMESPACE_EVENTS_MAX_PENDING'))
         while True:
             try:
-                monitor.run(k8s_manager, cluster)
+                monitor.run(watcher=watcher, aggregator=aggregator)
             except ApiException as e:
                 monitor.logger.error(
                     "Exception when calling CoreV1Api->list_event_for_all_namespaces: %s\n", e)
+                if e.status == monitor.RESOURCE_VERSION_EXPIRED:
+                    watcher.reset()
                 time.sleep(log_sleep_interval)
             except ValueError as e:
                 monitor.logger.error(
@@ -1,9 +1,10 @@
 import logging
 
+from typing import Dict, Iterable, Optional
+
 from kubernetes import watch
 
-from polyaxon.celery_api import celery_app
-from polyaxon.settings import K8SEventsCeleryTasks
+from monitor_namespace.aggregator import EventsAggregator
 
 logger = logging.getLogger('polyaxon.monitors.namespace')
 
@@ -11,93 +12,135 @@ LEVEL_MAPPING = {
     'normal': 'info',
 }
 
+# The watch's resource version is too old, the events must be listed again
+RESOURCE_VERSION_EXPIRED = 410
+
+
+class NamespaceWatcher(object):
+    """Watches the namespace's events, and resumes from the last seen resource version.
+
+    Without a resource version the watch starts by listing all the namespace's events,
+    so the reconnections only replay the events that were missed.
+    """
+
+    def __init__(self, k8s_manager: 'K8SManager') -> None:
+        self.k8s_manager = k8s_manager
+        self.resource_version = None
+
+    @property
+    def namespace(self) -> str:
+        return self.k8s_manager.namespace
+
+    def reset(self) -> None:
+        self.resource_version = None
+
+    def stream(self) -> Iterable[Dict]:
+        w = watch.Watch()
+        kwargs = {'namespace': self.namespace}
+        if self.resource_version:
+            kwargs['resource_version'] = self.resource_version
+        for event in w.stream(self.k8s_manager.k8s_api.list_namespaced_event, **kwargs):
+            if event['type'] == 'ERROR':
+                raw_object = event.get('raw_object') or {}
+                if raw_object.get('code') == RESOURCE_VERSION_EXPIRED:
+                    logger.info('Resource version `%s` expired, listing the events again',
+                                self.resource_version)
+                    self.reset()
+                    return
+                continue
+
+            self.resource_version = event['object'].metadata.resource_version
+            yield event
+
+
+def get_event_payload(event: Dict,  # pylint:disable=too-many-branches
+                      namespace: str) -> Optional[Dict]:
+    """Returns the payload of a warning or error event, None for the other events."""
+    event_type = event['type'].lower()
+    event = event['object']
+
+    level = (event.type and event.type.lower())
+    level = LEVEL_MAPPING.get(level, level)
+    if level not in ('warning', 'error') and event_type not in ('error',):
+        return None
+
+    meta = {
+        k: v for k, v
+        in event.metadata.to_dict().items()
+        if v is not None
+    }
+
+    creation_timestamp = meta.pop('creation_timestamp', None)
+
+    component = source_host = reason = short_name = kind = None
+    if event.source:
+        source = event.source.to_dict()
+
+        if 'component' in source:
+            component = source['component']
+        if 'host' in source:
+            source_host = source['host']
+
+    if event.reason:
+        reason = event.reason
+
+    if event.involved_object and event.involved_object.name:
+        name = event.involved_object.name
+        bits = name.split('-')
+        if len(bits) in (1, 2):
+            short_name = bits[0]
+        else:
+            short_name = "-".join(bits[:-2])
 
-def run(k8s_manager: 'K8SManager', cluster: 'Cluster') -> None:  # pylint:disable=too-many-branches
-    w = watch.Watch()
+    if event.involved_object and event.involved_object.kind:
+        kind = event.involved_object.kind
 
-    for event in w.stream(k8s_manager.k8s_api.list_namespaced_event,
-                          namespace=k8s_manager.namespace):
-        logger.debug("event: %s", event)
+    message = event.message
 
-        event_type = event['type'].lower()
-        event = event['object']
+    if short_name:
+        obj_name = "({}/{})".format(namespace, short_name)
+    else:
+        obj_name = "({})".format(namespace)
 
-        meta = {
+    if event.involved_object:
+        meta['involved_object'] = {
             k: v for k, v
-            in event.metadata.to_dict().items()
+            in event.involved_object.to_dict().items()
             if v is not None
         }
 
-        creation_timestamp = meta.pop('creation_timestamp', None)
+    data = {
+        'server_name': source_host or 'n/a',
+        'obj_name': obj_name,
+        'message': message
+    }
 
-        level = (event.type and event.type.lower())
-        level = LEVEL_MAPPING.get(level, level)
+    if component:
+        data['component'] = component
 
-        component = source_host = reason = short_name = kind = None
-        if event.source:
-            source = event.source.to_dict()
+    if short_name:
+        data['name'] = short_name
 
-            if 'component' in source:
-                component = source['component']
-            if 'host' in source:
-                source_host = source['host']
+    if kind:
+        data['kind'] = kind
 
-        if event.reason:
-            reason = event.reason
+    if reason:
+        data['reason'] = reason
 
-        if event.involved_object and event.involved_object.name:
-            name = event.involved_object.name
-            bits = name.split('-')
-            if len(bits) in (1, 2):
-                short_name = bits[0]
-            else:
-                short_name = "-".join(bits[:-2])
+    payload = dict(
+        data=data,
+        meta=meta,
+        level=level,
+    )
+    if creation_timestamp:
+        payload['created_at'] = creation_timestamp
+    return payload
 
-        if event.involved_object and event.involved_object.kind:
-            kind = event.involved_object.kind
 
-        message = event.message
+def run(watcher: NamespaceWatcher, aggregator: EventsAggregator) -> None:
+    for event in watcher.stream():
+        logger.debug("event: %s", event)
 
-        if short_name:
-            obj_name = "({}/{})".format(k8s_manager.namespace, short_name)
-        else:
-            obj_name = "({})".format(k8s_manager.namespace)
-
-        if level in ('warning', 'error') or event_type in ('error',):
-            if event.involved_object:
-                meta['involved_object'] = {
-                    k: v for k, v
-                    in event.involved_object.to_dict().items()
-                    if v is not None
-                }
-
-            data = {
-                'server_name': source_host or 'n/a',
-                'obj_name': obj_name,
-                'message': message
-            }
-
-            if component:
-                data['component'] = component
-
-            if short_name:
-                data['name'] = short_name
-
-            if kind:
-                data['kind'] = kind
-
-            if reason:
-                data['reason '] = reason
-
-            payload = dict(
-                data=data,
-                meta=meta,
-                level=level,
-            )
-            if creation_timestamp:
-                payload['created_at'] = creation_timestamp
-
-            logger.debug("Publishing event: %s", data)
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_NAMESPACE,
-                kwargs={'cluster_id': cluster.id, 'payload': payload})
+        payload = get_event_payload(event=event, namespace=watcher.namespace)
+        if payload:
+            aggregator.add(payload)
@@ -3,7 +3,7 @@ import logging
 import re
 import requests
 
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Set
 
 import docker
 
@@ -64,15 +64,16 @@ def get_container(containers: Dict, container_id: str) -> Any:
 
 def get_container_resources(node: 'ClusterNode',
                             container: Any,
-                            gpu_resources: Mapping) -> Optional['ContainerResourcesConfig']:
+                            gpu_resources: Mapping,
+                            job_uuid: Optional[str],
+                            experiment_uuid: Optional[str],
+                            removed_container_ids: Set[str]) -> Optional[ContainerResourcesConfig]:
     # Check if the container is running
     if container.status != ContainerStatuses.RUNNING:
         logger.debug("`%s` container is not running", container.name)
-        RedisJobContainers.remove_container(container.id)
+        removed_container_ids.add(container.id)
         return
 
-    job_uuid, experiment_uuid = RedisJobContainers.get_job(container.id)
-
     if not job_uuid:
         logger.debug("`%s` container is not recognised", container.name)
         return
@@ -88,7 +89,7 @@ def get_container_resources(node: 'ClusterNode',
         return
     except NotFound:
         logger.debug("`%s` was not found", container.name)
-        RedisJobContainers.remove_container(container.id)
+        removed_container_ids.add(container.id)
         return
     except requests.ReadTimeout:
         return
@@ -156,32 +157,43 @@ def update_cluster_node(node_gpus: Dict) -> None:
 
 def run(containers: Dict, node: 'ClusterNode', persist: bool) -> None:
     container_ids = RedisJobContainers.get_containers()
+    jobs = RedisJobContainers.get_jobs(container_ids)
     gpu_resources = get_gpu_resources()
     if gpu_resources:
         gpu_resources = {gpu_resource['index']: gpu_resource for gpu_resource in gpu_resources}
     update_cluster_node(gpu_resources)
+    removed_container_ids = set([])
+    payloads = []
     for container_id in container_ids:
         container = get_container(containers, container_id)
         if not container:
             continue
+        job_uuid, experiment_uuid = jobs[container_id]
         try:
-            payload = get_container_resources(node, containers[container_id], gpu_resources)
+            payload = get_container_resources(node=node,
+                                              container=containers[container_id],
+                                              gpu_resources=gpu_resources,
+                                              job_uuid=job_uuid,
+                                              experiment_uuid=experiment_uuid,
+                                              removed_container_ids=removed_container_ids)
         except KeyError:
             payload = None
         if payload:
-            payload = payload.to_dict()
+            payloads.append(payload.to_dict())
             # todo: Re-enable publishing
             # logger.debug("Publishing resources event")
             # celery_app.send_task(
             #     K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_RESOURCES,
             #     kwargs={'payload': payload, 'persist': persist})
 
-            job_uuid = payload['job_uuid']
-            # Check if we should stream the payload
-            # Check if we have this container already in place
-            experiment_uuid = RedisJobContainers.get_experiment_for_job(job_uuid)
-            set_last_resources_cond = (
-                RedisToStream.is_monitored_job_resources(job_uuid) or
-                RedisToStream.is_monitored_experiment_resources(experiment_uuid))
-            if set_last_resources_cond:
-                RedisToStream.set_latest_job_resources(job_uuid, payload)
+    RedisJobContainers.remove_containers(removed_container_ids)
+    if not payloads:
+        return
+
+    # Check if we should stream the payloads
+    monitored_job_uuids, monitored_experiment_uuids = RedisToStream.get_monitored_resources()
+    RedisToStream.publish_resources([
+        payload for payload in payloads
+        if (payload['job_uuid'] in monitored_job_uuids or
+            payload['experiment_uuid'] in monitored_experiment_uuids)
+    ])
@@ -0,0 +1,64 @@
+import threading
+
+from collections import OrderedDict
+from typing import Dict, List, Mapping
+
+from polyaxon.celery_api import celery_app
+
+
+class StatusesBatcher(object):
+    """Coalesces the pods' states per job and sends them to the handlers in batches.
+
+    Pod watches produce bursts of events with the same status while pods are
+    scheduled and torn down, for every job only the latest state of a status is kept,
+    the transitions between different statuses are all kept in order.
+    The pending states are sent, one task per handler, `interval` seconds after
+    the first state was added or as soon as `batch_size` states are pending.
+    """
+
+    def __init__(self, interval: float, batch_size: int) -> None:
+        self.interval = interval
+        self.batch_size = batch_size
+        # Maps every task name to the pending states of the jobs, by job uuid
+        self._pending = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._timer = None
+
+    @staticmethod
+    def get_job_uuid(payload: Mapping) -> str:
+        return payload['details']['labels']['job_uuid']
+
+    def add(self, task: str, payload: Dict) -> None:
+        with self._lock:
+            jobs = self._pending.setdefault(task, OrderedDict())
+            job_states = jobs.setdefault(self.get_job_uuid(payload), [])
+            if job_states and job_states[-1]['status'] == payload['status']:
+                # Same status, only the latest state is relevant
+                job_states[-1] = payload
+            else:
+                job_states.append(payload)
+                self._size += 1
+            should_flush = self._size >= self.batch_size
+            if not should_flush and self._timer is None:
+                self._timer = threading.Timer(self.interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if should_flush:
+            self.flush()
+
+    def pop(self) -> Dict[str, List[Dict]]:
+        """Returns the pending states by task name, and resets the batch."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = self._pending
+            self._pending = {}
+            self._size = 0
+        return {task: [payload for job_states in jobs.values() for payload in job_states]
+                for task, jobs in pending.items()}
+
+    def flush(self) -> None:
+        for task, payloads in self.pop().items():
+            celery_app.send_task(task, kwargs={'payloads': payloads})
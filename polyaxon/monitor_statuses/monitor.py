@@ -7,7 +7,7 @@ import ocular
 
 from constants.jobs import JobLifeCycle
 from db.redis.containers import RedisJobContainers
-from polyaxon.celery_api import celery_app
+from monitor_statuses.batcher import StatusesBatcher
 from polyaxon.settings import K8SEventsCeleryTasks
 
 logger = logging.getLogger('polyaxon.monitors.statuses')
@@ -56,6 +56,15 @@ def get_label_selector() -> str:
 
 
 def run(k8s_manager: 'K8SManager') -> None:
+    batcher = StatusesBatcher(interval=conf.get('STATUSES_BATCH_INTERVAL'),
+                              batch_size=conf.get('STATUSES_BATCH_SIZE'))
+    try:
+        watch_statuses(k8s_manager=k8s_manager, batcher=batcher)
+    finally:
+        batcher.flush()
+
+
+def watch_statuses(k8s_manager: 'K8SManager', batcher: StatusesBatcher) -> None:
     for (event_object, pod_state) in ocular.monitor(k8s_manager.k8s_api,
                                                     namespace=conf.get('K8S_NAMESPACE'),
                                                     container_names=(
@@ -100,30 +109,26 @@ def run(k8s_manager: 'K8SManager') -> None:
             update_job_containers(event_object, status, conf.get('CONTAINER_NAME_EXPERIMENT_JOB'))
             logger.debug("Sending state to handler %s, %s", status, labels)
             # Handle experiment job statuses
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES,
-                kwargs={'payload': pod_state})
+            batcher.add(task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES_BATCH,
+                        payload=pod_state)
 
         elif job_condition:
             update_job_containers(event_object, status, conf.get('CONTAINER_NAME_JOB'))
             logger.debug("Sending state to handler %s, %s", status, labels)
             # Handle experiment job statuses
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES,
-                kwargs={'payload': pod_state})
+            batcher.add(task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES_BATCH,
+                        payload=pod_state)
 
         elif plugin_job_condition:
             logger.debug("Sending state to handler %s, %s", status, labels)
             # Handle plugin job statuses
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES,
-                kwargs={'payload': pod_state})
+            batcher.add(task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES_BATCH,
+                        payload=pod_state)
 
         elif dockerizer_job_condition:
             logger.debug("Sending state to handler %s, %s", status, labels)
             # Handle dockerizer job statuses
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES,
-                kwargs={'payload': pod_state})
+            batcher.add(task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES_BATCH,
+                        payload=pod_state)
         else:
             logger.info("Lost state %s, %s", status, pod_state)
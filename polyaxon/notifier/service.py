@@ -15,6 +15,7 @@ class NotifierService(EventService):
     def __init__(self):
         self.notification_event = None
         self.notification = None
+        self._batch = None
 
     @staticmethod
     def get_recipients(event: 'Event'):
@@ -25,7 +26,7 @@ class NotifierService(EventService):
     def create_notification(self, event, recipients):
         actor_id = event.data.get(event.actor_id)
         actor_id = actor_id if actor_id != user_system.USER_SYSTEM_ID else None
-        notification_event = self.notification_event.objects.create(
+        notification_event = self.notification_event(
             event_type=event.event_type,
             actor_id=actor_id if actor_id != user_system.USER_SYSTEM_ID else None,
             context=event.data,
@@ -33,12 +34,31 @@ class NotifierService(EventService):
             object_id=event.instance_id,
             content_type_id=event.instance_contenttype
         )
+        # Notifications of a batch are created at once
+        if self._batch is not None:
+            self._batch.append((notification_event, recipients))
+            return
 
+        notification_event.save()
         self.notification.objects.bulk_create([
             self.notification(event=notification_event, user_id=recipient.id)
             for recipient in recipients
         ])
 
+    def record_batch(self, events):
+        self._batch = []
+        try:
+            super().record_batch(events)
+            notification_events = self.notification_event.objects.bulk_create(
+                [notification_event for notification_event, _ in self._batch])
+            self.notification.objects.bulk_create([
+                self.notification(event=notification_event, user_id=recipient.id)
+                for notification_event, (_, recipients) in zip(notification_events, self._batch)
+                for recipient in recipients
+            ])
+        finally:
+            self._batch = None
+
     @staticmethod
     def validate_event_instance(event):
         from django.contrib.contenttypes.models import ContentType
@@ -1,7 +1,5 @@
-import copy
-
-from collections import deque
-from typing import Dict, Tuple
+from collections import Counter, deque
+from typing import Dict, Iterable, Tuple
 
 
 def get_dag(nodes, downstream_fn) -> Tuple[Dict, Dict]:
@@ -26,6 +24,29 @@ def get_dag(nodes, downstream_fn) -> Tuple[Dict, Dict]:
     return dag, node_by_ids
 
 
+def get_dag_from_edges(nodes, edges: Iterable[Tuple[int, int]]) -> Tuple[Dict, Dict]:
+    """Return a dag representation of the nodes passed based on a list of edges.
+
+    Unlike `get_dag`, this does not need to query the downstream nodes of every node,
+    the edges of the whole dag can be fetched with a single query.
+
+    Params:
+        nodes: an instance of `Operation` | `OperationRun` the nodes to represent en dag.
+        edges: (upstream node id, downstream node id) pairs,
+            edges with an upstream node outside the nodes are ignored.
+
+    Returns:
+         tuple: (dag, dict(node_id: node))
+    """
+    node_by_ids = {node.id: node for node in nodes}
+    dag = {node_id: set() for node_id in node_by_ids}
+    for upstream_id, downstream_id in edges:
+        if upstream_id in dag:
+            dag[upstream_id].add(downstream_id)
+
+    return dag, node_by_ids
+
+
 def get_independent_nodes(dag):
     """Get a list of all node in the graph with no dependencies."""
     nodes = set(dag.keys())
@@ -48,7 +69,7 @@ def has_dependencies(node, dag):
 
 
 def sort_topologically(dag):
-    """Sort the dag breath first topologically.
+    """Sort the dag breath first topologically (Kahn's algorithm).
 
     Only the nodes inside the dag are returned, i.e. the nodes that are also keys.
 
@@ -57,19 +78,15 @@ def sort_topologically(dag):
     Raises:
          an error if this is not possible (graph is not valid).
     """
-    dag = copy.deepcopy(dag)
+    in_degrees = Counter(node for downstream_nodes in dag.values() for node in downstream_nodes)
     sorted_nodes = []
     independent_nodes = deque(get_independent_nodes(dag))
     while independent_nodes:
         node = independent_nodes.popleft()
         sorted_nodes.append(node)
-        # this alters the dag so that we are sure we are visiting the nodes only once
-        downstream_nodes = dag[node]
-        while downstream_nodes:
-            downstream_node = downstream_nodes.pop(0)
-            if downstream_node not in dag:
-                continue
-            if not has_dependencies(downstream_node, dag):
+        for downstream_node in dag[node]:
+            in_degrees[downstream_node] -= 1
+            if downstream_node in dag and in_degrees[downstream_node] == 0:
                 independent_nodes.append(downstream_node)
 
     if len(sorted_nodes) != len(dag.keys()):
@@ -1,7 +1,6 @@
 import logging
 
 from constants.pipelines import OperationStatuses, PipelineStatuses
-from pipelines import dags
 from pipelines.utils import (
     get_operation_run,
     get_pipeline_run,
@@ -22,23 +21,11 @@ def pipelines_start(self: 'celery_app.task', pipeline_run_id: int) -> None:
     pipeline_run = get_pipeline_run(pipeline_run_id=pipeline_run_id)
     if not pipeline_run:
         _logger.info('Pipeline `%s` does not exist any more.', pipeline_run_id)
+        return
 
-    pipeline_run.on_schedule()
-    dag, op_runs = pipeline_run.dag
-    sorted_ops = dags.sort_topologically(dag=dag)
-    op_runs_to_start = [op_runs[op_run_id] for op_run_id in sorted_ops
-                        if op_runs[op_run_id].last_status == OperationStatuses.CREATED]
-    concurrency = pipeline_run.pipeline.n_operation_runs_to_start
-    future_check = False
-    while op_runs_to_start and concurrency > 0:
-        op_run = op_runs_to_start.pop()
-        if op_run.schedule_start():
-            # If we end up here it means that the task
-            future_check = True
-        else:
-            concurrency -= 1
-
-    if op_runs_to_start or future_check:
+    if pipeline_run.last_status == PipelineStatuses.CREATED:
+        pipeline_run.on_scheduled()
+    if pipeline_run.schedule_start_operation_runs():
         # Schedule another task
         self.retry(countdown=Intervals.PIPELINES_SCHEDULER)
 
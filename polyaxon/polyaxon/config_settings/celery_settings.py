@@ -51,6 +51,9 @@ CELERYD_MAX_TASKS_PER_CHILD = config.get_int('POLYAXON_CELERYD_MAX_TASKS_PER_CHI
 GROUP_CHUNKS = config.get_int('POLYAXON_GROUP_CHUNKS',
                               is_optional=True,
                               default=50)
+HP_BO_N_JOBS = config.get_int('POLYAXON_HP_BO_N_JOBS',
+                              is_optional=True,
+                              default=1)
 
 
 class Intervals(object):
@@ -75,6 +78,10 @@ class Intervals(object):
         'POLYAXON_INTERVALS_EXPERIMENTS_SYNC',
         is_optional=True,
         default=30)
+    EXPERIMENT_GROUPS_SYNC = config.get_int(
+        'POLYAXON_INTERVALS_EXPERIMENT_GROUPS_SYNC',
+        is_optional=True,
+        default=300)
     CLUSTERS_UPDATE_SYSTEM_INFO = config.get_int(
         'POLYAXON_INTERVALS_CLUSTERS_UPDATE_SYSTEM_INFO',
         is_optional=True,
@@ -146,6 +153,8 @@ class CronsCeleryTasks(object):
 
     EXPERIMENTS_SYNC_JOBS_STATUSES = 'experiments_sync_jobs_statuses'
 
+    EXPERIMENT_GROUPS_SYNC_EXPERIMENTS_COUNTS = 'experiment_groups_sync_experiments_counts'
+
     HEARTBEAT_EXPERIMENTS = 'heartbeat_experiments'
     HEARTBEAT_JOBS = 'heartbeat_jobs'
     HEARTBEAT_BUILDS = 'heartbeat_builds'
@@ -207,6 +216,11 @@ class K8SEventsCeleryTasks(object):
     K8S_EVENTS_HANDLE_JOB_STATUSES = 'k8s_events_handle_job_statuses'
     K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES = 'k8s_events_handle_plugin_job_statuses'
     K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES = 'k8s_events_handle_build_job_statuses'
+    K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES_BATCH = (
+        'k8s_events_handle_experiment_job_statuses_batch')
+    K8S_EVENTS_HANDLE_JOB_STATUSES_BATCH = 'k8s_events_handle_job_statuses_batch'
+    K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES_BATCH = 'k8s_events_handle_plugin_job_statuses_batch'
+    K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES_BATCH = 'k8s_events_handle_build_job_statuses_batch'
 
 
 class EventsCeleryTasks(object):
@@ -218,6 +232,7 @@ class EventsCeleryTasks(object):
     EVENTS_NOTIFY = 'events_notify'
     EVENTS_TRACK = 'events_track'
     EVENTS_LOG = 'events_log'
+    EVENTS_FLUSH_BUFFER = 'events_flush_buffer'
 
 
 class LogsCeleryTasks(object):
@@ -229,6 +244,7 @@ class LogsCeleryTasks(object):
     LOGS_HANDLE_EXPERIMENT_JOB = 'logs_handle_experiment_job'
     LOGS_HANDLE_JOB = 'logs_handle_job'
     LOGS_HANDLE_BUILD_JOB = 'logs_handle_build_job'
+    LOGS_FLUSH_BUFFER = 'logs_flush_buffer'
 
     # Signals
     LOGS_SIDECARS_EXPERIMENTS = 'logs_sidecars_experiments'
@@ -285,6 +301,8 @@ class SchedulerCeleryTasks(object):
     STORES_SCHEDULE_DATA_DELETION = 'stores_schedule_data_deletion'
     STORES_SCHEDULE_OUTPUTS_DELETION = 'stores_schedule_outputs_deletion'
     STORES_SCHEDULE_LOGS_DELETION = 'stores_schedule_logs_deletion'
+    STORES_SCHEDULE_BULK_OUTPUTS_DELETION = 'stores_schedule_bulk_outputs_deletion'
+    STORES_SCHEDULE_BULK_LOGS_DELETION = 'stores_schedule_bulk_logs_deletion'
 
     DELETE_ARCHIVED_PROJECT = 'delete_archived_project'
     DELETE_ARCHIVED_EXPERIMENT_GROUP = 'delete_archived_experiment_group'
@@ -515,6 +533,10 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.SCHEDULER_STORES},
     SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION:
         {'queue': CeleryQueues.SCHEDULER_STORES},
+    SchedulerCeleryTasks.STORES_SCHEDULE_BULK_OUTPUTS_DELETION:
+        {'queue': CeleryQueues.SCHEDULER_STORES},
+    SchedulerCeleryTasks.STORES_SCHEDULE_BULK_LOGS_DELETION:
+        {'queue': CeleryQueues.SCHEDULER_STORES},
 
     # Scheduler deletion
     SchedulerCeleryTasks.DELETE_ARCHIVED_PROJECT:
@@ -540,6 +562,8 @@ CELERY_TASK_ROUTES = {
     # Crons
     CronsCeleryTasks.EXPERIMENTS_SYNC_JOBS_STATUSES:
         {'queue': CeleryQueues.CRONS_EXPERIMENTS},
+    CronsCeleryTasks.EXPERIMENT_GROUPS_SYNC_EXPERIMENTS_COUNTS:
+        {'queue': CeleryQueues.CRONS_EXPERIMENTS},
 
     CronsCeleryTasks.HEARTBEAT_EXPERIMENTS:
         {'queue': CeleryQueues.CRONS_HEARTBEAT},
@@ -624,6 +648,8 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.EVENTS_TRACK},
     EventsCeleryTasks.EVENTS_LOG:
         {'queue': CeleryQueues.EVENTS_LOG},
+    EventsCeleryTasks.EVENTS_FLUSH_BUFFER:
+        {'queue': CeleryQueues.EVENTS_LOG},
 
     # K8S Events health
     K8SEventsCeleryTasks.K8S_EVENTS_HEALTH:
@@ -642,6 +668,14 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
     K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES:
         {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
+    K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES_BATCH:
+        {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
+    K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES_BATCH:
+        {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
+    K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES_BATCH:
+        {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
+    K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES_BATCH:
+        {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
 
     # Logs health
     LogsCeleryTasks.LOGS_HEALTH:
@@ -654,6 +688,8 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.LOGS_HANDLERS},
     LogsCeleryTasks.LOGS_HANDLE_BUILD_JOB:
         {'queue': CeleryQueues.LOGS_HANDLERS},
+    LogsCeleryTasks.LOGS_FLUSH_BUFFER:
+        {'queue': CeleryQueues.LOGS_HANDLERS},
 }
 
 CELERY_BEAT_SCHEDULE = {
@@ -671,6 +707,13 @@ CELERY_BEAT_SCHEDULE = {
             'expires': Intervals.get_expires(Intervals.EXPERIMENTS_SYNC),
         },
     },
+    CronsCeleryTasks.EXPERIMENT_GROUPS_SYNC_EXPERIMENTS_COUNTS + '_beat': {
+        'task': CronsCeleryTasks.EXPERIMENT_GROUPS_SYNC_EXPERIMENTS_COUNTS,
+        'schedule': Intervals.get_schedule(Intervals.EXPERIMENT_GROUPS_SYNC),
+        'options': {
+            'expires': Intervals.get_expires(Intervals.EXPERIMENT_GROUPS_SYNC),
+        },
+    },
     CronsCeleryTasks.HEARTBEAT_EXPERIMENTS + '_beat': {
         'task': CronsCeleryTasks.HEARTBEAT_EXPERIMENTS,
         'schedule': Intervals.get_schedule(Intervals.HEARTBEAT_CHECK),
@@ -42,6 +42,39 @@ GROUP_CHECKS_INTERVAL = config.get_int('POLYAXON_GROUP_CHECKS_INTERVAL',
                                        is_optional=True,
                                        default=5)
 
+# Logs are buffered for this interval before they get persisted in a single batch
+LOGS_FLUSH_INTERVAL = config.get_int('POLYAXON_LOGS_FLUSH_INTERVAL',
+                                     is_optional=True,
+                                     default=2)
+# Flushed logs are coalesced in the open segment of a bucket store until it reaches this size
+LOGS_SEGMENT_SIZE = config.get_int('POLYAXON_LOGS_SEGMENT_SIZE',
+                                   is_optional=True,
+                                   default=1024 * 1024)
+# or until it was opened for this many seconds
+LOGS_SEGMENT_AGE = config.get_int('POLYAXON_LOGS_SEGMENT_AGE',
+                                  is_optional=True,
+                                  default=60 * 5)
+# Auditor events are buffered for this interval before they get dispatched in a single batch
+EVENTS_FLUSH_INTERVAL = config.get_int('POLYAXON_EVENTS_FLUSH_INTERVAL',
+                                       is_optional=True,
+                                       default=1)
+# How long the existence of a run is cached by the logs handlers
+TTL_LOGS_RUN_CHECK = config.get_int('POLYAXON_TTL_LOGS_RUN_CHECK',
+                                    is_optional=True,
+                                    default=60 * 10)
+# Archived entities are deleted in transactions of this many rows
+DELETION_CHUNK_SIZE = config.get_int('POLYAXON_DELETION_CHUNK_SIZE',
+                                     is_optional=True,
+                                     default=100)
+# Number of threads used to delete outputs and logs paths in bulk
+STORES_DELETION_N_JOBS = config.get_int('POLYAXON_STORES_DELETION_N_JOBS',
+                                        is_optional=True,
+                                        default=8)
+# Number of parsed specifications kept in memory by every process
+SPECIFICATIONS_CACHE_SIZE = config.get_int('POLYAXON_SPECIFICATIONS_CACHE_SIZE',
+                                           is_optional=True,
+                                           default=1024)
+
 # Auditor backend
 AUDITOR_BACKEND = config.get_string('POLYAXON_AUDITOR_BACKEND', is_optional=True)
 
@@ -1,5 +1,6 @@
 from polyaxon.config_settings.k8s import *
 from polyaxon.config_settings.labels import *
+from polyaxon.config_settings.namespace import *
 from polyaxon.config_settings.spawner import *
 
 from .apps import *
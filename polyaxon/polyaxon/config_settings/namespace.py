@@ -0,0 +1,11 @@
+from polyaxon.config_manager import config
+
+NAMESPACE_EVENTS_INTERVAL = config.get_float('POLYAXON_NAMESPACE_EVENTS_INTERVAL',
+                                             is_optional=True,
+                                             default=10.)
+NAMESPACE_EVENTS_MAX_PUBLISH = config.get_int('POLYAXON_NAMESPACE_EVENTS_MAX_PUBLISH',
+                                              is_optional=True,
+                                              default=100)
+NAMESPACE_EVENTS_MAX_PENDING = config.get_int('POLYAXON_NAMESPACE_EVENTS_MAX_PENDING',
+                                              is_optional=True,
+                                              default=1000)
@@ -3,3 +3,9 @@ from polyaxon.config_manager import config
 TTL_WATCH_STATUSES = config.get_int('POLYAXON_TTL_WATCH_STATUSES',
                                     is_optional=True,
                                     default=60 * 20)
+STATUSES_BATCH_INTERVAL = config.get_float('POLYAXON_STATUSES_BATCH_INTERVAL',
+                                           is_optional=True,
+                                           default=1.)
+STATUSES_BATCH_SIZE = config.get_int('POLYAXON_STATUSES_BATCH_SIZE',
+                                     is_optional=True,
+                                     default=100)
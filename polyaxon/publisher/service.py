@@ -6,8 +6,9 @@ from redis import RedisError
 from django.conf import settings
 
 from db.redis.to_stream import RedisToStream
+from logs_handlers.buffer import buffer_build_job_logs, buffer_experiment_logs, buffer_job_logs
 from polyaxon.celery_api import celery_app
-from polyaxon.settings import LogsCeleryTasks, RoutingKeys
+from polyaxon.settings import RoutingKeys
 
 
 class PublisherService(Service):
@@ -29,14 +30,9 @@ class PublisherService(Service):
         self._logger.debug("Publishing log event for task: %s, %s", job_uuid, experiment_name)
 
         if send_task:
-            celery_app.send_task(
-                LogsCeleryTasks.LOGS_HANDLE_EXPERIMENT_JOB,
-                kwargs={
-                    'experiment_name': experiment_name,
-                    'experiment_uuid': experiment_uuid,
-                    'log_lines': log_lines,
-                    'temp': True
-                })
+            buffer_experiment_logs(experiment_name=experiment_name,
+                                   experiment_uuid=experiment_uuid,
+                                   log_lines=log_lines)
         try:
             should_stream = (RedisToStream.is_monitored_job_logs(job_uuid) or
                              RedisToStream.is_monitored_experiment_logs(experiment_uuid))
@@ -89,13 +85,7 @@ class PublisherService(Service):
     def publish_build_job_log(self, log_lines, job_uuid, job_name, send_task=True):
         self._logger.info("Publishing log event for task: %s", job_uuid)
         if send_task:
-            celery_app.send_task(
-                LogsCeleryTasks.LOGS_HANDLE_BUILD_JOB,
-                kwargs={
-                    'job_uuid': job_uuid,
-                    'job_name': job_name,
-                    'log_lines': log_lines
-                })
+            buffer_build_job_logs(job_uuid=job_uuid, job_name=job_name, log_lines=log_lines)
         self._stream_job_log(job_uuid=job_uuid,
                              log_lines=log_lines,
                              routing_key=RoutingKeys.STREAM_LOGS_SIDECARS_BUILDS)
@@ -105,13 +95,7 @@ class PublisherService(Service):
 
         self._logger.info("Publishing log event for task: %s", job_uuid)
         if send_task:
-            celery_app.send_task(
-                LogsCeleryTasks.LOGS_HANDLE_JOB,
-                kwargs={
-                    'job_uuid': job_uuid,
-                    'job_name': job_name,
-                    'log_lines': log_lines
-                })
+            buffer_job_logs(job_uuid=job_uuid, job_name=job_name, log_lines=log_lines)
         self._stream_job_log(job_uuid=job_uuid,
                              log_lines=log_lines,
                              routing_key=RoutingKeys.STREAM_LOGS_SIDECARS_JOBS)
@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Iterable, Tuple
+
+from django.db import transaction
+
+import conf
+
+from polyaxon.celery_api import celery_app
+from polyaxon.settings import SchedulerCeleryTasks
+
+_logger = logging.getLogger('polyaxon.scheduler.deletion')
+
+_local = threading.local()
+
+
+class StorageDeletionCollector(object):
+    """Collects the outputs and logs paths to delete, grouped by persistence."""
+
+    def __init__(self) -> None:
+        self.outputs = defaultdict(set)
+        self.logs = defaultdict(set)
+
+    def add_outputs(self, persistence, subpath: str) -> None:
+        self.outputs[persistence].add(subpath)
+
+    def add_logs(self, persistence, subpath: str) -> None:
+        self.logs[persistence].add(subpath)
+
+    def flush(self) -> None:
+        """Schedules one bulk deletion per store."""
+        for persistence, subpaths in self.outputs.items():
+            celery_app.send_task(
+                SchedulerCeleryTasks.STORES_SCHEDULE_BULK_OUTPUTS_DELETION,
+                kwargs={'persistence': persistence, 'subpaths': sorted(subpaths)},
+                countdown=conf.get('GLOBAL_COUNTDOWN'))
+        for persistence, subpaths in self.logs.items():
+            celery_app.send_task(
+                SchedulerCeleryTasks.STORES_SCHEDULE_BULK_LOGS_DELETION,
+                kwargs={'persistence': persistence, 'subpaths': sorted(subpaths)},
+                countdown=conf.get('GLOBAL_COUNTDOWN'))
+        self.outputs.clear()
+        self.logs.clear()
+
+
+def get_collector():
+    return getattr(_local, 'collector', None)
+
+
+@contextmanager
+def collect_storage_deletions():
+    """Defers the storage deletions triggered in this block to a few bulk deletions.
+
+    The paths are only scheduled for deletion if the block exits without errors.
+    """
+    collector = get_collector()
+    if collector is not None:
+        # Already collected by an outer block
+        yield collector
+        return
+
+    collector = StorageDeletionCollector()
+    _local.collector = collector
+    try:
+        yield collector
+    finally:
+        _local.collector = None
+    collector.flush()
+
+
+def schedule_outputs_deletion(persistence, subpath: str) -> None:
+    collector = get_collector()
+    if collector is not None:
+        collector.add_outputs(persistence=persistence, subpath=subpath)
+        return
+
+    celery_app.send_task(
+        SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
+        kwargs={
+            'persistence': persistence,
+            'subpath': subpath,
+        },
+        countdown=conf.get('GLOBAL_COUNTDOWN'))
+
+
+def schedule_logs_deletion(persistence, subpath: str) -> None:
+    collector = get_collector()
+    if collector is not None:
+        collector.add_logs(persistence=persistence, subpath=subpath)
+        return
+
+    celery_app.send_task(
+        SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
+        kwargs={
+            'persistence': persistence,
+            'subpath': subpath,
+        },
+        countdown=conf.get('GLOBAL_COUNTDOWN'))
+
+
+def delete_in_chunks(model,
+                     ids: Iterable[int],
+                     chunk_size: int = None,
+                     children: Iterable[Tuple[Any, str]] = None,
+                     manager=None) -> int:
+    """Deletes the archived instances of a model in chunks, one transaction per chunk.
+
+    The instances are checked again in every chunk, so that restored instances are kept.
+    `children` are (model, field) pairs of the instances' children, they are deleted
+    in chunks as well before their parents, so that a chunk never cascades to an
+    unbounded number of rows.
+    The storage paths of every chunk are deleted in bulk once the chunk is committed.
+    Returns the number of deleted instances.
+    """
+    ids = list(ids)
+    chunk_size = chunk_size or conf.get('DELETION_CHUNK_SIZE')
+    manager = manager or model.archived
+    name = model._meta.verbose_name_plural  # pylint:disable=protected-access
+    start = time.time()
+    num_deleted = 0
+    for i in range(0, len(ids), chunk_size):
+        chunk = list(manager.filter(id__in=ids[i:i + chunk_size]).values_list('id', flat=True))
+        for child_model, field in children or []:
+            child_ids = child_model.all.filter(
+                **{'{}__in'.format(field): chunk}).values_list('id', flat=True)
+            delete_in_chunks(model=child_model,
+                             ids=child_ids,
+                             chunk_size=chunk_size,
+                             manager=child_model.all)
+        with collect_storage_deletions():
+            with transaction.atomic():
+                _, deleted = manager.filter(id__in=chunk).delete()
+        num_deleted += deleted.get(model._meta.label, 0)  # pylint:disable=protected-access
+        _logger.info('Deleted %s/%s archived %s (%.1f/s)',
+                     num_deleted,
+                     len(ids),
+                     name,
+                     num_deleted / max(time.time() - start, 1e-3))
+    return num_deleted
@@ -135,8 +135,13 @@ def experiments_set_metrics(experiment_id, data):
         serializer.is_valid(raise_exception=True)
     except ValidationError:
         _logger.error('Could not create metrics, a validation error was raised.')
+        return
 
-    serializer.save(experiment=experiment)
+    if kwargs.get('many'):
+        # Bulk path: a single write for the metrics, `last_metric` and the event
+        experiment.create_metrics(metrics=serializer.validated_data)
+    else:
+        serializer.save(experiment=experiment)
 
 
 @celery_app.task(name=SchedulerCeleryTasks.EXPERIMENTS_START, ignore_result=True)
@@ -1,5 +1,6 @@
 import logging
 
+import conf
 import stores
 
 from polyaxon.celery_api import celery_app
@@ -21,3 +22,19 @@ def stores_schedule_outputs_deletion(persistence, subpath):
 @celery_app.task(name=SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION, ignore_result=True)
 def stores_schedule_logs_deletion(persistence, subpath):
     stores.delete_logs_path(persistence=persistence, subpath=subpath)
+
+
+@celery_app.task(name=SchedulerCeleryTasks.STORES_SCHEDULE_BULK_OUTPUTS_DELETION,
+                 ignore_result=True)
+def stores_schedule_bulk_outputs_deletion(persistence, subpaths):
+    stores.delete_outputs_paths(persistence=persistence,
+                                subpaths=subpaths,
+                                n_jobs=conf.get('STORES_DELETION_N_JOBS'))
+
+
+@celery_app.task(name=SchedulerCeleryTasks.STORES_SCHEDULE_BULK_LOGS_DELETION,
+                 ignore_result=True)
+def stores_schedule_bulk_logs_deletion(persistence, subpaths):
+    stores.delete_logs_paths(persistence=persistence,
+                             subpaths=subpaths,
+                             n_jobs=conf.get('STORES_DELETION_N_JOBS'))
@@ -9,6 +9,7 @@ import conf
 
 from constants.jobs import JobLifeCycle
 from db.models.build_jobs import BuildJob
+from libs.builds import get_build_content_hash
 from libs.repos.utils import assign_code_reference
 from signals.names import set_name
 from signals.tags import set_tags
@@ -29,6 +30,9 @@ def build_job_pre_save(sender, **kwargs):
     set_tags(instance=instance)
     set_backend(instance=instance)
     assign_code_reference(instance)
+    instance.content_hash = get_build_content_hash(
+        config=instance.config,
+        code_reference_id=instance.code_reference_id)
     set_name(instance=instance, query=BuildJob.all)
 
 
@@ -4,7 +4,6 @@ from django.db.models.signals import post_delete, pre_delete
 from django.dispatch import receiver
 
 import auditor
-import conf
 
 from db.models.build_jobs import BuildJob
 from db.models.cloning_strategies import CloningStrategy
@@ -21,8 +20,7 @@ from event_manager.events.job import JOB_CLEANED_TRIGGERED, JOB_DELETED
 from event_manager.events.notebook import NOTEBOOK_CLEANED_TRIGGERED
 from event_manager.events.tensorboard import TENSORBOARD_CLEANED_TRIGGERED
 from libs.paths.projects import delete_project_repos
-from polyaxon.celery_api import celery_app
-from polyaxon.settings import SchedulerCeleryTasks
+from scheduler.deletion import schedule_logs_deletion, schedule_outputs_deletion
 from signals.bookmarks import remove_bookmarks
 
 
@@ -32,13 +30,8 @@ def build_job_pre_delete(sender, **kwargs):
     job = kwargs['instance']
 
     # Delete outputs and logs
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
-        kwargs={
-            'persistence': job.persistence_logs,
-            'subpath': job.subpath,
-        },
-        countdown=conf.get('GLOBAL_COUNTDOWN'))
+    schedule_logs_deletion(persistence=job.persistence_logs,
+                           subpath=job.subpath)
 
     auditor.record(event_type=BUILD_JOB_CLEANED_TRIGGERED, instance=job)
 
@@ -61,20 +54,10 @@ def experiment_group_pre_delete(sender, **kwargs):
         return
 
     # Delete outputs and logs
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
-        kwargs={
-            'persistence': instance.persistence_outputs,
-            'subpath': instance.subpath,
-        },
-        countdown=conf.get('GLOBAL_COUNTDOWN'))
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
-        kwargs={
-            'persistence': instance.persistence_logs,
-            'subpath': instance.subpath,
-        },
-        countdown=conf.get('GLOBAL_COUNTDOWN'))
+    schedule_outputs_deletion(persistence=instance.persistence_outputs,
+                              subpath=instance.subpath)
+    schedule_logs_deletion(persistence=instance.persistence_logs,
+                           subpath=instance.subpath)
 
 
 @receiver(post_delete, sender=ExperimentGroup, dispatch_uid="experiment_group_post_delete")
@@ -93,25 +76,20 @@ def experiment_pre_delete(sender, **kwargs):
 
     # Delete outputs and logs
     if instance.is_independent:
-        celery_app.send_task(
-            SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
-            kwargs={
-                'persistence': instance.persistence_outputs,
-                'subpath': instance.subpath,
-            },
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
-        celery_app.send_task(
-            SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
-            kwargs={
-                'persistence': instance.persistence_logs,
-                'subpath': instance.subpath,
-            },
-            countdown=conf.get('GLOBAL_COUNTDOWN'))
+        schedule_outputs_deletion(persistence=instance.persistence_outputs,
+                                  subpath=instance.subpath)
+        schedule_logs_deletion(persistence=instance.persistence_logs,
+                               subpath=instance.subpath)
 
     # Delete clones
     for experiment in instance.clones.filter(cloning_strategy=CloningStrategy.RESUME):
         experiment.delete()
 
+    # Archived experiments are already removed from their group's counts
+    if instance.experiment_group_id and not instance.deleted:
+        ExperimentGroup.update_experiments_counts(group_id=instance.experiment_group_id,
+                                                  status_from=instance.last_status)
+
     auditor.record(event_type=EXPERIMENT_CLEANED_TRIGGERED, instance=instance)
 
 
@@ -129,20 +107,10 @@ def job_pre_delete(sender, **kwargs):
     job = kwargs['instance']
 
     # Delete outputs and logs
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
-        kwargs={
-            'persistence': job.persistence_outputs,
-            'subpath': job.subpath,
-        },
-        countdown=conf.get('GLOBAL_COUNTDOWN'))
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
-        kwargs={
-            'persistence': job.persistence_logs,
-            'subpath': job.subpath,
-        },
-        countdown=conf.get('GLOBAL_COUNTDOWN'))
+    schedule_outputs_deletion(persistence=job.persistence_outputs,
+                              subpath=job.subpath)
+    schedule_logs_deletion(persistence=job.persistence_logs,
+                           subpath=job.subpath)
 
     auditor.record(event_type=JOB_CLEANED_TRIGGERED, instance=job)
 
@@ -176,17 +144,7 @@ def project_pre_delete(sender, **kwargs):
     # Clean repos
     delete_project_repos(instance.unique_name)
     # Clean outputs and logs
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
-        kwargs={
-            'persistence': instance.persistence_outputs,
-            'subpath': instance.subpath,
-        },
-        countdown=conf.get('GLOBAL_COUNTDOWN'))
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
-        kwargs={
-            'persistence': instance.persistence_logs,
-            'subpath': instance.subpath,
-        },
-        countdown=conf.get('GLOBAL_COUNTDOWN'))
+    schedule_outputs_deletion(persistence=instance.persistence_outputs,
+                              subpath=instance.subpath)
+    schedule_logs_deletion(persistence=instance.persistence_logs,
+                           subpath=instance.subpath)
@@ -2,6 +2,7 @@ import logging
 
 from hestia.signal_decorators import ignore_raw, ignore_updates
 
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils.timezone import now
@@ -12,12 +13,13 @@ from constants.experiment_groups import ExperimentGroupLifeCycle
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
 from db.models.build_jobs import BuildJobStatus
-from db.models.experiment_groups import ExperimentGroupStatus
+from db.models.experiment_groups import ExperimentGroup, ExperimentGroupStatus
 from db.models.experiment_jobs import ExperimentJobStatus
-from db.models.experiments import ExperimentStatus
+from db.models.experiments import Experiment, ExperimentStatus
 from db.models.jobs import JobStatus
 from db.models.notebooks import NotebookJobStatus
 from db.models.tensorboards import TensorboardJobStatus
+from db.redis.statuses import RedisStatuses
 from event_manager.events.build_job import (
     BUILD_JOB_CREATED,
     BUILD_JOB_DONE,
@@ -84,6 +86,7 @@ def build_job_status_post_save(sender, **kwargs):
     set_job_started_at(instance=job, status=instance.status)
     set_job_finished_at(instance=job, status=instance.status)
     job.save(update_fields=['status', 'started_at', 'updated_at', 'finished_at'])
+    RedisStatuses.publish_status(run_uuid=job.uuid.hex, status=instance.status)
     auditor.record(event_type=BUILD_JOB_NEW_STATUS,
                    instance=job,
                    previous_status=previous_status)
@@ -121,6 +124,7 @@ def job_status_post_save(sender, **kwargs):
     set_job_started_at(instance=job, status=instance.status)
     set_job_finished_at(instance=job, status=instance.status)
     job.save(update_fields=['status', 'started_at', 'updated_at', 'finished_at'])
+    RedisStatuses.publish_status(run_uuid=job.uuid.hex, status=instance.status)
     auditor.record(event_type=JOB_NEW_STATUS,
                    instance=job,
                    previous_status=previous_status)
@@ -259,6 +263,7 @@ def experiment_job_status_post_save(sender, **kwargs):
     set_job_started_at(instance=job, status=instance.status)
     set_job_finished_at(instance=job, status=instance.status)
     job.save(update_fields=['status', 'started_at', 'updated_at', 'finished_at'])
+    RedisStatuses.publish_status(run_uuid=job.uuid.hex, status=instance.status)
 
     # check if the new status is done to remove the containers from the monitors
     if job.is_done:
@@ -276,18 +281,29 @@ def experiment_job_status_post_save(sender, **kwargs):
 def experiment_status_post_save(sender, **kwargs):
     instance = kwargs['instance']
     experiment = instance.experiment
-    previous_status = experiment.last_status
 
-    # update experiment last_status
-    experiment.status = instance
-    set_started_at(instance=experiment,
-                   status=instance.status,
-                   starting_statuses=[ExperimentLifeCycle.STARTING, ExperimentLifeCycle.RUNNING],
-                   running_status=ExperimentLifeCycle.RUNNING)
-    set_finished_at(instance=experiment,
-                    status=instance.status,
-                    is_done=ExperimentLifeCycle.is_done)
-    experiment.save(update_fields=['status', 'started_at', 'updated_at', 'finished_at'])
+    with transaction.atomic():
+        # The experiment's row is locked, so that concurrent statuses
+        # do not move the group's counts from the same previous status
+        previous_status = Experiment.all.select_for_update(of=('self',)).filter(
+            id=experiment.id).values_list('status__status', flat=True).first()
+
+        # update experiment last_status
+        experiment.status = instance
+        set_started_at(instance=experiment,
+                       status=instance.status,
+                       starting_statuses=[ExperimentLifeCycle.STARTING,
+                                          ExperimentLifeCycle.RUNNING],
+                       running_status=ExperimentLifeCycle.RUNNING)
+        set_finished_at(instance=experiment,
+                        status=instance.status,
+                        is_done=ExperimentLifeCycle.is_done)
+        experiment.save(update_fields=['status', 'started_at', 'updated_at', 'finished_at'])
+        if experiment.experiment_group_id and not experiment.deleted:
+            ExperimentGroup.update_experiments_counts(group_id=experiment.experiment_group_id,
+                                                      status_from=previous_status,
+                                                      status_to=instance.status)
+    RedisStatuses.publish_status(run_uuid=experiment.uuid.hex, status=instance.status)
     auditor.record(event_type=EXPERIMENT_NEW_STATUS,
                    instance=experiment,
                    previous_status=previous_status)
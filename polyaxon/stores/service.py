@@ -1,5 +1,11 @@
+import fcntl
+import json
 import os
 import shutil
+import time
+import uuid
+
+from concurrent.futures import ThreadPoolExecutor
 
 from hestia.paths import check_or_create_path, create_path, delete_path
 from hestia.service_interface import InvalidService, Service
@@ -18,6 +24,9 @@ from stores.schemas.volume import VolumeConfig
 from stores.store_secrets import get_store_secret_for_persistence, get_store_secret_from_definition
 
 
+LOGS_SEGMENTS_MANIFEST = 'manifest.json'
+
+
 class StoresService(Service):
     __all__ = (
         'get_data_paths',
@@ -25,8 +34,13 @@ class StoresService(Service):
         'delete_data_path',
         'get_outputs_path',
         'delete_outputs_path',
+        'delete_outputs_paths',
         'get_logs_path',
         'delete_logs_path',
+        'delete_logs_paths',
+        'get_logs_segments_path',
+        'upload_logs_segment',
+        'download_logs_segments',
         'get_outputs_store',
         'get_logs_store',
         'is_bucket_logs_persistence',
@@ -123,6 +137,26 @@ class StoresService(Service):
         except (PolyaxonStoresException, VolumeNotFoundError):
             pass
 
+    @staticmethod
+    def _delete_paths(delete_path_fn, subpaths, persistence, n_jobs=1):
+        if n_jobs <= 1 or len(subpaths) <= 1:
+            for subpath in subpaths:
+                delete_path_fn(subpath=subpath, persistence=persistence)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(n_jobs, len(subpaths))) as executor:
+            list(executor.map(lambda subpath: delete_path_fn(subpath=subpath,
+                                                             persistence=persistence),
+                              subpaths))
+
+    @classmethod
+    def delete_outputs_paths(cls, subpaths, persistence, n_jobs=1):
+        """Deletes several outputs subpaths of the same persistence using `n_jobs` threads."""
+        cls._delete_paths(delete_path_fn=cls.delete_outputs_path,
+                          subpaths=subpaths,
+                          persistence=persistence,
+                          n_jobs=n_jobs)
+
     @staticmethod
     def get_logs_path(persistence='default'):
         import conf
@@ -144,8 +178,158 @@ class StoresService(Service):
         store = cls.get_logs_store(persistence_logs=persistence)
         try:
             store.delete(path)
+            if cls.is_bucket_logs_persistence(persistence=persistence):
+                store.delete(cls.get_logs_segments_path(path))
         except (PolyaxonStoresException, VolumeNotFoundError):
             pass
+        cls._delete_temp_logs_path(subpath)
+
+    @staticmethod
+    def _delete_temp_logs_path(subpath):
+        """Deletes the temp logs of the subpath, and the manifests of their uploaded segments."""
+        import conf
+
+        temp_path = os.path.join(conf.get('LOGS_ARCHIVE_ROOT'), subpath)
+        for path in [temp_path, '{}.manifest'.format(temp_path), '{}.segment'.format(temp_path)]:
+            delete_path(path)
+
+    @classmethod
+    def delete_logs_paths(cls, subpaths, persistence='default', n_jobs=1):
+        """Deletes several logs subpaths of the same persistence using `n_jobs` threads."""
+        cls._delete_paths(delete_path_fn=cls.delete_logs_path,
+                          subpaths=subpaths,
+                          persistence=persistence,
+                          n_jobs=n_jobs)
+
+    @staticmethod
+    def get_logs_segments_path(logs_path):
+        return '{}.segments'.format(logs_path)
+
+    @staticmethod
+    def _read_manifest(manifest_path):
+        try:
+            with open(manifest_path, 'r') as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def upload_logs_segment(cls, temp_path, logs_path, rewrite=False, persistence='default'):
+        """Uploads the bytes appended to the temp log file since the last upload to a segment.
+
+        New bytes are coalesced in the last segment, which is uploaded again,
+        until it reaches `LOGS_SEGMENT_SIZE` or is older than `LOGS_SEGMENT_AGE`,
+        then a new segment is started.
+        The segments are tracked in a manifest kept next to the temp file,
+        the manifest is uploaded with every segment so that readers can stitch them back.
+        If the temp file was rewritten, a new generation of segments is started.
+        """
+        import conf
+
+        if not os.path.exists(temp_path):
+            return
+        store = cls.get_logs_store(persistence_logs=persistence)
+        segments_path = cls.get_logs_segments_path(logs_path)
+        manifest_path = '{}.manifest'.format(temp_path)
+        segment_path = '{}.segment'.format(temp_path)
+        with open(manifest_path, 'a+') as manifest_file:
+            fcntl.flock(manifest_file, fcntl.LOCK_EX)
+            try:
+                manifest_file.seek(0)
+                try:
+                    manifest = json.loads(manifest_file.read() or '{}')
+                except ValueError:
+                    manifest = {}
+                size = os.path.getsize(temp_path)
+                if rewrite or not manifest or size < manifest['size']:
+                    manifest = {'generation': uuid.uuid4().hex, 'size': 0, 'segments': []}
+                if size == manifest['size']:
+                    return
+
+                segments = manifest['segments']
+                should_roll = (
+                    not segments or
+                    segments[-1]['size'] >= conf.get('LOGS_SEGMENT_SIZE') or
+                    time.time() - segments[-1]['created_at'] >= conf.get('LOGS_SEGMENT_AGE')
+                )
+                if should_roll:
+                    segments.append({'name': '{:06d}.log'.format(len(segments)),
+                                     'offset': manifest['size'],
+                                     'size': 0,
+                                     'created_at': time.time()})
+                segment = segments[-1]
+                with open(temp_path, 'rb') as log_file, open(segment_path, 'wb') as segment_file:
+                    log_file.seek(segment['offset'])
+                    segment_file.write(log_file.read(size - segment['offset']))
+                store.upload_file(filename=segment_path,
+                                  path=os.path.join(segments_path, segment['name']),
+                                  use_basename=False)
+                os.remove(segment_path)
+
+                segment['size'] = size - segment['offset']
+                manifest['size'] = size
+                manifest_file.seek(0)
+                manifest_file.truncate()
+                json.dump(manifest, manifest_file)
+                manifest_file.flush()
+                store.upload_file(filename=manifest_path,
+                                  path=os.path.join(segments_path, LOGS_SEGMENTS_MANIFEST),
+                                  use_basename=False)
+            finally:
+                fcntl.flock(manifest_file, fcntl.LOCK_UN)
+
+    @classmethod
+    def download_logs_segments(cls, logs_path, download_path, persistence='default'):
+        """Stitches the uploaded segments of a log file into the download path.
+
+        Only the segments that are new or that grew since the last download are fetched.
+        Returns False if the logs were not uploaded as segments.
+        """
+        store = cls.get_logs_store(persistence_logs=persistence)
+        segments_path = cls.get_logs_segments_path(logs_path)
+        manifest_path = '{}.manifest'.format(download_path)
+        remote_manifest_path = '{}.remote'.format(manifest_path)
+        segment_path = '{}.segment'.format(download_path)
+        try:
+            store.download_file(os.path.join(segments_path, LOGS_SEGMENTS_MANIFEST),
+                                remote_manifest_path,
+                                use_basename=False)
+        except PolyaxonStoresException:
+            # The segments could have been deleted, the local manifest is stale
+            delete_path(manifest_path)
+            return False
+        remote_manifest = cls._read_manifest(remote_manifest_path)
+        if not remote_manifest:
+            return False
+
+        manifest = cls._read_manifest(manifest_path)
+        is_stale = (
+            not manifest or
+            manifest['generation'] != remote_manifest['generation'] or
+            not os.path.exists(download_path) or
+            os.path.getsize(download_path) != manifest['size']
+        )
+        if is_stale:
+            manifest = {'segments': []}
+            open(download_path, 'wb').close()
+
+        # Only the last downloaded segment could have grown since
+        downloaded_segments = [segment for segment, remote_segment
+                               in zip(manifest['segments'], remote_manifest['segments'])
+                               if segment['size'] == remote_segment['size']]
+        with open(download_path, 'r+b') as log_file:
+            if len(downloaded_segments) < len(manifest['segments']):
+                log_file.truncate(manifest['segments'][len(downloaded_segments)]['offset'])
+            log_file.seek(0, os.SEEK_END)
+            for segment in remote_manifest['segments'][len(downloaded_segments):]:
+                store.download_file(os.path.join(segments_path, segment['name']),
+                                    segment_path,
+                                    use_basename=False)
+                with open(segment_path, 'rb') as segment_file:
+                    shutil.copyfileobj(segment_file, log_file)
+                os.remove(segment_path)
+        os.replace(remote_manifest_path, manifest_path)
+        return True
 
     @staticmethod
     def _get_store(store, secret_key):
@@ -260,17 +444,17 @@ class StoresService(Service):
         return os.path.join(persistence_logs, job_name.replace('.', '/'))
 
     @classmethod
-    def upload_experiment_job_logs(cls, experiment_job_name, persistence='default'):
-        store = cls.get_logs_store(persistence_logs=persistence)
+    def upload_experiment_job_logs(cls, experiment_job_name, rewrite=False, persistence='default'):
         temp_path = cls.get_experiment_job_logs_path(experiment_job_name=experiment_job_name,
                                                      temp=True,
                                                      persistence=persistence)
-        if not os.path.exists(temp_path):
-            return
         logs_path = cls.get_experiment_job_logs_path(experiment_job_name=experiment_job_name,
                                                      temp=False,
                                                      persistence=persistence)
-        store.upload_file(filename=temp_path, path=logs_path, use_basename=False)
+        cls.upload_logs_segment(temp_path=temp_path,
+                                logs_path=logs_path,
+                                rewrite=rewrite,
+                                persistence=persistence)
 
     @classmethod
     def create_experiment_job_logs_path(cls, experiment_job_name, temp, persistence='default'):
@@ -293,17 +477,17 @@ class StoresService(Service):
         return os.path.join(persistence_logs, project_name.replace('.', '/'))
 
     @classmethod
-    def upload_experiment_logs(cls, experiment_name, persistence='default'):
-        store = cls.get_logs_store(persistence_logs=persistence)
+    def upload_experiment_logs(cls, experiment_name, rewrite=False, persistence='default'):
         temp_path = cls.get_experiment_logs_path(experiment_name=experiment_name,
                                                  temp=True,
                                                  persistence=persistence)
-        if not os.path.exists(temp_path):
-            return
         logs_path = cls.get_experiment_logs_path(experiment_name=experiment_name,
                                                  temp=False,
                                                  persistence=persistence)
-        store.upload_file(filename=temp_path, path=logs_path, use_basename=False)
+        cls.upload_logs_segment(temp_path=temp_path,
+                                logs_path=logs_path,
+                                rewrite=rewrite,
+                                persistence=persistence)
 
     @classmethod
     def create_experiment_logs_path(cls, experiment_name, temp, persistence='default'):
@@ -338,13 +522,13 @@ class StoresService(Service):
         shutil.copytree(path_from, path_to)
 
     @classmethod
-    def upload_job_logs(cls, job_name, persistence='default'):
-        store = cls.get_logs_store(persistence_logs=persistence)
+    def upload_job_logs(cls, job_name, rewrite=False, persistence='default'):
         temp_path = cls.get_job_logs_path(job_name=job_name, temp=True, persistence=persistence)
-        if not os.path.exists(temp_path):
-            return
         logs_path = cls.get_job_logs_path(job_name=job_name, temp=False, persistence=persistence)
-        store.upload_file(filename=temp_path, path=logs_path, use_basename=False)
+        cls.upload_logs_segment(temp_path=temp_path,
+                                logs_path=logs_path,
+                                rewrite=rewrite,
+                                persistence=persistence)
 
     @classmethod
     def create_job_logs_path(cls, job_name, temp, persistence='default'):
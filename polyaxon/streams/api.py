@@ -7,6 +7,7 @@ from streams.resources.experiment_jobs import experiment_job_logs_v2, experiment
 from streams.resources.experiments import experiment_logs_v2, experiment_resources
 from streams.resources.health import health
 from streams.resources.jobs import job_logs_v2
+from streams.statuses import StatusesWatcher
 
 app = Sanic(__name__, log_config=conf.get('LOGGING'))
 
@@ -49,6 +50,9 @@ async def notify_server_started(app, loop):  # pylint:disable=redefined-outer-na
     app.job_logs_ws_managers = {}
     app.job_logs_consumers = {}
     app.experiment_logs_consumers = {}
+    app.pod_logs_streamers = {}
+    app.resources_streamers = {}
+    app.statuses_watcher = StatusesWatcher()
 
 
 @app.listener('after_server_stop')
@@ -65,3 +69,15 @@ async def notify_server_stopped(app, loop):  # pylint:disable=redefined-outer-na
     for consumer_key in consumer_keys:
         consumer = app.experiment_logs_consumers.pop(consumer_key, None)
         consumer.stop()
+
+    streamer_keys = list(app.pod_logs_streamers.keys())
+    for streamer_key in streamer_keys:
+        streamer = app.pod_logs_streamers.pop(streamer_key, None)
+        streamer.stop()
+
+    streamer_keys = list(app.resources_streamers.keys())
+    for streamer_key in streamer_keys:
+        streamer = app.resources_streamers.pop(streamer_key, None)
+        streamer.stop()
+
+    app.statuses_watcher.stop()
@@ -3,12 +3,17 @@ from functools import wraps
 from sanic.response import json
 
 from scopes.authentication.token import TokenAuthentication
+from streams.constants import TOKEN_CACHE_TTL
+from streams.db import TTLCache, run_db
+
+# Caches the valid tokens' users, so that sockets do not hit the db on every connection
+tokens_cache = TTLCache(ttl=TOKEN_CACHE_TTL)
 
 
 class SanicTokenAuthentication(TokenAuthentication):
     AUTHORIZATION_HEADER = 'Authorization'
 
-    def authenticate(self, request):
+    def get_token(self, request):
         # Check headers
         token = (request.headers.get(self.AUTHORIZATION_HEADER) or
                  request.headers.get(self.AUTHORIZATION_HEADER.lower()))
@@ -23,17 +28,33 @@ class SanicTokenAuthentication(TokenAuthentication):
         if not token:
             token = request.args.get(self.keyword) or request.args.get(self.keyword.lower())
 
+        return token or None
+
+    def authenticate(self, request):
+        token = self.get_token(request)
         if not token:
             return None
 
         return self.authenticate_credentials(token)
 
+    async def authenticate_async(self, request):
+        """Authenticates the request without blocking the loop, valid tokens are cached."""
+        token = self.get_token(request)
+        if not token:
+            return None
+
+        authorization = tokens_cache.get(token)
+        if authorization is None:
+            authorization = await run_db(self.authenticate_credentials, token)
+            tokens_cache.set(token, authorization)
+        return authorization
+
 
 def authorized():
     def decorator(f):
         @wraps(f)
         async def decorated_function(request, *args, **kwargs):
-            authorization = SanicTokenAuthentication().authenticate(request)
+            authorization = await SanicTokenAuthentication().authenticate_async(request)
 
             if authorization is not None:
                 # the user is authorized.
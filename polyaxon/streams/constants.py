@@ -1,4 +1,20 @@
 SOCKET_SLEEP = 2
 MAX_RETRIES = 7
-RESOURCES_CHECK = 7
 CHECK_DELAY = 5
+LOGS_REPLAY_BUFFER = 1000
+LOGS_BATCH_SIZE = 500
+LOGS_FLUSH_INTERVAL = 0.05
+LOGS_SOCKET_QUEUE_SIZE = 100
+DB_EXECUTOR_WORKERS = 10
+PUBSUB_EXECUTOR_WORKERS = 50
+PUBSUB_TIMEOUT = 1
+STATUS_CACHE_TTL = SOCKET_SLEEP
+TOKEN_CACHE_TTL = 60
+
+
+class BackpressurePolicies(object):
+    DROP_OLDEST = 'drop_oldest'
+    DISCONNECT = 'disconnect'
+
+
+LOGS_BACKPRESSURE_POLICY = BackpressurePolicies.DROP_OLDEST
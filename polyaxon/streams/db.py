@@ -0,0 +1,76 @@
+import asyncio
+import functools
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+from streams.constants import DB_EXECUTOR_WORKERS, STATUS_CACHE_TTL
+
+_executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS)
+
+
+def _call_db(func, *args, **kwargs):
+    # Every executor thread has its own connection, stale connections are dropped
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_db(func, *args, **kwargs):
+    """Runs a blocking db call in a bounded executor, so that the loop only does socket I/O."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        _executor, functools.partial(_call_db, func, *args, **kwargs))
+
+
+class TTLCache(object):
+    """A small in memory cache whose values expire after `ttl` seconds."""
+
+    def __init__(self, ttl, maxsize=1000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._values = {}
+
+    def get(self, key, default=None):
+        value = self._values.get(key)
+        if value is None:
+            return default
+        expires_at, value = value
+        if expires_at < time.time():
+            self._values.pop(key, None)
+            return default
+        return value
+
+    def set(self, key, value):
+        if len(self._values) >= self.maxsize:
+            now = time.time()
+            self._values = {k: v for k, v in self._values.items() if v[0] >= now}
+            if len(self._values) >= self.maxsize:
+                self._values.pop(next(iter(self._values)))
+        self._values[key] = (time.time() + self.ttl, value)
+
+    def clear(self):
+        self._values = {}
+
+
+_MISSING = object()
+
+# Caches the last status of runs, so that all sockets of a run share a single query
+statuses_cache = TTLCache(ttl=STATUS_CACHE_TTL)
+
+
+def _get_last_status(model, run_id):
+    return model.objects.filter(id=run_id).values_list('status__status', flat=True).first()
+
+
+async def get_last_status(model, run_id):
+    key = '{}.{}'.format(model.__name__, run_id)
+    status = statuses_cache.get(key, _MISSING)
+    if status is _MISSING:
+        status = await run_db(_get_last_status, model=model, run_id=run_id)
+        statuses_cache.set(key, status)
+    return status
@@ -0,0 +1,39 @@
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from streams.constants import PUBSUB_EXECUTOR_WORKERS, PUBSUB_TIMEOUT
+
+_executor = ThreadPoolExecutor(max_workers=PUBSUB_EXECUTOR_WORKERS)
+
+
+class AsyncPubSub(object):
+    """Waits for the messages of a redis subscription without blocking the loop.
+
+    The blocking reads run in an executor, so that the loop is woken up by the messages
+    instead of polling the subscription.
+    """
+
+    def __init__(self, pubsub, timeout=PUBSUB_TIMEOUT):
+        self.pubsub = pubsub
+        self.timeout = timeout
+        self._future = None
+
+    async def get_messages(self):
+        """Waits up to `timeout` seconds for a message, returns all the received messages."""
+        self._future = _executor.submit(
+            functools.partial(self.pubsub.get_message, timeout=self.timeout))
+        message = await asyncio.wrap_future(self._future)
+        messages = []
+        while message:
+            messages.append(message)
+            message = self.pubsub.get_message()
+        return messages
+
+    def close(self):
+        # A read could still be running in the executor if the waiting task was cancelled
+        if self._future is not None and not self._future.done():
+            self._future.add_done_callback(lambda _: self.pubsub.close())
+        else:
+            self.pubsub.close()
@@ -1,40 +1,41 @@
-import asyncio
-
-from websockets import ConnectionClosed
-
 import auditor
 import conf
 
+from constants.jobs import JobLifeCycle
+from db.models.experiment_jobs import ExperimentJob
 from db.redis.to_stream import RedisToStream
 from event_manager.events.experiment_job import (
     EXPERIMENT_JOB_LOGS_VIEWED,
     EXPERIMENT_JOB_RESOURCES_VIEWED
 )
 from streams.authentication import authorized
-from streams.constants import CHECK_DELAY, RESOURCES_CHECK, SOCKET_SLEEP
+from streams.db import run_db
 from streams.logger import logger
 from streams.resources.logs import log_job
 from streams.resources.utils import get_error_message
 from streams.socket_manager import SocketManager
+from streams.streamers import get_resources_streamer
 from streams.validation.experiment_job import validate_experiment_job
 
 
 @authorized()
 async def experiment_job_resources(request, ws, username, project_name, experiment_id, job_id):
-    job, _, message = validate_experiment_job(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id,
-                                              job_id=job_id)
+    job, _, message = await run_db(validate_experiment_job,
+                                   request=request,
+                                   username=username,
+                                   project_name=project_name,
+                                   experiment_id=experiment_id,
+                                   job_id=job_id)
     if job is None:
         await ws.send(get_error_message(message))
         return
     job_uuid = job.uuid.hex
     job_name = '{}.{}'.format(job.role, job.id)
-    auditor.record(event_type=EXPERIMENT_JOB_RESOURCES_VIEWED,
-                   instance=job,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=EXPERIMENT_JOB_RESOURCES_VIEWED,
+                 instance=job,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     if not RedisToStream.is_monitored_job_resources(job_uuid=job_uuid):
         logger.info('Job resources with uuid `%s` is now being monitored', job_name)
@@ -55,54 +56,48 @@ async def experiment_job_resources(request, ws, username, project_name, experime
 
         logger.info('Quitting resources socket for job %s', job_name)
 
-    ws_manager.add_socket(ws)
-    should_check = 0
-    while True:
-        resources = RedisToStream.get_latest_job_resources(job=job_uuid, job_name=job_name)
-        should_check += 1
+    statuses_watcher = request.app.statuses_watcher
 
-        # After trying a couple of time, we must check the status of the job
-        if should_check > RESOURCES_CHECK:
-            job.refresh_from_db()
-            if job.is_done:
-                logger.info('removing all socket because the job `%s` is done', job_name)
-                ws_manager.ws = set([])
-                handle_job_disconnected_ws(ws)
-                return
-            else:
-                should_check -= CHECK_DELAY
+    async def check_done():
+        status = await statuses_watcher.get_status(model=ExperimentJob, run=job)
+        return JobLifeCycle.is_done(status)
 
-        if resources:
-            try:
-                await ws.send(resources)
-            except ConnectionClosed:
-                handle_job_disconnected_ws(ws)
-                return
-
-        # Just to check if connection closed
-        if ws._connection_lost:  # pylint:disable=protected-access
-            handle_job_disconnected_ws(ws)
-            return
-        await asyncio.sleep(SOCKET_SLEEP)
+    ws_manager.add_socket(ws)
+    streamer = get_resources_streamer(
+        streamers=request.app.resources_streamers,
+        channel=RedisToStream.get_job_resources_channel(job_uuid),
+        jobs=[{'uuid': job_uuid, 'name': job_name}],
+        ws_manager=ws_manager,
+        check_done=check_done,
+        aggregate=False)
+    await streamer.subscribe(ws)
+    statuses_watcher.watch(job_uuid)
+    try:
+        await streamer.wait(ws)
+    finally:
+        statuses_watcher.unwatch(job_uuid)
+    handle_job_disconnected_ws(ws)
 
 
 @authorized()
 async def experiment_job_logs_v2(request, ws, username, project_name, experiment_id, job_id):
-    job, _, message = validate_experiment_job(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id,
-                                              job_id=job_id)
+    job, _, message = await run_db(validate_experiment_job,
+                                   request=request,
+                                   username=username,
+                                   project_name=project_name,
+                                   experiment_id=experiment_id,
+                                   job_id=job_id)
     if job is None:
         await ws.send(get_error_message(message))
         return
 
     pod_id = job.pod_id
 
-    auditor.record(event_type=EXPERIMENT_JOB_LOGS_VIEWED,
-                   instance=job,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=EXPERIMENT_JOB_LOGS_VIEWED,
+                 instance=job,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     # Stream logs
     await log_job(request=request,
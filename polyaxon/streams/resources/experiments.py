@@ -1,35 +1,36 @@
-import asyncio
-
-from websockets import ConnectionClosed
-
 import auditor
 import conf
 
+from constants.experiments import ExperimentLifeCycle
+from db.models.experiments import Experiment
 from db.redis.to_stream import RedisToStream
 from event_manager.events.experiment import EXPERIMENT_LOGS_VIEWED, EXPERIMENT_RESOURCES_VIEWED
 from streams.authentication import authorized
-from streams.constants import CHECK_DELAY, RESOURCES_CHECK, SOCKET_SLEEP
+from streams.db import run_db
 from streams.logger import logger
 from streams.resources.logs import log_experiment
 from streams.resources.utils import get_error_message
 from streams.socket_manager import SocketManager
+from streams.streamers import get_resources_streamer
 from streams.validation.experiment import validate_experiment
 
 
 @authorized()
 async def experiment_resources(request, ws, username, project_name, experiment_id):
-    experiment, message = validate_experiment(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id)
+    experiment, message = await run_db(validate_experiment,
+                                       request=request,
+                                       username=username,
+                                       project_name=project_name,
+                                       experiment_id=experiment_id)
     if experiment is None:
         await ws.send(get_error_message(message))
         return
     experiment_uuid = experiment.uuid.hex
-    auditor.record(event_type=EXPERIMENT_RESOURCES_VIEWED,
-                   instance=experiment,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=EXPERIMENT_RESOURCES_VIEWED,
+                 instance=experiment,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     if not RedisToStream.is_monitored_experiment_resources(experiment_uuid=experiment_uuid):
         logger.info('Experiment resource with uuid `%s` is now being monitored', experiment_uuid)
@@ -50,58 +51,49 @@ async def experiment_resources(request, ws, username, project_name, experiment_i
 
         logger.info('Quitting resources socket for uuid %s', experiment_uuid)
 
+    statuses_watcher = request.app.statuses_watcher
+
+    async def check_done():
+        status = await statuses_watcher.get_status(model=Experiment, run=experiment)
+        return ExperimentLifeCycle.is_done(status)
+
     jobs = []
-    for job in experiment.jobs.values('uuid', 'role', 'id'):
+    for job in await run_db(list, experiment.jobs.values('uuid', 'role', 'id')):
         job['uuid'] = job['uuid'].hex
         job['name'] = '{}.{}'.format(job.pop('role'), job.pop('id'))
         jobs.append(job)
     ws_manager.add_socket(ws)
-    should_check = 0
-    while True:
-        resources = RedisToStream.get_latest_experiment_resources(jobs)
-        should_check += 1
-
-        # After trying a couple of time, we must check the status of the experiment
-        if should_check > RESOURCES_CHECK:
-            experiment.refresh_from_db()
-            if experiment.is_done:
-                logger.info(
-                    'removing all socket because the experiment `%s` is done', experiment_uuid)
-                ws_manager.ws = set([])
-                handle_experiment_disconnected_ws(ws)
-                return
-            else:
-                should_check -= CHECK_DELAY
-
-        if resources:
-            try:
-                await ws.send(resources)
-            except ConnectionClosed:
-                handle_experiment_disconnected_ws(ws)
-                return
-
-        # Just to check if connection closed
-        if ws._connection_lost:  # pylint:disable=protected-access
-            handle_experiment_disconnected_ws(ws)
-            return
-
-        await asyncio.sleep(SOCKET_SLEEP)
+    streamer = get_resources_streamer(
+        streamers=request.app.resources_streamers,
+        channel=RedisToStream.get_experiment_resources_channel(experiment_uuid),
+        jobs=jobs,
+        ws_manager=ws_manager,
+        check_done=check_done)
+    await streamer.subscribe(ws)
+    statuses_watcher.watch(experiment_uuid)
+    try:
+        await streamer.wait(ws)
+    finally:
+        statuses_watcher.unwatch(experiment_uuid)
+    handle_experiment_disconnected_ws(ws)
 
 
 @authorized()
 async def experiment_logs_v2(request, ws, username, project_name, experiment_id):
-    experiment, message = validate_experiment(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id)
+    experiment, message = await run_db(validate_experiment,
+                                       request=request,
+                                       username=username,
+                                       project_name=project_name,
+                                       experiment_id=experiment_id)
     if experiment is None:
         await ws.send(get_error_message(message))
         return
 
-    auditor.record(event_type=EXPERIMENT_LOGS_VIEWED,
-                   instance=experiment,
-                   actor_id=request.app.user.id,
-                   actor_name=request.app.user.username)
+    await run_db(auditor.record,
+                 event_type=EXPERIMENT_LOGS_VIEWED,
+                 instance=experiment,
+                 actor_id=request.app.user.id,
+                 actor_name=request.app.user.username)
 
     # Stream logs
     await log_experiment(request=request,
@@ -1,14 +1,39 @@
 import asyncio
-import json
 
 from kubernetes_asyncio import client, config
 
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
-from logs_handlers.log_queries.base import process_log_line
 from streams.constants import SOCKET_SLEEP
-from streams.resources.utils import get_status_message, notify, notify_ws, should_disconnect
+from streams.db import run_db
+from streams.resources.utils import get_status_message, notify_ws, should_disconnect
 from streams.socket_manager import SocketManager
+from streams.streamers import get_pod_logs_streamer
+
+
+async def stream_statuses(request, ws, ws_manager, run, lifecycle):
+    """Notifies the socket of the run's status transitions until it's running or done.
+
+    Returns the last status, or None if the socket is gone.
+    """
+    statuses_watcher = request.app.statuses_watcher
+    run_uuid = run.uuid.hex
+    statuses_watcher.watch(run_uuid)
+    try:
+        status = None
+        while status != lifecycle.RUNNING and not lifecycle.is_done(status):
+            last_status = await statuses_watcher.wait_for_status(model=run.__class__,
+                                                                 run=run,
+                                                                 last_status=status,
+                                                                 timeout=SOCKET_SLEEP)
+            if status != last_status:
+                status = last_status
+                await notify_ws(ws=ws, message=get_status_message(status))
+            if should_disconnect(ws=ws, ws_manager=ws_manager):
+                return None
+        return status
+    finally:
+        statuses_watcher.unwatch(run_uuid)
 
 
 async def log_job(request, ws, job, pod_id, namespace, container):
@@ -22,15 +47,13 @@ async def log_job(request, ws, job, pod_id, namespace, container):
     ws_manager.add_socket(ws)
 
     # Stream phase changes
-    status = None
-    while status != JobLifeCycle.RUNNING and not JobLifeCycle.is_done(status):
-        job.refresh_from_db()
-        if status != job.last_status:
-            status = job.last_status
-            await notify_ws(ws=ws, message=get_status_message(status))
-            if should_disconnect(ws=ws, ws_manager=ws_manager):
-                return
-        await asyncio.sleep(SOCKET_SLEEP)
+    status = await stream_statuses(request=request,
+                                   ws=ws,
+                                   ws_manager=ws_manager,
+                                   run=job,
+                                   lifecycle=JobLifeCycle)
+    if status is None:
+        return
 
     if JobLifeCycle.is_done(status):
         await notify_ws(ws=ws, message=get_status_message(status))
@@ -38,7 +61,8 @@ async def log_job(request, ws, job, pod_id, namespace, container):
 
     config.load_incluster_config()
     k8s_api = client.CoreV1Api()
-    await log_job_pod(k8s_api=k8s_api,
+    await log_job_pod(request=request,
+                      k8s_api=k8s_api,
                       ws=ws,
                       ws_manager=ws_manager,
                       pod_id=pod_id,
@@ -57,15 +81,13 @@ async def log_experiment(request, ws, experiment, namespace, container):
     ws_manager.add_socket(ws)
 
     # Stream phase changes
-    status = None
-    while status != ExperimentLifeCycle.RUNNING and not ExperimentLifeCycle.is_done(status):
-        experiment.refresh_from_db()
-        if status != experiment.last_status:
-            status = experiment.last_status
-            await notify_ws(ws=ws, message=get_status_message(status))
-            if should_disconnect(ws=ws, ws_manager=ws_manager):
-                return
-        await asyncio.sleep(SOCKET_SLEEP)
+    status = await stream_statuses(request=request,
+                                   ws=ws,
+                                   ws_manager=ws_manager,
+                                   run=experiment,
+                                   lifecycle=ExperimentLifeCycle)
+    if status is None:
+        return
 
     if ExperimentLifeCycle.is_done(status):
         await notify_ws(ws=ws, message=get_status_message(status))
@@ -74,10 +96,11 @@ async def log_experiment(request, ws, experiment, namespace, container):
     config.load_incluster_config()
     k8s_api = client.CoreV1Api()
     log_requests = []
-    for job in experiment.jobs.all():
+    for job in await run_db(list, experiment.jobs.all()):
         pod_id = job.pod_id
         log_requests.append(
-            log_job_pod(k8s_api=k8s_api,
+            log_job_pod(request=request,
+                        k8s_api=k8s_api,
                         ws=ws,
                         ws_manager=ws_manager,
                         pod_id=pod_id,
@@ -88,7 +111,8 @@ async def log_experiment(request, ws, experiment, namespace, container):
     await asyncio.wait(log_requests)
 
 
-async def log_job_pod(k8s_api,
+async def log_job_pod(request,
+                      k8s_api,
                       ws,
                       ws_manager,
                       pod_id,
@@ -96,29 +120,10 @@ async def log_job_pod(k8s_api,
                       namespace,
                       task_type=None,
                       task_idx=None):
-    resp = await k8s_api.read_namespaced_pod_log(pod_id,
-                                                 namespace,
-                                                 container=container,
-                                                 follow=True,
-                                                 _preload_content=False,
-                                                 timestamps=True)
-    should_quite = False
-    while True:
-        try:
-            log_line = await resp.content.readline()
-        except asyncio.TimeoutError:
-            log_line = None
-        if not log_line:
-            break
-        log_line = process_log_line(log_line=log_line.decode('utf-8'),
-                                    task_type=task_type,
-                                    task_idx=task_idx)
-        await notify(ws_manager, json.dumps({'log_lines': log_line}))
-
-        if should_disconnect(ws=ws, ws_manager=ws_manager):
-            should_quite = True
-
-        if should_quite:
-            return
-
-        await asyncio.sleep(0.1)
+    streamer = get_pod_logs_streamer(streamers=request.app.pod_logs_streamers,
+                                     k8s_api=k8s_api,
+                                     pod_id=pod_id,
+                                     namespace=namespace,
+                                     container=container)
+    streamer.subscribe(ws=ws, ws_manager=ws_manager, task_type=task_type, task_idx=task_idx)
+    await streamer.wait(ws=ws, ws_manager=ws_manager)
@@ -0,0 +1,119 @@
+import asyncio
+
+from db.redis.statuses import RedisStatuses
+from streams.db import get_last_status, run_db
+from streams.logger import logger
+from streams.pubsub import AsyncPubSub
+
+
+class StatusesWatcher(object):
+    """Listens to the status transitions of all runs and wakes up the sockets waiting on them.
+
+    A single redis subscription is shared by all the sockets of the process,
+    and the last status of every watched run is kept in memory.
+    The db is only queried for runs whose status was not published yet.
+    """
+
+    def __init__(self):
+        # Maps every watched run uuid to its number of watchers
+        self.watched = {}
+        self.statuses = {}
+        self._events = {}
+        self._task = None
+
+    @property
+    def is_running(self):
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.is_running:
+            logger.info('Starting statuses watcher')
+            self._task = asyncio.ensure_future(self._listen())
+
+    def stop(self):
+        if self.is_running:
+            logger.info('Stopping statuses watcher')
+            self._task.cancel()
+        self._task = None
+
+    def watch(self, run_uuid):
+        self.watched[run_uuid] = self.watched.get(run_uuid, 0) + 1
+        self.start()
+
+    def unwatch(self, run_uuid):
+        count = self.watched.get(run_uuid, 0) - 1
+        if count > 0:
+            self.watched[run_uuid] = count
+            return
+        self.watched.pop(run_uuid, None)
+        self.statuses.pop(run_uuid, None)
+        event = self._events.pop(run_uuid, None)
+        if event:
+            event.set()
+        if not self.watched:
+            self.stop()
+
+    def set_status(self, run_uuid, status):
+        if run_uuid not in self.watched or self.statuses.get(run_uuid) == status:
+            return
+        self.statuses[run_uuid] = status
+        event = self._events.pop(run_uuid, None)
+        if event:
+            event.set()
+
+    async def get_status(self, model, run):
+        """Returns the last status of a watched run."""
+        run_uuid = run.uuid.hex
+        if run_uuid not in self.statuses:
+            statuses = await run_db(RedisStatuses.get_statuses, [run_uuid])
+            status = statuses.get(run_uuid)
+            if status is None:
+                # Not published yet, e.g. the run did not transition since the last deploy
+                status = await get_last_status(model=model, run_id=run.id)
+            if run_uuid in self.watched and run_uuid not in self.statuses:
+                self.statuses[run_uuid] = status
+            return status
+        return self.statuses[run_uuid]
+
+    async def wait_for_status(self, model, run, last_status=None, timeout=None):
+        """Waits until the run's status differs from `last_status`, or until the timeout.
+
+        Returns the current status of the run.
+        """
+        status = await self.get_status(model=model, run=run)
+        if status != last_status:
+            return status
+
+        run_uuid = run.uuid.hex
+        event = self._events.get(run_uuid)
+        if event is None:
+            event = asyncio.Event()
+            self._events[run_uuid] = event
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.statuses.get(run_uuid, status)
+
+    async def _resync(self):
+        """Fetches the statuses published while the watcher was not subscribed."""
+        statuses = await run_db(RedisStatuses.get_statuses, list(self.watched.keys()))
+        for run_uuid, status in statuses.items():
+            if status is not None:
+                self.set_status(run_uuid=run_uuid, status=status)
+
+    async def _listen(self):
+        pubsub = AsyncPubSub(RedisStatuses.subscribe())
+        try:
+            await self._resync()
+            while self.watched:
+                for message in await pubsub.get_messages():
+                    channel = message['channel']
+                    if isinstance(channel, bytes):
+                        channel = channel.decode('utf-8')
+                    status = message['data']
+                    if isinstance(status, bytes):
+                        status = status.decode('utf-8')
+                    self.set_status(run_uuid=RedisStatuses.get_run_uuid(channel), status=status)
+        finally:
+            pubsub.close()
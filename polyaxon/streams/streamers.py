@@ -0,0 +1,366 @@
+import asyncio
+import json
+
+from collections import OrderedDict, deque
+
+from websockets import ConnectionClosed
+
+from db.redis.to_stream import RedisToStream
+from logs_handlers.log_queries.base import process_log_line
+from streams.constants import (
+    LOGS_BACKPRESSURE_POLICY,
+    LOGS_BATCH_SIZE,
+    LOGS_FLUSH_INTERVAL,
+    LOGS_REPLAY_BUFFER,
+    LOGS_SOCKET_QUEUE_SIZE,
+    SOCKET_SLEEP,
+    BackpressurePolicies
+)
+from streams.logger import logger
+from streams.pubsub import AsyncPubSub
+from streams.resources.utils import notify, notify_ws, should_disconnect
+
+
+class SocketSender(object):
+    """Sends frames to a single socket from a bounded queue.
+
+    A slow socket never blocks the other subscribers of a streamer:
+    once its queue is full, the backpressure policy either drops the oldest frames
+    or disconnects the socket.
+    """
+
+    def __init__(self, ws, ws_manager, queue_size=LOGS_SOCKET_QUEUE_SIZE,
+                 policy=LOGS_BACKPRESSURE_POLICY):
+        self.ws = ws
+        self.ws_manager = ws_manager
+        self.queue_size = queue_size
+        self.policy = policy
+        self.queue = deque()
+        self.n_dropped = 0
+        self._has_frames = asyncio.Event()
+        self._closing = False
+        self._task = asyncio.ensure_future(self._send())
+
+    @property
+    def is_done(self):
+        return self._task.done()
+
+    def put(self, message):
+        if self._closing:
+            return
+        if len(self.queue) >= self.queue_size:
+            if self.policy == BackpressurePolicies.DISCONNECT:
+                logger.info('Disconnecting slow socket, %s frames pending', len(self.queue))
+                self.disconnect()
+                return
+            self.queue.popleft()
+            self.n_dropped += 1
+        self.queue.append(message)
+        self._has_frames.set()
+
+    def cancel(self):
+        self._closing = True
+        self.queue.clear()
+        self._task.cancel()
+
+    def disconnect(self):
+        self.cancel()
+        self.ws_manager.remove_sockets({self.ws, })
+        asyncio.ensure_future(self.ws.close())
+
+    async def close(self, timeout=SOCKET_SLEEP):
+        """Stops the sender once the pending frames are sent or the timeout expires."""
+        self._closing = True
+        self._has_frames.set()
+        if not self.is_done:
+            await asyncio.wait([self._task], timeout=timeout)
+        self._task.cancel()
+
+    async def _send(self):
+        while True:
+            await self._has_frames.wait()
+            while self.queue:
+                message = self.queue.popleft()
+                try:
+                    await self.ws.send(message)
+                except ConnectionClosed:
+                    self.ws_manager.remove_sockets({self.ws, })
+                    return
+            if self._closing:
+                return
+            self._has_frames.clear()
+
+
+class PodLogsStreamer(object):
+    """Follows the logs of a (pod, container) and broadcasts them to all subscribed sockets.
+
+    A single k8s log follow is opened when the first socket subscribes,
+    and it is torn down once the last socket leaves.
+    Lines are coalesced into frames that are flushed every `LOGS_FLUSH_INTERVAL` seconds
+    or as soon as `LOGS_BATCH_SIZE` lines are pending.
+    The most recent lines are kept in a bounded buffer to be replayed to late subscribers.
+    """
+
+    def __init__(self,
+                 k8s_api,
+                 pod_id,
+                 namespace,
+                 container,
+                 buffer_size=LOGS_REPLAY_BUFFER,
+                 batch_size=LOGS_BATCH_SIZE,
+                 flush_interval=LOGS_FLUSH_INTERVAL,
+                 on_done=None):
+        self.k8s_api = k8s_api
+        self.pod_id = pod_id
+        self.namespace = namespace
+        self.container = container
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = deque(maxlen=buffer_size)
+        # Maps every subscribed socket manager to its (task_type, task_idx)
+        self.subscribers = {}
+        self.senders = {}
+        self._pending = []
+        self._on_done = on_done
+        self._task = None
+
+    @staticmethod
+    def get_key(pod_id, container):
+        return '{}.{}'.format(pod_id, container)
+
+    @property
+    def key(self):
+        return self.get_key(pod_id=self.pod_id, container=self.container)
+
+    @property
+    def is_done(self):
+        return self._task is not None and self._task.done()
+
+    @property
+    def has_sockets(self):
+        return any(ws_manager.ws for ws_manager in self.subscribers)
+
+    @staticmethod
+    def get_message(log_lines, task_type=None, task_idx=None):
+        log_lines = [process_log_line(log_line=log_line, task_type=task_type, task_idx=task_idx)
+                     for log_line in log_lines]
+        return json.dumps({'log_lines': '\n'.join(log_lines)})
+
+    def start(self):
+        if self._task is None:
+            logger.info('Starting logs streamer for `%s`', self.key)
+            self._task = asyncio.ensure_future(self._follow())
+            if self._on_done:
+                self._task.add_done_callback(lambda _: self._on_done(self))
+
+    def stop(self):
+        if self._task is not None and not self._task.done():
+            logger.info('Stopping logs streamer for `%s`', self.key)
+            self._task.cancel()
+        for sender in self.senders.values():
+            sender.cancel()
+        self.senders = {}
+
+    def get_sender(self, ws, ws_manager):
+        sender = self.senders.get(ws)
+        if sender is None or sender.is_done:
+            sender = SocketSender(ws=ws, ws_manager=ws_manager)
+            self.senders[ws] = sender
+        return sender
+
+    def subscribe(self, ws, ws_manager, task_type=None, task_idx=None):
+        self.subscribers[ws_manager] = (task_type, task_idx)
+        sender = self.get_sender(ws=ws, ws_manager=ws_manager)
+        log_lines = list(self.buffer)
+        for i in range(0, len(log_lines), self.batch_size):
+            sender.put(self.get_message(log_lines[i:i + self.batch_size], task_type, task_idx))
+        self.start()
+
+    async def wait(self, ws, ws_manager):
+        """Blocks the socket's handler until the streamer is done or the socket is gone."""
+        while not self.is_done:
+            if ws not in ws_manager.ws or should_disconnect(ws=ws, ws_manager=ws_manager):
+                break
+            await asyncio.wait([self._task], timeout=SOCKET_SLEEP)
+
+        sender = self.senders.pop(ws, None)
+        if sender:
+            await sender.close()
+        if not self.has_sockets:
+            self.stop()
+
+    def flush(self):
+        if not self._pending:
+            return
+        log_lines = self._pending
+        self._pending = []
+        self.senders = {ws: sender for ws, sender in self.senders.items() if not sender.is_done}
+        for ws_manager, (task_type, task_idx) in list(self.subscribers.items()):
+            if not ws_manager.ws:
+                continue
+            message = self.get_message(log_lines, task_type, task_idx)
+            for ws in list(ws_manager.ws):
+                self.get_sender(ws=ws, ws_manager=ws_manager).put(message)
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    async def _follow(self):
+        resp = await self.k8s_api.read_namespaced_pod_log(self.pod_id,
+                                                          self.namespace,
+                                                          container=self.container,
+                                                          follow=True,
+                                                          _preload_content=False,
+                                                          timestamps=True)
+        flusher = asyncio.ensure_future(self._flush_periodically())
+        try:
+            while self.has_sockets:
+                try:
+                    log_line = await resp.content.readline()
+                except asyncio.TimeoutError:
+                    log_line = None
+                if not log_line:
+                    break
+                log_line = log_line.decode('utf-8')
+                self.buffer.append(log_line)
+                self._pending.append(log_line)
+                if len(self._pending) >= self.batch_size:
+                    self.flush()
+                    # Yield to the senders so that a fast producer does not starve them
+                    await asyncio.sleep(0)
+            self.flush()
+        finally:
+            flusher.cancel()
+            resp.release()
+
+
+def get_pod_logs_streamer(streamers, k8s_api, pod_id, namespace, container):
+    """Returns the running streamer for the (pod, container) or registers a new one."""
+    key = PodLogsStreamer.get_key(pod_id=pod_id, container=container)
+    streamer = streamers.get(key)
+    if streamer is not None and not streamer.is_done:
+        return streamer
+
+    def remove_streamer(done_streamer):
+        if streamers.get(key) is done_streamer:
+            streamers.pop(key, None)
+
+    streamer = PodLogsStreamer(k8s_api=k8s_api,
+                               pod_id=pod_id,
+                               namespace=namespace,
+                               container=container,
+                               on_done=remove_streamer)
+    streamers[key] = streamer
+    return streamer
+
+
+class ResourcesStreamer(object):
+    """Subscribes once to a run's resources channel and fans out the stats to all its sockets.
+
+    The latest stats of every job are kept in memory, so that new sockets
+    get the current snapshot without hitting redis.
+    """
+
+    def __init__(self, channel, jobs, ws_manager, check_done, aggregate=True, on_done=None):
+        self.channel = channel
+        # Maps every job uuid to its display name
+        self.jobs = {job['uuid']: job['name'] for job in jobs}
+        self.ws_manager = ws_manager
+        self.check_done = check_done
+        self.aggregate = aggregate
+        self.resources = OrderedDict()
+        self._on_done = on_done
+        self._task = None
+
+    @property
+    def is_done(self):
+        return self._task is not None and self._task.done()
+
+    def get_message(self):
+        if not self.resources:
+            return None
+        if self.aggregate:
+            return json.dumps(list(self.resources.values()))
+        return json.dumps(list(self.resources.values())[-1])
+
+    def update(self, payload):
+        if isinstance(payload, bytes):
+            payload = payload.decode('utf-8')
+        payload = json.loads(payload)
+        job_uuid = payload['job_uuid']
+        if job_uuid not in self.jobs:
+            return
+        payload['job_name'] = self.jobs[job_uuid]
+        self.resources[job_uuid] = payload
+
+    def start(self):
+        if self._task is None:
+            logger.info('Starting resources streamer for `%s`', self.channel)
+            self._task = asyncio.ensure_future(self._subscribe())
+            if self._on_done:
+                self._task.add_done_callback(lambda _: self._on_done(self))
+
+    def stop(self):
+        if self._task is not None and not self._task.done():
+            logger.info('Stopping resources streamer for `%s`', self.channel)
+            self._task.cancel()
+
+    async def subscribe(self, ws):
+        message = self.get_message()
+        if message:
+            await notify_ws(ws=ws, message=message)
+        self.start()
+
+    async def wait(self, ws):
+        """Blocks the socket's handler until the streamer is done or the socket is gone."""
+        while not self.is_done:
+            if ws not in self.ws_manager.ws or should_disconnect(ws=ws, ws_manager=self.ws_manager):
+                break
+            await asyncio.wait([self._task], timeout=SOCKET_SLEEP)
+
+        if not self.ws_manager.ws:
+            self.stop()
+
+    async def _subscribe(self):
+        pubsub = AsyncPubSub(RedisToStream.subscribe(self.channel))
+        for payload in RedisToStream.get_latest_experiment_resources(
+                jobs=[{'uuid': job_uuid, 'name': name} for job_uuid, name in self.jobs.items()],
+                as_json=True):
+            self.resources[payload['job_uuid']] = payload
+        try:
+            while self.ws_manager.ws:
+                messages = await pubsub.get_messages()
+                for message in messages:
+                    self.update(message['data'])
+                if messages:
+                    await notify(self.ws_manager, self.get_message())
+
+                # The run's status is pushed by the statuses watcher, checking it is cheap
+                if await self.check_done():
+                    logger.info('removing all sockets because `%s` is done', self.channel)
+                    self.ws_manager.ws = set([])
+                    return
+        finally:
+            pubsub.close()
+
+
+def get_resources_streamer(streamers, channel, jobs, ws_manager, check_done, aggregate=True):
+    """Returns the running streamer for the channel or registers a new one."""
+    streamer = streamers.get(channel)
+    if streamer is not None and not streamer.is_done and streamer.ws_manager is ws_manager:
+        return streamer
+
+    def remove_streamer(done_streamer):
+        if streamers.get(channel) is done_streamer:
+            streamers.pop(channel, None)
+
+    streamer = ResourcesStreamer(channel=channel,
+                                 jobs=jobs,
+                                 ws_manager=ws_manager,
+                                 check_done=check_done,
+                                 aggregate=aggregate,
+                                 on_done=remove_streamer)
+    streamers[channel] = streamer
+    return streamer
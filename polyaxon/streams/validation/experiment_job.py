@@ -12,7 +12,8 @@ def validate_experiment_job(request, username, project_name, experiment_id, job_
     if experiment is None:
         return None, None, message
     try:
-        job = ExperimentJob.objects.get(experiment=experiment, id=job_id)
+        job = ExperimentJob.objects.select_related('experiment').get(experiment=experiment,
+                                                                    id=job_id)
     except (ExperimentJob.DoesNotExist, ValidationError):
         return None, None, 'Experiment was not found'
     if job.is_done:
@@ -18,6 +18,7 @@ tracker.subscribe(experiment_group.ExperimentGroupExperimentsViewedEvent)
 tracker.subscribe(experiment_group.ExperimentGroupStatusesViewedEvent)
 tracker.subscribe(experiment_group.ExperimentGroupMetricsViewedEvent)
 tracker.subscribe(experiment_group.ExperimentGroupIterationEvent)
+tracker.subscribe(experiment_group.ExperimentGroupExperimentsCreatedEvent)
 tracker.subscribe(experiment_group.ExperimentGroupRandomEvent)
 tracker.subscribe(experiment_group.ExperimentGroupGridEvent)
 tracker.subscribe(experiment_group.ExperimentGroupHyperbandEvent)
@@ -1,8 +1,12 @@
 # pylint:disable=ungrouped-imports
 import uuid
 
+from unittest.mock import patch
+
 import pytest
 
+from django.db import IntegrityError
+
 import activitylogs
 
 from db.models.activitylogs import ActivityLog
@@ -46,3 +50,51 @@ class ActivityLogsTest(BaseTest):
         assert activity.event_type == EXPERIMENT_DELETED_TRIGGERED
         assert activity.content_object == self.experiment
         assert activity.actor == self.admin
+
+    def test_record_events_creates_activities(self):
+        event = activitylogs.record(ref_id=uuid.uuid4(),
+                                    event_type=USER_ACTIVATED,
+                                    instance=self.user,
+                                    actor_id=self.admin.id,
+                                    actor_name=self.admin.username)
+        assert ActivityLog.objects.count() == 1
+
+        event_data = event.serialize(dumps=False, include_instance_info=True)
+        activitylogs.record_events(events_data=[event_data, event_data])
+
+        assert ActivityLog.objects.count() == 3
+        activity = ActivityLog.objects.last()
+        assert activity.event_type == USER_ACTIVATED
+        assert activity.content_object == self.user
+        assert activity.actor == self.admin
+
+    def test_record_events_skips_only_the_failing_activities(self):
+        event = activitylogs.record(ref_id=uuid.uuid4(),
+                                    event_type=USER_ACTIVATED,
+                                    instance=self.user,
+                                    actor_id=self.admin.id,
+                                    actor_name=self.admin.username)
+        assert ActivityLog.objects.count() == 1
+
+        event_data = event.serialize(dumps=False, include_instance_info=True)
+        with patch.object(ActivityLog.objects, 'bulk_create', side_effect=IntegrityError):
+            activitylogs.record_events(events_data=[event_data, event_data])
+
+        # The activities are created one by one
+        assert ActivityLog.objects.count() == 3
+
+        save = ActivityLog.save
+        calls = []
+
+        def save_or_fail(activity_log, *args, **kwargs):
+            calls.append(activity_log)
+            if len(calls) == 1:
+                raise IntegrityError
+            save(activity_log, *args, **kwargs)
+
+        with patch.object(ActivityLog.objects, 'bulk_create', side_effect=IntegrityError):
+            with patch.object(ActivityLog, 'save', autospec=True, side_effect=save_or_fail):
+                activitylogs.record_events(events_data=[event_data, event_data])
+
+        assert len(calls) == 2
+        assert ActivityLog.objects.count() == 4
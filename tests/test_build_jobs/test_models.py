@@ -12,6 +12,7 @@ from factories.factory_code_reference import CodeReferenceFactory
 from factories.factory_experiments import ExperimentFactory
 from factories.factory_plugins import NotebookJobFactory
 from factories.factory_projects import ProjectFactory
+from libs.builds import get_build_content_hash
 from tests.utils import BaseTest
 
 
@@ -45,6 +46,25 @@ class TestBuildJobModels(BaseTest):
         job.refresh_from_db()
         assert updated_at < job.updated_at
 
+    def test_build_job_content_hash(self):
+        build_job, _ = BuildJob.create(
+            user=self.project.user,
+            project=self.project,
+            config={'image': 'my_image:test'},
+            code_reference=self.code_reference)
+        assert build_job.content_hash == get_build_content_hash(
+            config=build_job.config,
+            code_reference_id=self.code_reference.id)
+
+        # Another code reference results in another build job
+        new_build_job, rebuild = BuildJob.create(
+            user=self.project.user,
+            project=self.project,
+            config={'image': 'my_image:test'},
+            code_reference=CodeReferenceFactory())
+        assert rebuild is True
+        assert new_build_job.content_hash != build_job.content_hash
+
     def test_create_build_job_from_experiment(self):
         assert BuildJobStatus.objects.count() == 0
         experiment = ExperimentFactory(project=self.project)
@@ -1,5 +1,7 @@
 import pytest
 
+from mock import patch
+
 from crons.tasks.deletion import (
     delete_archived_build_jobs,
     delete_archived_experiment_groups,
@@ -23,6 +25,7 @@ from factories.factory_jobs import JobFactory
 from factories.factory_plugins import NotebookJobFactory, TensorboardJobFactory
 from factories.factory_projects import ProjectFactory
 from polyaxon.config_settings import CleaningIntervals
+from scheduler.deletion import delete_in_chunks
 from tests.utils import BaseTest
 
 
@@ -145,3 +148,64 @@ class TestDeletionCrons(BaseTest):
 
         # Although the other entity is archived it's not deleted because of project1
         assert TensorboardJob.all.count() == 1
+
+    def test_delete_in_chunks_schedules_bulk_storage_deletions(self):
+        jobs = [JobFactory() for _ in range(3)]
+        for job in jobs:
+            job.archive()
+
+        with patch('scheduler.tasks.storage.stores_schedule_outputs_deletion.apply_async') as \
+                outputs_mock:
+            with patch('scheduler.tasks.storage.stores_schedule_bulk_outputs_deletion.'
+                       'apply_async') as bulk_outputs_mock:
+                with patch('scheduler.tasks.storage.stores_schedule_bulk_logs_deletion.'
+                           'apply_async') as bulk_logs_mock:
+                    num_deleted = delete_in_chunks(model=Job,
+                                                   ids=[job.id for job in jobs],
+                                                   chunk_size=2)
+
+        assert num_deleted == 3
+        assert Job.all.count() == 0
+        assert outputs_mock.call_count == 0
+        # One bulk deletion per chunk
+        assert bulk_outputs_mock.call_count == 2
+        assert bulk_logs_mock.call_count == 2
+        subpaths = [subpath
+                    for call in bulk_outputs_mock.call_args_list
+                    for subpath in call[0][1]['subpaths']]
+        assert sorted(subpaths) == sorted(job.subpath for job in jobs)
+
+    def test_delete_in_chunks_keeps_restored_instances(self):
+        jobs = [JobFactory() for _ in range(3)]
+        for job in jobs:
+            job.archive()
+        jobs[0].restore()
+
+        num_deleted = delete_in_chunks(model=Job, ids=[job.id for job in jobs], chunk_size=2)
+
+        assert num_deleted == 2
+        assert list(Job.all.values_list('id', flat=True)) == [jobs[0].id]
+
+    def test_delete_in_chunks_deletes_children_in_chunks(self):
+        project = ProjectFactory()
+        group = ExperimentGroupFactory(project=project)
+        for _ in range(3):
+            ExperimentFactory(project=project, experiment_group=group)
+        JobFactory(project=project)
+        project.archive()
+
+        with patch('scheduler.deletion.delete_in_chunks',
+                   wraps=delete_in_chunks) as delete_mock:
+            delete_in_chunks(model=Project,
+                             ids=[project.id],
+                             chunk_size=2,
+                             children=[(Experiment, 'project'),
+                                       (ExperimentGroup, 'project'),
+                                       (Job, 'project')])
+
+        assert [call[1]['model'] for call in delete_mock.call_args_list] == [
+            Experiment, ExperimentGroup, Job]
+        assert Project.all.count() == 0
+        assert ExperimentGroup.all.count() == 0
+        assert Experiment.all.count() == 0
+        assert Job.all.count() == 0
@@ -0,0 +1,32 @@
+import pytest
+
+from constants.experiment_groups import ExperimentGroupLifeCycle
+from constants.experiments import ExperimentLifeCycle
+from crons.tasks.experiment_groups import experiment_groups_sync_experiments_counts
+from db.models.experiment_groups import ExperimentGroup
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from factories.factory_experiments import ExperimentFactory
+from tests.utils import BaseTest
+
+
+@pytest.mark.crons_mark
+class TestExperimentGroupsCrons(BaseTest):
+    def test_sync_experiments_counts(self):
+        experiment_group1 = ExperimentGroupFactory()
+        ExperimentFactory(experiment_group=experiment_group1)
+        ExperimentFactory(experiment_group=experiment_group1)
+        experiment_group2 = ExperimentGroupFactory()
+        ExperimentFactory(experiment_group=experiment_group2)
+        experiment_group2.set_status(ExperimentGroupLifeCycle.RUNNING)
+        experiment_group2.set_status(ExperimentGroupLifeCycle.DONE)
+
+        # Drifted counts
+        ExperimentGroup.objects.update(experiments_counts={ExperimentLifeCycle.RUNNING: 3})
+
+        experiment_groups_sync_experiments_counts()
+
+        experiment_group1.refresh_from_db()
+        assert experiment_group1.experiments_counts == {ExperimentLifeCycle.CREATED: 2}
+        # Done groups are not synced
+        experiment_group2.refresh_from_db()
+        assert experiment_group2.experiments_counts == {ExperimentLifeCycle.RUNNING: 3}
@@ -5,6 +5,7 @@ from mock import patch
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
 from crons.tasks.heartbeats import heartbeat_builds, heartbeat_experiments, heartbeat_jobs
+from db.redis.heartbeat import RedisHeartBeat
 from factories.factory_build_jobs import BuildJobFactory, BuildJobStatusFactory
 from factories.factory_experiments import ExperimentFactory, ExperimentStatusFactory
 from factories.factory_jobs import JobFactory, JobStatusFactory
@@ -60,3 +61,34 @@ class TestHeartBeatCrons(BaseTest):
             heartbeat_builds()
 
         assert mock_fct.call_count == 1
+
+    def test_heartbeat_only_checks_runs_without_heartbeat(self):
+        experiment1 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment1, status=ExperimentLifeCycle.RUNNING)
+        experiment2 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment2, status=ExperimentLifeCycle.RUNNING)
+        RedisHeartBeat.experiment_ping(experiment_id=experiment1.id)
+
+        with patch('scheduler.tasks.experiments'
+                   '.experiments_check_heartbeat.apply_async') as mock_fct:
+            heartbeat_experiments()
+
+        assert mock_fct.call_count == 1
+        assert mock_fct.call_args[0][1] == {'experiment_id': experiment2.id}
+
+        job = JobFactory()
+        JobStatusFactory(job=job, status=JobLifeCycle.RUNNING)
+        RedisHeartBeat.job_ping(job_id=job.id)
+        build = BuildJobFactory()
+        BuildJobStatusFactory(job=build, status=JobLifeCycle.RUNNING)
+        RedisHeartBeat.build_ping(build_id=build.id)
+
+        with patch('scheduler.tasks.jobs.jobs_check_heartbeat.apply_async') as mock_fct:
+            heartbeat_jobs()
+
+        assert mock_fct.call_count == 0
+
+        with patch('scheduler.tasks.build_jobs.build_jobs_check_heartbeat.apply_async') as mock_fct:
+            heartbeat_builds()
+
+        assert mock_fct.call_count == 0
@@ -77,3 +77,17 @@ class TestEventService(BaseTest):
         assert event.datetime is not None
         assert event.data['dummy_attr'] == dummy_instance.dummy_attr
         assert event.data['new_attr'] == 'new_attr'
+
+    def test_record_events(self):
+        dummy_event = DummyEvent.from_instance(DummyObject(dummy_attr='test1'))
+        events_data = [dummy_event.serialize(dumps=False), dummy_event.serialize(dumps=False)]
+
+        # The service's manager did not subscribe to the event yet
+        assert self.service.record_events(events_data=events_data) == []
+
+        # Subscribe
+        self.service.event_manager.subscribe(DummyEvent)
+        self.service.record_events(events_data=events_data)
+
+        assert len(self.service.events) == 2
+        assert self.service.events[0].data['dummy_attr'] == 'test1'
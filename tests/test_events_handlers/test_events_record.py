@@ -2,7 +2,12 @@ from unittest.mock import patch
 
 import pytest
 
-from events_handlers.tasks.record import events_log, events_notify, events_track
+from events_handlers.tasks.record import (
+    events_flush_buffer,
+    events_log,
+    events_notify,
+    events_track
+)
 from tests.utils import BaseTest
 
 
@@ -20,8 +25,20 @@ class BaseTestEventsHandling(BaseTest):
 
         self.assertEqual(mock_fct.call_count, 1)
 
+    def test_events_log_accepts_a_single_event(self):
+        with patch('auditor.log') as mock_fct:
+            events_log(event={'type': 'foo'})
+
+        assert mock_fct.call_args[0][0] == [{'type': 'foo'}]
+
     def test_events_track(self):
         with patch('auditor.track') as mock_fct:
             events_track(None)
 
         self.assertEqual(mock_fct.call_count, 1)
+
+    def test_events_flush_buffer(self):
+        with patch('auditor.flush') as mock_fct:
+            events_flush_buffer()
+
+        self.assertEqual(mock_fct.call_count, 1)
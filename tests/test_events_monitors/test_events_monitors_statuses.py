@@ -21,9 +21,13 @@ from factories.factory_plugins import NotebookJobFactory, TensorboardJobFactory
 from factories.factory_projects import ProjectFactory
 from k8s_events_handlers.tasks.statuses import (
     k8s_events_handle_build_job_statuses,
+    k8s_events_handle_build_job_statuses_batch,
     k8s_events_handle_experiment_job_statuses,
+    k8s_events_handle_experiment_job_statuses_batch,
     k8s_events_handle_job_statuses,
-    k8s_events_handle_plugin_job_statuses
+    k8s_events_handle_job_statuses_batch,
+    k8s_events_handle_plugin_job_statuses,
+    k8s_events_handle_plugin_job_statuses_batch
 )
 from monitor_statuses.jobs import get_job_state
 from tests.fixtures import (
@@ -48,6 +52,7 @@ class TestEventsBaseJobsStatusesHandling(BaseTest):
     CONTAINER_NAME = None
     STATUS_MODEL = None
     STATUS_HANDLER = None
+    STATUS_BATCH_HANDLER = None
 
     def get_job_object(self, job_state):
         raise NotImplemented  # noqa
@@ -95,6 +100,28 @@ class TestEventsBaseJobsStatusesHandling(BaseTest):
         statuses = self.STATUS_MODEL.objects.filter(job=job).values_list('status', flat=True)
         assert set(statuses) == {JobLifeCycle.CREATED, JobLifeCycle.FAILED}
 
+    def test_handle_k8s_events_job_statuses_batch(self):
+        assert self.STATUS_MODEL.objects.count() == 0
+        job_state = get_job_state(
+            event_type=self.EVENT_WITH_CONDITIONS['type'],  # pylint:disable=unsubscriptable-object
+            event=self.EVENT_WITH_CONDITIONS['object'],  # pylint:disable=unsubscriptable-object
+            created_at=timezone.now() + datetime.timedelta(days=1),
+            job_container_names=(self.CONTAINER_NAME,),
+            experiment_type_label=conf.get('TYPE_LABELS_RUNNER'))
+
+        # No job yet
+        self.STATUS_BATCH_HANDLER([job_state.to_dict()])  # pylint:disable=not-callable
+        assert self.STATUS_MODEL.objects.count() == 0
+
+        job = self.get_job_object(job_state)
+
+        # The job is done after the first status, the second one is ignored
+        self.STATUS_BATCH_HANDLER(  # pylint:disable=not-callable
+            [job_state.to_dict(), job_state.to_dict()])
+        assert self.STATUS_MODEL.objects.count() == 2
+        statuses = self.STATUS_MODEL.objects.filter(job=job).values_list('status', flat=True)
+        assert set(statuses) == {JobLifeCycle.CREATED, JobLifeCycle.FAILED}
+
 
 @pytest.mark.monitors_mark
 class TestEventsExperimentJobsStatusesHandling(TestEventsBaseJobsStatusesHandling):
@@ -103,6 +130,7 @@ class TestEventsExperimentJobsStatusesHandling(TestEventsBaseJobsStatusesHandlin
     CONTAINER_NAME = conf.get('CONTAINER_NAME_EXPERIMENT_JOB')
     STATUS_MODEL = ExperimentJobStatus
     STATUS_HANDLER = k8s_events_handle_experiment_job_statuses
+    STATUS_BATCH_HANDLER = k8s_events_handle_experiment_job_statuses_batch
 
     def get_job_object(self, job_state):
         job_uuid = job_state.details.labels.job_uuid.hex
@@ -116,6 +144,7 @@ class TestEventsJobsStatusesHandling(TestEventsBaseJobsStatusesHandling):
     CONTAINER_NAME = conf.get('CONTAINER_NAME_JOB')
     STATUS_MODEL = JobStatus
     STATUS_HANDLER = k8s_events_handle_job_statuses
+    STATUS_BATCH_HANDLER = k8s_events_handle_job_statuses_batch
 
     def get_job_object(self, job_state):
         job_uuid = job_state.details.labels.job_uuid.hex
@@ -130,6 +159,7 @@ class TestEventsTensorboardJobsStatusesHandling(TestEventsBaseJobsStatusesHandli
     CONTAINER_NAME = conf.get('CONTAINER_NAME_PLUGIN_JOB')
     STATUS_MODEL = TensorboardJobStatus
     STATUS_HANDLER = k8s_events_handle_plugin_job_statuses
+    STATUS_BATCH_HANDLER = k8s_events_handle_plugin_job_statuses_batch
 
     def get_job_object(self, job_state):
         project_uuid = job_state.details.labels.project_uuid.hex
@@ -145,6 +175,7 @@ class TestEventsNotebookJobsStatusesHandling(TestEventsBaseJobsStatusesHandling)
     CONTAINER_NAME = conf.get('CONTAINER_NAME_PLUGIN_JOB')
     STATUS_MODEL = NotebookJobStatus
     STATUS_HANDLER = k8s_events_handle_plugin_job_statuses
+    STATUS_BATCH_HANDLER = k8s_events_handle_plugin_job_statuses_batch
 
     def get_job_object(self, job_state):
         project_uuid = job_state.details.labels.project_uuid.hex
@@ -160,6 +191,7 @@ class TestEventsDockerizerJobsStatusesHandling(TestEventsBaseJobsStatusesHandlin
     CONTAINER_NAME = conf.get('CONTAINER_NAME_DOCKERIZER_JOB')
     STATUS_MODEL = BuildJobStatus
     STATUS_HANDLER = k8s_events_handle_build_job_statuses
+    STATUS_BATCH_HANDLER = k8s_events_handle_build_job_statuses_batch
 
     def get_job_object(self, job_state):
         project_uuid = job_state.details.labels.project_uuid.hex
@@ -0,0 +1,45 @@
+import pytest
+
+from mock import patch
+
+from monitor_namespace.aggregator import EventsAggregator
+from tests.utils import BaseTest
+
+
+@pytest.mark.monitors_mark
+class TestEventsAggregator(BaseTest):
+    @staticmethod
+    def get_payload(name, reason):
+        return {'data': {'reason': reason, 'message': 'message'},
+                'meta': {'involved_object': {'kind': 'Pod', 'name': name}},
+                'level': 'warning'}
+
+    def test_aggregates_and_bounds_the_published_events(self):
+        aggregator = EventsAggregator(cluster_id=1, interval=60, max_events=2, max_pending=3)
+        for _ in range(10):
+            aggregator.add(self.get_payload('pod1', 'BackOff'))
+        aggregator.add(self.get_payload('pod1', 'Failed'))
+        aggregator.add(self.get_payload('pod2', 'BackOff'))
+        # Above the max pending events
+        aggregator.add(self.get_payload('pod3', 'BackOff'))
+        assert aggregator.n_dropped == 1
+
+        with patch('monitor_namespace.aggregator.celery_app.send_task') as mock_send_task:
+            aggregator.flush()
+
+        assert mock_send_task.call_count == 2
+        payloads = [call[1]['kwargs']['payload'] for call in mock_send_task.call_args_list]
+        assert payloads[0]['data']['count'] == 10
+        assert payloads[1]['data']['reason'] == 'Failed'
+        assert 'count' not in payloads[1]['data']
+
+        # The remaining event is published in the next interval
+        with patch('monitor_namespace.aggregator.celery_app.send_task') as mock_send_task:
+            aggregator.flush()
+        assert mock_send_task.call_count == 1
+        assert mock_send_task.call_args[1]['kwargs']['payload']['meta']['involved_object'] == {
+            'kind': 'Pod',
+            'name': 'pod2'
+        }
+        if aggregator._timer:  # pylint:disable=protected-access
+            aggregator._timer.cancel()  # pylint:disable=protected-access
@@ -0,0 +1,50 @@
+import pytest
+
+from mock import patch
+
+from constants.jobs import JobLifeCycle
+from monitor_statuses.batcher import StatusesBatcher
+from polyaxon.settings import K8SEventsCeleryTasks
+from tests.utils import BaseTest
+
+
+@pytest.mark.monitors_mark
+class TestStatusesBatcher(BaseTest):
+    TASK = K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES_BATCH
+
+    @staticmethod
+    def get_payload(job_uuid, status, message=None):
+        return {'status': status,
+                'message': message,
+                'details': {'labels': {'job_uuid': job_uuid}}}
+
+    def test_coalesces_statuses_per_job(self):
+        batcher = StatusesBatcher(interval=60, batch_size=100)
+        batcher.add(task=self.TASK, payload=self.get_payload('job1', JobLifeCycle.BUILDING))
+        batcher.add(task=self.TASK, payload=self.get_payload('job1', JobLifeCycle.RUNNING, '1'))
+        batcher.add(task=self.TASK, payload=self.get_payload('job2', JobLifeCycle.RUNNING))
+        batcher.add(task=self.TASK, payload=self.get_payload('job1', JobLifeCycle.RUNNING, '2'))
+
+        with patch('monitor_statuses.batcher.celery_app.send_task') as mock_send_task:
+            batcher.flush()
+
+        assert mock_send_task.call_count == 1
+        payloads = mock_send_task.call_args[1]['kwargs']['payloads']
+        assert [(p['details']['labels']['job_uuid'], p['status'], p['message'])
+                for p in payloads] == [('job1', JobLifeCycle.BUILDING, None),
+                                       ('job1', JobLifeCycle.RUNNING, '2'),
+                                       ('job2', JobLifeCycle.RUNNING, None)]
+
+        # Nothing is pending anymore
+        with patch('monitor_statuses.batcher.celery_app.send_task') as mock_send_task:
+            batcher.flush()
+        assert mock_send_task.call_count == 0
+
+    def test_flushes_when_the_batch_is_full(self):
+        batcher = StatusesBatcher(interval=60, batch_size=2)
+        with patch('monitor_statuses.batcher.celery_app.send_task') as mock_send_task:
+            batcher.add(task=self.TASK, payload=self.get_payload('job1', JobLifeCycle.RUNNING))
+            assert mock_send_task.call_count == 0
+            batcher.add(task=self.TASK, payload=self.get_payload('job2', JobLifeCycle.RUNNING))
+            assert mock_send_task.call_count == 1
+        assert len(mock_send_task.call_args[1]['kwargs']['payloads']) == 2
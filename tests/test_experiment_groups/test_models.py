@@ -45,6 +45,7 @@ from hpsearch.search_managers import (
     HyperbandSearchManager,
     RandomSearchManager
 )
+from hpsearch.tasks.base import create_group_experiments, get_suggestions
 from hpsearch.tasks.bo import hp_bo_start
 from hpsearch.tasks.hyperband import hp_hyperband_start
 from scheduler.tasks.experiment_groups import experiments_group_stop_experiments
@@ -475,6 +476,79 @@ class TestExperimentGroupModel(BaseTest):
 
         assert Experiment.objects.filter(experiment_group=experiment_group).count() == 0
 
+    @patch('scheduler.tasks.experiment_groups.experiments_group_create.apply_async')
+    def test_create_group_experiments_in_bulk(self, _):
+        experiment_group = ExperimentGroupFactory(
+            content=experiment_group_spec_content_early_stopping)
+        suggestions = get_suggestions(experiment_group=experiment_group)
+
+        with patch('auditor.record') as auditor_record:
+            experiments = create_group_experiments(experiment_group=experiment_group,
+                                                   suggestions=suggestions)
+
+        assert auditor_record.call_count == 1
+        assert auditor_record.call_args[1]['num_experiments'] == len(suggestions)
+        assert len(experiments) == len(suggestions)
+        assert experiment_group.experiments.count() == len(suggestions)
+        for experiment in experiment_group.experiments.all():
+            assert experiment.last_status == ExperimentLifeCycle.CREATED
+            assert experiment.statuses.count() == 1
+            assert experiment.declarations
+            assert experiment.persistence is not None
+        assert experiment_group.pending_experiments.count() == len(suggestions)
+        experiment_group.refresh_from_db()
+        assert experiment_group.experiments_counts == {
+            ExperimentLifeCycle.CREATED: len(suggestions)}
+
+    @patch('scheduler.tasks.experiment_groups.experiments_group_create.apply_async')
+    def test_experiments_counts(self, _):
+        experiment_group = ExperimentGroupFactory()
+        with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
+            experiments = [ExperimentFactory(experiment_group=experiment_group)
+                           for _ in range(3)]
+
+        experiment_group.refresh_from_db()
+        assert experiment_group.experiments_counts == {ExperimentLifeCycle.CREATED: 3}
+        ExperimentStatusFactory(experiment=experiments[0], status=ExperimentLifeCycle.SCHEDULED)
+        ExperimentStatusFactory(experiment=experiments[1], status=ExperimentLifeCycle.RUNNING)
+
+        experiment_group.refresh_from_db()
+        with self.assertNumQueries(0):
+            assert experiment_group.count_experiments() == 3
+            assert experiment_group.count_experiments(
+                statuses=ExperimentLifeCycle.PENDING_STATUS) == 1
+            assert experiment_group.count_experiments(
+                statuses=ExperimentLifeCycle.RUNNING_STATUS) == 2
+            assert experiment_group.n_experiments_to_start == experiment_group.concurrency - 2
+        for statuses in [None,
+                         ExperimentLifeCycle.PENDING_STATUS,
+                         ExperimentLifeCycle.RUNNING_STATUS]:
+            queryset = experiment_group.experiments
+            if statuses:
+                queryset = queryset.filter(status__status__in=statuses)
+            assert experiment_group.count_experiments(statuses=statuses) == queryset.count()
+
+        # Archived and deleted experiments are not counted
+        experiments[0].archive()
+        experiment_group.refresh_from_db()
+        assert experiment_group.count_experiments(
+            statuses=ExperimentLifeCycle.RUNNING_STATUS) == 1
+        experiments[0].restore()
+        experiment_group.refresh_from_db()
+        assert experiment_group.count_experiments(
+            statuses=ExperimentLifeCycle.RUNNING_STATUS) == 2
+
+        experiments[2].delete()
+        experiment_group.refresh_from_db()
+        assert experiment_group.experiments_counts == {ExperimentLifeCycle.CREATED: 0,
+                                                       ExperimentLifeCycle.SCHEDULED: 1,
+                                                       ExperimentLifeCycle.RUNNING: 1}
+
+        experiment_group.archive()
+        assert experiment_group.count_experiments() == 0
+        experiment_group.restore()
+        assert experiment_group.count_experiments() == 2
+
     @patch('scheduler.dockerizer_scheduler.create_build_job')
     def test_experiment_create_a_max_of_experiments(self, create_build_job):
         build = BuildJobFactory()
@@ -1,4 +1,6 @@
 # pylint:disable=too-many-lines
+import itertools
+
 import numpy as np
 
 from unittest.mock import patch
@@ -12,6 +14,7 @@ from factories.fixtures import (
     experiment_group_spec_content_early_stopping,
     experiment_group_spec_content_hyperband
 )
+from hpsearch.exceptions import ExperimentGroupException
 from hpsearch.schemas import BOIterationConfig
 from hpsearch.search_managers import (
     BOSearchManager,
@@ -22,6 +25,7 @@ from hpsearch.search_managers import (
 )
 from hpsearch.search_managers.bayesian_optimization.optimizer import BOOptimizer
 from hpsearch.search_managers.bayesian_optimization.space import SearchSpace
+from hpsearch.search_managers.utils import get_suggestion_hash
 from schemas.hptuning import HPTuningConfig, MatrixConfig
 from tests.utils import BaseTest
 
@@ -106,6 +110,65 @@ class TestGridSearchManager(BaseTest):
 
         assert to_numpy_mock.call_count == 2
 
+    def test_iter_suggestions(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'values': ['a', 'b']},
+                'feature3': {'range': [1, 5, 1]}
+            }
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        assert manager.get_grid_size() == 24
+
+        expected = [
+            {'feature1': f1, 'feature2': f2, 'feature3': f3}
+            for f1, f2, f3 in itertools.product([1, 2, 3], ['a', 'b'], [1, 2, 3, 4])
+        ]
+        assert list(manager.iter_suggestions()) == expected
+        # Resuming from a cursor
+        assert list(manager.iter_suggestions(offset=10)) == expected[10:]
+
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'grid_search': {'n_experiments': 10},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'values': ['a', 'b']},
+                'feature3': {'range': [1, 5, 1]}
+            }
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        assert manager.get_grid_size() == 10
+        assert list(manager.iter_suggestions(offset=8)) == expected[8:10]
+
+    def test_large_grid_is_not_materialized(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {'feature{}'.format(i): {'range': [0, 20, 1]} for i in range(6)}
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        assert manager.get_grid_size() == 20 ** 6
+        suggestion = next(manager.iter_suggestions(offset=20 ** 6 - 1))
+        assert suggestion == {'feature{}'.format(i): 19 for i in range(6)}
+
+    def test_grid_with_distributions_raises(self):
+        # The matrix of another algorithm, e.g. a group created before its algorithm changed
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 10},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'uniform': [0, 1]}
+            }
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        with self.assertRaises(ExperimentGroupException):
+            manager.get_grid_size()
+        with self.assertRaises(ExperimentGroupException):
+            next(manager.iter_suggestions())
+
 
 @pytest.mark.experiment_groups_mark
 class TestRandomSearchManager(BaseTest):
@@ -194,6 +257,61 @@ class TestRandomSearchManager(BaseTest):
 
         assert sample_mock.call_count == 4
 
+    def test_get_suggestions_are_unique(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 20},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3, 4]},
+                'feature2': {'range': [1, 6, 1]}
+            }
+        })
+        manager = RandomSearchManager(hptuning_config=hptuning_config)
+        suggestions = manager.get_suggestions()
+        assert len(suggestions) == 20
+        assert len({get_suggestion_hash(suggestion) for suggestion in suggestions}) == 20
+
+    def test_get_suggestions_skips_issued_hashes(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 10},
+            'matrix': {
+                'feature1': {'values': [1, 2]},
+                'feature2': {'range': [1, 3, 1]}
+            }
+        })
+        manager = RandomSearchManager(hptuning_config=hptuning_config)
+        issued_hashes = {
+            get_suggestion_hash({'feature1': 1, 'feature2': 1}),
+            get_suggestion_hash({'feature1': 2, 'feature2': 2}),
+        }
+        suggestions = manager.get_suggestions(issued_hashes=issued_hashes)
+        assert len(suggestions) == 2
+        assert {get_suggestion_hash(suggestion) for suggestion in suggestions} == {
+            get_suggestion_hash({'feature1': 1, 'feature2': 2}),
+            get_suggestion_hash({'feature1': 2, 'feature2': 1}),
+        }
+
+        assert manager.get_suggestions(issued_hashes=issued_hashes | {
+            get_suggestion_hash(suggestion) for suggestion in suggestions}) == []
+
+    def test_get_suggestions_with_list_values(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'random_search': {'n_experiments': 6},
+            'matrix': {
+                'feature1': {'values': [[1, 2], [3, 4], [5, 6]]},
+                'feature2': {'values': [1, 2]}
+            }
+        })
+        manager = RandomSearchManager(hptuning_config=hptuning_config)
+        suggestions = manager.get_suggestions()
+        assert len(suggestions) == 6
+        for suggestion in suggestions:
+            assert list(suggestion['feature1']) in [[1, 2], [3, 4], [5, 6]]
+            assert suggestion['feature2'] in [1, 2]
+        assert len({get_suggestion_hash(suggestion) for suggestion in suggestions}) == 6
+
 
 @pytest.mark.experiment_groups_mark
 class TestHyperbandSearchManager(BaseTest):
@@ -732,10 +850,35 @@ class TestBOSearchManager(BaseTest):
             'experiments_configs': [[4, {'feature1': 2, 'feature2': 1.5, 'feature3': 4}]],
             'experiments_metrics': [[4, 4]]
         })
-        with patch.object(BOOptimizer, 'get_suggestion') as get_suggestion_mock:
+        with patch.object(BOOptimizer, 'get_suggestions') as get_suggestions_mock:
             self.manager1.get_suggestions(iteration_config)
 
-        assert get_suggestion_mock.call_count == 1
+        assert get_suggestions_mock.call_count == 1
+        # One suggestion per concurrency slot
+        assert get_suggestions_mock.call_args[1]['n_suggestions'] == 2
+
+    def test_iteration_suggestions_warm_starts_the_gaussian_process(self):
+        iteration_config = BOIterationConfig.from_dict({
+            'iteration': 2,
+            'num_suggestions': 1,
+            'old_experiment_ids': [1, 2, 3],
+            'old_experiments_configs': [[1, {'feature1': 1, 'feature2': 1, 'feature3': 1}],
+                                        [2, {'feature1': 2, 'feature2': 1.2, 'feature3': 2}],
+                                        [3, {'feature1': 3, 'feature2': 1.3, 'feature3': 3}]],
+            'old_experiments_metrics': [[1, 1], [2, 2], [3, 3]],
+            'experiment_ids': [4],
+            'experiments_configs': [[4, {'feature1': 2, 'feature2': 1.5, 'feature3': 4}]],
+            'experiments_metrics': [[4, 4]],
+            'kernel_theta': [0.5]
+        })
+        assert BOIterationConfig.from_dict(iteration_config.to_dict()).kernel_theta == [0.5]
+
+        suggestions = self.manager1.get_suggestions(iteration_config)
+        assert 1 <= len(suggestions) <= 2
+        assert len(self.manager1.kernel_theta) == 1
+
+        optimizer = BOOptimizer(hptuning_config=self.manager1.hptuning_config, kernel_theta=[0.5])
+        assert optimizer.utility_function.gaussian_process.kernel.theta.tolist() == [0.5]
 
     def test_space_search(self):
         # Space 1
@@ -960,6 +1103,47 @@ class TestBOSearchManager(BaseTest):
         assert 1 <= suggestion['feature4'] <= 5
         assert suggestion['feature5'] in ['a', 'b', 'c']
 
+    def test_utility_function_batch_gradient(self):
+        optimizer = BOOptimizer(hptuning_config=self.manager1.hptuning_config)
+        optimizer.add_observations(
+            configs=[{'feature1': 1, 'feature2': 1, 'feature3': 1},
+                     {'feature1': 2, 'feature2': 1.5, 'feature3': 2},
+                     {'feature1': 3, 'feature2': 2, 'feature3': 4}],
+            metrics=[1, 2, 3])
+        utility_function = optimizer.utility_function
+        utility_function.gaussian_process.fit(optimizer.space.x, optimizer.space.y)
+
+        x = np.array([[1.5, 1.2, 2.], [2.5, 1.8, 3.]])
+        values, gradients = utility_function.compute_with_gradient(x, y_max=-1)
+        assert gradients.shape == x.shape
+        assert np.allclose(values, utility_function.compute(x, y_max=-1))
+        for i, point in enumerate(x):
+            for j in range(x.shape[1]):
+                shifted = point.copy()
+                shifted[j] += utility_function.GRADIENT_STEP
+                gradient = (utility_function.compute(shifted.reshape(1, -1), y_max=-1)[0] -
+                            values[i]) / utility_function.GRADIENT_STEP
+                assert np.isclose(gradients[i, j], gradient)
+
+    def test_optimizer_get_suggestions(self):
+        optimizer = BOOptimizer(hptuning_config=self.manager2.hptuning_config)
+        configs = [
+            {'feature1': 1, 'feature2': 1, 'feature3': 1, 'feature4': 1, 'feature5': 'a'},
+            {'feature1': 2, 'feature2': 1.2, 'feature3': 2, 'feature4': 4, 'feature5': 'b'},
+            {'feature1': 3, 'feature2': 1.3, 'feature3': 3, 'feature4': 3, 'feature5': 'a'}
+        ]
+        optimizer.add_observations(configs=configs, metrics=[1, 2, 3])
+        suggestions = optimizer.get_suggestions(n_suggestions=3)
+
+        assert 1 <= len(suggestions) <= 3
+        for suggestion in suggestions:
+            assert suggestions.count(suggestion) == 1
+            assert 1 <= suggestion['feature4'] <= 5
+            assert suggestion['feature5'] in ['a', 'b', 'c']
+        # The hyperparameters are optimized once, and kept for the lies
+        assert optimizer.utility_function.gaussian_process.optimizer is not None
+        assert optimizer.kernel_theta is not None
+
     @pytest.mark.filterwarnings('ignore::UserWarning')
     def test_concrete_example(self):
         hptuning_config = HPTuningConfig.from_dict({
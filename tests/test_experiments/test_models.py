@@ -15,7 +15,10 @@ import stores
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
 from constants.urls import API_V1
-from crons.tasks.experiments_statuses import experiments_sync_jobs_statuses
+from crons.tasks.experiments_statuses import (
+    experiments_sync_jobs_statuses,
+    get_experiments_calculated_statuses
+)
 from db.managers.deleted import ArchivedManager, LiveManager
 from db.models.build_jobs import BuildJobStatus
 from db.models.cloning_strategies import CloningStrategy
@@ -448,6 +451,25 @@ class TestExperimentModel(BaseTest):
 
         assert experiment.metrics.count() == 3
 
+    def test_set_metrics_in_bulk(self):
+        config = ExperimentSpecification.read(experiment_spec_content)
+        experiment = ExperimentFactory(config=config.parsed_data)
+
+        with patch('auditor.record') as auditor_record:
+            experiments_set_metrics(experiment_id=experiment.id,
+                                    data=[{
+                                        'values': {'accuracy': 0.8, 'loss': 0.2}
+                                    }, {
+                                        'values': {'accuracy': 0.9}
+                                    }, {
+                                        'values': {'precision': 0.7}
+                                    }])
+
+        assert experiment.metrics.count() == 3
+        assert auditor_record.call_count == 1
+        experiment.refresh_from_db()
+        assert experiment.last_metric == {'accuracy': 0.9, 'loss': 0.2, 'precision': 0.7}
+
     def test_master_success_influences_other_experiment_workers_status(self):
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
             # with patch.object(Experiment, 'set_status') as _:  # noqa
@@ -494,12 +516,13 @@ class TestExperimentModel(BaseTest):
         xp_with_jobs.refresh_from_db()
         assert xp_with_jobs.last_status is None
 
-        # Mock sync experiments and jobs constants
-        with patch('scheduler.tasks.experiments.'
-                   'experiments_check_status.apply_async') as check_status_mock:
+        # Only the out of sync experiments are updated
+        with patch.object(Experiment, 'update_status') as update_status_mock:
             experiments_sync_jobs_statuses()
 
-        assert check_status_mock.call_count == 1
+        assert update_status_mock.call_count == 1
+        assert update_status_mock.call_args[1] == {
+            'calculated_status': ExperimentLifeCycle.RUNNING}
 
         # Call sync experiments and jobs constants
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as build_mock:
@@ -513,6 +536,25 @@ class TestExperimentModel(BaseTest):
         assert no_jobs_xp.last_status is None
         assert xp_with_jobs.last_status == ExperimentLifeCycle.RUNNING
 
+    def test_get_experiments_calculated_statuses(self):
+        with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
+            with patch.object(Experiment, 'set_status') as _:  # noqa
+                experiment1 = ExperimentFactory()
+                experiment2 = ExperimentFactory()
+                master = ExperimentJobFactory(experiment=experiment1, role=TaskType.MASTER)
+                worker = ExperimentJobFactory(experiment=experiment1, role=TaskType.WORKER)
+                ExperimentJobStatusFactory(job=master, status=JobLifeCycle.SUCCEEDED)
+                ExperimentJobStatusFactory(job=worker, status=JobLifeCycle.RUNNING)
+                job = ExperimentJobFactory(experiment=experiment2)
+                ExperimentJobStatusFactory(job=job, status=JobLifeCycle.RUNNING)
+        ExperimentStatusFactory(experiment=experiment2, status=ExperimentLifeCycle.RUNNING)
+
+        with self.assertNumQueries(1):
+            calculated_statuses = get_experiments_calculated_statuses()
+
+        # The master is done, the second experiment is already in sync
+        assert calculated_statuses == {experiment1.id: ExperimentLifeCycle.SUCCEEDED}
+
     def test_copying_an_experiment(self):
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
             experiment1 = ExperimentFactory()
@@ -29,6 +29,7 @@ from api.experiments.serializers import (
     ExperimentStatusSerializer
 )
 from api.utils.views.protected import ProtectedView
+from constants import content_types
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
 from constants.urls import API_V1
@@ -45,6 +46,7 @@ from db.models.repos import CodeReference
 from db.redis.ephemeral_tokens import RedisEphemeralTokens
 from db.redis.group_check import GroupChecks
 from db.redis.heartbeat import RedisHeartBeat
+from db.redis.logs_buffer import RedisLogsBuffer
 from db.redis.tll import RedisTTL
 from factories.factory_code_reference import CodeReferenceFactory
 from factories.factory_experiment_groups import ExperimentGroupFactory
@@ -1481,6 +1483,68 @@ class TestExperimentMetricListViewV1(BaseViewTest):
         assert last_object.values == data['values']
 
 
+@pytest.mark.experiments_mark
+class TestExperimentMetricQueryViewV1(BaseViewTest):
+    HAS_AUTH = True
+
+    def setUp(self):
+        super().setUp()
+        project = ProjectFactory(user=self.auth_client.user)
+        self.experiment = ExperimentFactory(project=project)
+        self.url = '/{}/{}/{}/experiments/{}/metrics/query/'.format(API_V1,
+                                                                    project.user.username,
+                                                                    project.name,
+                                                                    self.experiment.id)
+        self.objects = [ExperimentMetricFactory(experiment=self.experiment,
+                                                values={'loss': i, 'accuracy': i / 10})
+                        for i in range(10)]
+
+    def test_get(self):
+        resp = self.auth_client.get(self.url)
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['count'] == 10
+        assert resp.data['cursor'] == self.objects[-1].id
+        assert set(resp.data['metrics'].keys()) == {'loss', 'accuracy'}
+        assert resp.data['metrics']['loss']['steps'] == list(range(10))
+        assert resp.data['metrics']['loss']['values'] == list(range(10))
+
+        resp = self.auth_client.get('{}?metrics=loss'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert set(resp.data['metrics'].keys()) == {'loss'}
+
+    def test_get_downsampled(self):
+        resp = self.auth_client.get('{}?points=4'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['count'] == 10
+        loss = resp.data['metrics']['loss']
+        assert len(loss['values']) == 4
+        assert loss['steps'][0] == 0
+        assert loss['steps'][-1] == 9
+
+        resp = self.auth_client.get('{}?points=4&sampling=minmax'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert len(resp.data['metrics']['loss']['values']) == 4
+
+        resp = self.auth_client.get('{}?sampling=foo'.format(self.url))
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+        resp = self.auth_client.get('{}?points=foo'.format(self.url))
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_since(self):
+        resp = self.auth_client.get('{}?since={}'.format(self.url, self.objects[6].id))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['count'] == 3
+        assert resp.data['metrics']['loss']['steps'] == [7, 8, 9]
+        cursor = resp.data['cursor']
+
+        resp = self.auth_client.get('{}?since={}'.format(self.url, cursor))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['count'] == 0
+        assert resp.data['cursor'] == cursor
+        assert resp.data['metrics'] == {}
+
+
 @pytest.mark.experiments_mark
 class TestExperimentStatusDetailViewV1(BaseViewTest):
     serializer_class = ExperimentStatusSerializer
@@ -2201,18 +2265,22 @@ class TestExperimentLogsViewV1(BaseViewTest):
         assert resp.status_code == status.HTTP_400_BAD_REQUEST
 
         data = 'logs here'
-        with patch('logs_handlers.tasks.logs_handle_experiment_job.apply_async') as mock_fct:
+        with patch('logs_handlers.tasks.logs_flush_buffer.apply_async') as mock_fct:
             resp = self.auth_client.post(self.url, data)
 
         assert resp.status_code == status.HTTP_200_OK
         assert mock_fct.call_count == 1
 
+        # A flush is already scheduled for the experiment
         data = ['logs here', 'dfg dfg']
-        with patch('logs_handlers.tasks.logs_handle_experiment_job.apply_async') as mock_fct:
+        with patch('logs_handlers.tasks.logs_flush_buffer.apply_async') as mock_fct:
             resp = self.auth_client.post(self.url, data)
 
         assert resp.status_code == status.HTTP_200_OK
-        assert mock_fct.call_count == 1
+        assert mock_fct.call_count == 0
+        assert RedisLogsBuffer.get_log_lines(kind=content_types.EXPERIMENT,
+                                             run_uuid=self.experiment.uuid.hex) == [
+            'logs here', 'logs here', 'dfg dfg']
 
 
 @pytest.mark.experiments_mark
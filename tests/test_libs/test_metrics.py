@@ -0,0 +1,63 @@
+import pytest
+
+from django.utils import timezone
+
+from libs.metrics import (
+    MetricsSampling,
+    downsample_column,
+    get_lttb_indices,
+    get_metrics_columns,
+    get_min_max_indices
+)
+from tests.utils import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestMetrics(BaseTest):
+    def test_get_metrics_columns(self):
+        now = timezone.now()
+        rows = [
+            (1, now, {'loss': 0.5, 'accuracy': 0.1}),
+            (2, now, {'loss': 0.4, 'tag': 'foo'}),
+            (3, now, {'accuracy': 0.3}),
+        ]
+        columns = get_metrics_columns(rows=rows, offset=10)
+        assert columns == {
+            'loss': {'steps': [10, 11], 'timestamps': [now, now], 'values': [0.5, 0.4]},
+            'accuracy': {'steps': [10, 12], 'timestamps': [now, now], 'values': [0.1, 0.3]},
+        }
+
+        columns = get_metrics_columns(rows=rows, names=['loss'])
+        assert list(columns.keys()) == ['loss']
+
+    def test_get_lttb_indices(self):
+        y = [0, 1, 0, 10, 0, 1, 0, 1, 0, 1]
+        x = list(range(len(y)))
+        assert get_lttb_indices(x=x, y=y, threshold=20) == x
+
+        indices = get_lttb_indices(x=x, y=y, threshold=4)
+        assert len(indices) == 4
+        assert indices[0] == 0
+        assert indices[-1] == len(y) - 1
+        # The spike is kept
+        assert 3 in indices
+
+    def test_get_min_max_indices(self):
+        y = [5, 1, 9, 4, 3, 8, 2, 7]
+        assert get_min_max_indices(y=y, threshold=10) == list(range(len(y)))
+        assert get_min_max_indices(y=y, threshold=4) == [1, 2, 5, 6]
+
+    def test_downsample_column(self):
+        now = timezone.now()
+        column = {
+            'steps': list(range(100)),
+            'timestamps': [now] * 100,
+            'values': [i % 7 for i in range(100)]
+        }
+        assert downsample_column(column=column, threshold=100) == column
+
+        for sampling in MetricsSampling.VALUES:
+            sampled = downsample_column(column=column, threshold=10, sampling=sampling)
+            assert len(sampled['values']) <= 10
+            assert len(sampled['steps']) == len(sampled['timestamps']) == len(sampled['values'])
+            assert sampled['values'] == [i % 7 for i in sampled['steps']]
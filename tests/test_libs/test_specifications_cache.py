@@ -0,0 +1,63 @@
+import pytest
+
+from mock import patch
+
+from db.models.experiments import Experiment
+from factories.factory_experiments import ExperimentFactory
+from factories.fixtures import experiment_spec_parsed_content
+from libs.specifications_cache import SpecificationsCache, get_specification, specifications_cache
+from schemas.specifications import ExperimentSpecification
+from tests.utils import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestSpecificationsCache(BaseTest):
+    def setUp(self):
+        super().setUp()
+        specifications_cache.clear()
+
+    def test_get_key(self):
+        key1 = SpecificationsCache.get_key(kind=ExperimentSpecification,
+                                           content={'a': 1, 'b': [1, 2]})
+        key2 = SpecificationsCache.get_key(kind=ExperimentSpecification,
+                                           content={'b': [1, 2], 'a': 1})
+        key3 = SpecificationsCache.get_key(kind=ExperimentSpecification,
+                                           content={'a': 2, 'b': [1, 2]})
+        assert key1 == key2
+        assert key1 != key3
+        assert key1.startswith('ExperimentSpecification.')
+
+    def test_lru_eviction(self):
+        cache = SpecificationsCache(maxsize=2)
+        assert cache.get(kind=dict, content='a', parse=str.upper) == 'A'
+        assert cache.get(kind=dict, content='b', parse=str.upper) == 'B'
+        # Access `a` so that `b` is the least recently used
+        assert cache.get(kind=dict, content='a', parse=str.upper) == 'A'
+        assert cache.get(kind=dict, content='c', parse=str.upper) == 'C'
+        assert len(cache) == 2
+        assert cache.cache_info() == {'hits': 1, 'misses': 3, 'size': 2, 'maxsize': 2}
+
+        assert cache.get(kind=dict, content='a', parse=str.upper) == 'A'
+        assert cache.cache_info()['hits'] == 2
+        assert cache.get(kind=dict, content='b', parse=str.upper) == 'B'
+        assert cache.cache_info()['misses'] == 4
+
+    def test_get_specification(self):
+        config = experiment_spec_parsed_content.parsed_data
+        spec1 = get_specification(ExperimentSpecification, config)
+        spec2 = get_specification(ExperimentSpecification, dict(config))
+        assert isinstance(spec1, ExperimentSpecification)
+        assert spec1 is spec2
+        assert specifications_cache.cache_info()['hits'] == 1
+        assert specifications_cache.cache_info()['misses'] == 1
+
+    def test_specification_is_shared_across_instances(self):
+        with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
+            experiment = ExperimentFactory()
+
+        specifications_cache.clear()
+        experiment1 = Experiment.objects.get(id=experiment.id)
+        experiment2 = Experiment.objects.get(id=experiment.id)
+        assert experiment1.specification is experiment2.specification
+        assert specifications_cache.cache_info()['misses'] == 1
+        assert specifications_cache.cache_info()['hits'] == 1
@@ -6,10 +6,13 @@ import pytest
 
 import stores
 
+from constants import content_types
 from factories.factory_build_jobs import BuildJobFactory
 from factories.factory_experiments import ExperimentFactory
 from factories.factory_jobs import JobFactory
+from logs_handlers.buffer import buffer_logs
 from logs_handlers.tasks.log_handlers import (
+    logs_flush_buffer,
     logs_handle_build_job,
     logs_handle_experiment_job,
     logs_handle_job
@@ -39,6 +42,10 @@ class BaseTestLogsHandling(BaseTest):
     def handle_job_logs(**params):
         pass
 
+    @staticmethod
+    def get_buffer_params(instance):
+        return None
+
     def test_handle_job_logs_create_one_handler(self):
         instance = self.get_instance()
 
@@ -54,6 +61,40 @@ class BaseTestLogsHandling(BaseTest):
         self.handle_job_logs(**params)
         assert self.file_line_count(log_path) == 2
 
+    def test_flush_buffered_logs(self):
+        instance = self.get_instance()
+        params = self.get_buffer_params(instance)
+
+        with patch('logs_handlers.tasks.logs_flush_buffer.apply_async') as mock_fct:
+            buffer_logs(log_lines='First line', **params)
+            buffer_logs(log_lines=['Second line', 'Third line'], **params)
+
+        # A single flush is scheduled for all the buffered lines
+        assert mock_fct.call_count == 1
+        logs_flush_buffer(**params)
+        log_path = self.get_log_path(instance, temp=True)
+        assert self.file_line_count(log_path) == 3
+
+        # Nothing left to flush
+        logs_flush_buffer(**params)
+        assert self.file_line_count(log_path) == 3
+
+    def test_flush_buffered_logs_keeps_the_lines_if_the_write_fails(self):
+        instance = self.get_instance()
+        params = self.get_buffer_params(instance)
+
+        with patch('logs_handlers.tasks.logs_flush_buffer.apply_async'):
+            buffer_logs(log_lines=['First line', 'Second line'], **params)
+
+        with patch('logs_handlers.utils._lock_log', side_effect=OSError):
+            with self.assertRaises(OSError):
+                logs_flush_buffer(**params)
+
+        # The lines are still buffered and persisted by the next flush
+        logs_flush_buffer(**params)
+        log_path = self.get_log_path(instance, temp=True)
+        assert self.file_line_count(log_path) == 2
+
 
 @pytest.mark.logs_heandlers_mark
 class TestExperimentJobLogsHandling(BaseTestLogsHandling):
@@ -74,8 +115,14 @@ class TestExperimentJobLogsHandling(BaseTestLogsHandling):
                     temp=False)
 
     @staticmethod
-    def get_log_path(instance):
-        return stores.get_experiment_logs_path(experiment_name=instance.unique_name, temp=False)
+    def get_buffer_params(instance):
+        return dict(kind=content_types.EXPERIMENT,
+                    run_uuid=instance.uuid.hex,
+                    run_name=instance.unique_name)
+
+    @staticmethod
+    def get_log_path(instance, temp=False):
+        return stores.get_experiment_logs_path(experiment_name=instance.unique_name, temp=temp)
 
     @staticmethod
     def handle_job_logs(**params):
@@ -101,8 +148,14 @@ class TestJobLogsHandling(BaseTestLogsHandling):
                     temp=False)
 
     @staticmethod
-    def get_log_path(instance):
-        return stores.get_job_logs_path(job_name=instance.unique_name, temp=False)
+    def get_buffer_params(instance):
+        return dict(kind=content_types.JOB,
+                    run_uuid=instance.uuid.hex,
+                    run_name=instance.unique_name)
+
+    @staticmethod
+    def get_log_path(instance, temp=False):
+        return stores.get_job_logs_path(job_name=instance.unique_name, temp=temp)
 
     @staticmethod
     def handle_job_logs(**params):
@@ -127,8 +180,14 @@ class TestBuildJobLogsHandling(BaseTestLogsHandling):
                     temp=False)
 
     @staticmethod
-    def get_log_path(instance):
-        return stores.get_job_logs_path(job_name=instance.unique_name, temp=False)
+    def get_buffer_params(instance):
+        return dict(kind=content_types.BUILD_JOB,
+                    run_uuid=instance.uuid.hex,
+                    run_name=instance.unique_name)
+
+    @staticmethod
+    def get_log_path(instance, temp=False):
+        return stores.get_job_logs_path(job_name=instance.unique_name, temp=temp)
 
     @staticmethod
     def handle_job_logs(**params):
@@ -0,0 +1,189 @@
+import os
+import shutil
+import tempfile
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hestia.paths import delete_path
+from polystores.exceptions import PolyaxonStoresException
+
+from django.test import override_settings
+
+from stores.service import StoresService
+from tests.utils import BaseTest
+
+
+class FakeBucketStore(object):
+    def __init__(self):
+        self.root = tempfile.mkdtemp()
+        self.store = MagicMock(is_local_store=False)
+        self.uploads = []
+
+    def _get_path(self, path):
+        return os.path.join(self.root, path.lstrip('/'))
+
+    def upload_file(self, filename, path, use_basename=False):
+        self.uploads.append(path)
+        os.makedirs(os.path.dirname(self._get_path(path)), exist_ok=True)
+        shutil.copy(filename, self._get_path(path))
+
+    def download_file(self, path, local_path, use_basename=False):
+        if not os.path.exists(self._get_path(path)):
+            raise PolyaxonStoresException('Not found')
+        shutil.copy(self._get_path(path), local_path)
+
+    def delete(self, path):
+        delete_path(self._get_path(path))
+
+
+@pytest.mark.logs_heandlers_mark
+class TestLogsSegments(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.store = FakeBucketStore()
+        self.temp_path = os.path.join(tempfile.mkdtemp(), 'logs')
+        self.logs_path = 'bucket/project/experiments/1'
+        self.download_path = os.path.join(tempfile.mkdtemp(), 'logs')
+
+    def append(self, content):
+        with open(self.temp_path, 'a') as log_file:
+            log_file.write(content)
+
+    def upload(self, rewrite=False):
+        with patch.object(StoresService, 'get_logs_store', return_value=self.store):
+            StoresService.upload_logs_segment(temp_path=self.temp_path,
+                                              logs_path=self.logs_path,
+                                              rewrite=rewrite)
+
+    def download(self):
+        with patch.object(StoresService, 'get_logs_store', return_value=self.store):
+            assert StoresService.download_logs_segments(logs_path=self.logs_path,
+                                                        download_path=self.download_path)
+        with open(self.download_path) as log_file:
+            return log_file.read()
+
+    def test_upload_coalesces_new_content_in_the_open_segment(self):
+        self.append('first line\n')
+        self.upload()
+        self.append('second line\n')
+        self.upload()
+        # Nothing new to upload
+        self.upload()
+
+        segments_path = StoresService.get_logs_segments_path(self.logs_path)
+        assert self.store.uploads == [
+            os.path.join(segments_path, '000000.log'),
+            os.path.join(segments_path, 'manifest.json'),
+            os.path.join(segments_path, '000000.log'),
+            os.path.join(segments_path, 'manifest.json'),
+        ]
+        with open(self.store._get_path(os.path.join(segments_path, '000000.log'))) as f:
+            assert f.read() == 'first line\nsecond line\n'
+
+    @override_settings(LOGS_SEGMENT_SIZE=5)
+    def test_upload_rolls_segments_by_size(self):
+        self.append('first line\n')
+        self.upload()
+        self.append('second line\n')
+        self.upload()
+
+        segments_path = StoresService.get_logs_segments_path(self.logs_path)
+        assert self.store.uploads == [
+            os.path.join(segments_path, '000000.log'),
+            os.path.join(segments_path, 'manifest.json'),
+            os.path.join(segments_path, '000001.log'),
+            os.path.join(segments_path, 'manifest.json'),
+        ]
+        with open(self.store._get_path(os.path.join(segments_path, '000001.log'))) as f:
+            assert f.read() == 'second line\n'
+
+    @override_settings(LOGS_SEGMENT_AGE=0)
+    def test_upload_rolls_segments_by_age(self):
+        self.append('first line\n')
+        self.upload()
+        self.append('second line\n')
+        self.upload()
+
+        segments_path = StoresService.get_logs_segments_path(self.logs_path)
+        with open(self.store._get_path(os.path.join(segments_path, '000001.log'))) as f:
+            assert f.read() == 'second line\n'
+
+    def test_download_stitches_the_open_segment(self):
+        self.append('first line\n')
+        self.upload()
+        assert self.download() == 'first line\n'
+
+        self.append('second line\n')
+        self.upload()
+        assert self.download() == 'first line\nsecond line\n'
+
+    def test_download_stitches_segments(self):
+        with override_settings(LOGS_SEGMENT_SIZE=5):
+            self.append('first line\n')
+            self.upload()
+            assert self.download() == 'first line\n'
+
+            self.append('second line\n')
+            self.upload()
+            assert self.download() == 'first line\nsecond line\n'
+
+        self.append('third line\n')
+        self.upload()
+        assert self.download() == 'first line\nsecond line\nthird line\n'
+
+    def test_rewrite_starts_a_new_generation(self):
+        self.append('first line\n')
+        self.upload()
+        assert self.download() == 'first line\n'
+
+        with open(self.temp_path, 'w') as log_file:
+            log_file.write('new line\n')
+        self.upload(rewrite=True)
+        assert self.download() == 'new line\n'
+
+    def test_download_without_segments(self):
+        self.store.download_file = MagicMock(side_effect=PolyaxonStoresException('Not found'))
+        with patch.object(StoresService, 'get_logs_store', return_value=self.store):
+            assert StoresService.download_logs_segments(
+                logs_path=self.logs_path,
+                download_path=self.download_path) is False
+
+    def test_download_deleted_segments_deletes_the_local_manifest(self):
+        self.append('first line\n')
+        self.upload()
+        assert self.download() == 'first line\n'
+        manifest_path = '{}.manifest'.format(self.download_path)
+        assert os.path.exists(manifest_path)
+
+        self.store.delete(StoresService.get_logs_segments_path(self.logs_path))
+        with patch.object(StoresService, 'get_logs_store', return_value=self.store):
+            assert StoresService.download_logs_segments(
+                logs_path=self.logs_path,
+                download_path=self.download_path) is False
+        assert not os.path.exists(manifest_path)
+
+    def test_delete_logs_path_deletes_the_temp_logs_and_manifest(self):
+        archive_root = tempfile.mkdtemp()
+        subpath = 'user/project/experiments/1'
+        self.temp_path = os.path.join(archive_root, subpath)
+        self.logs_path = os.path.join('bucket', subpath)
+        os.makedirs(os.path.dirname(self.temp_path))
+        self.append('first line\n')
+        self.upload()
+        manifest_path = '{}.manifest'.format(self.temp_path)
+        assert os.path.exists(manifest_path)
+
+        with override_settings(LOGS_ARCHIVE_ROOT=archive_root):
+            with patch.object(StoresService, 'get_logs_store', return_value=self.store):
+                with patch.object(StoresService, 'get_logs_path', return_value='bucket'):
+                    with patch.object(StoresService,
+                                      'is_bucket_logs_persistence',
+                                      return_value=True):
+                        StoresService.delete_logs_path(subpath=subpath)
+
+        assert not os.path.exists(self.temp_path)
+        assert not os.path.exists(manifest_path)
+        assert not os.path.exists(
+            self.store._get_path(StoresService.get_logs_segments_path(self.logs_path)))
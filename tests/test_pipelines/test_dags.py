@@ -140,3 +140,32 @@ class TestDags(BaseTest):
             },
             operation_by_ids
         )
+
+    def test_get_dag_from_edges(self):
+        operations = [OperationFactory() for _ in range(4)]
+        operation_by_ids = {op.id: op for op in operations}
+        operation = OperationFactory()
+        edges = [
+            (operations[2].id, operations[0].id),
+            (operations[2].id, operations[1].id),
+            (operations[3].id, operations[0].id),
+            (operations[3].id, operations[1].id),
+            (operations[0].id, operation.id),
+            # Edges of nodes outside the dag are ignored
+            (operation.id, operations[1].id),
+        ]
+
+        assert dags.get_dag_from_edges(nodes=operations, edges=edges) == (
+            {
+                operations[0].id: {operation.id, },
+                operations[1].id: set(),
+                operations[2].id: {operations[0].id, operations[1].id},
+                operations[3].id: {operations[0].id, operations[1].id},
+            },
+            operation_by_ids
+        )
+
+    def test_sort_topologically_large_dag(self):
+        dag = {i: {i + 1, i + 2} for i in range(998)}
+        dag.update({998: {999}, 999: set()})
+        assert dags.sort_topologically(dag) == list(range(1000))
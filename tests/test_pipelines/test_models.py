@@ -8,7 +8,7 @@ from django.conf import settings
 from django.utils import timezone
 
 from constants.pipelines import OperationStatuses, PipelineStatuses, TriggerPolicy
-from db.models.pipelines import OperationRunStatus, PipelineRunStatus
+from db.models.pipelines import OperationRunStatus, Pipeline, PipelineRun, PipelineRunStatus
 from factories.factory_pipelines import (
     OperationFactory,
     OperationRunFactory,
@@ -43,15 +43,19 @@ class TestPipelineModel(BaseTest):
         operation2 = OperationFactory()
         operation2.upstream_operations.set([operations[0], operations[2]])
 
-        assert pipeline.dag == (
-            {
-                operations[0].id: {operation2.id, },
-                operations[1].id: set(),
-                operations[2].id: {operations[0].id, operations[1].id, operation2.id},
-                operations[3].id: {operations[0].id, operations[1].id},
-            },
-            operation_by_ids
-        )
+        # The dag is cached on the instance
+        assert operation2.id not in pipeline.dag[0][operations[0].id]
+        pipeline = Pipeline.objects.get(id=pipeline.id)
+        with self.assertNumQueries(2):
+            assert pipeline.dag == (
+                {
+                    operations[0].id: {operation2.id, },
+                    operations[1].id: set(),
+                    operations[2].id: {operations[0].id, operations[1].id, operation2.id},
+                    operations[3].id: {operations[0].id, operations[1].id},
+                },
+                operation_by_ids
+            )
 
 
 @pytest.mark.pipelines_mark
@@ -170,17 +174,21 @@ class TestPipelineRunModel(BaseTest):
         operation_run2 = OperationRunFactory()
         operation_run2.upstream_runs.set([operation_runs[0], operation_runs[2]])
 
-        assert pipeline_run.dag == (
-            {
-                operation_runs[0].id: {operation_run2.id, },
-                operation_runs[1].id: set(),
-                operation_runs[2].id: {operation_runs[0].id,
-                                       operation_runs[1].id,
-                                       operation_run2.id},
-                operation_runs[3].id: {operation_runs[0].id, operation_runs[1].id},
-            },
-            operation_by_ids
-        )
+        # The dag is cached on the instance
+        assert operation_run2.id not in pipeline_run.dag[0][operation_runs[0].id]
+        pipeline_run = PipelineRun.objects.get(id=pipeline_run.id)
+        with self.assertNumQueries(2):
+            assert pipeline_run.dag == (
+                {
+                    operation_runs[0].id: {operation_run2.id, },
+                    operation_runs[1].id: set(),
+                    operation_runs[2].id: {operation_runs[0].id,
+                                           operation_runs[1].id,
+                                           operation_run2.id},
+                    operation_runs[3].id: {operation_runs[0].id, operation_runs[1].id},
+                },
+                operation_by_ids
+            )
 
     def test_check_concurrency(self):
         # Pipeline without concurrency defaults to infinite concurrency
@@ -213,6 +221,74 @@ class TestPipelineRunModel(BaseTest):
                                           operation_run=operation_run2)
         assert pipeline_run.check_concurrency() is False
 
+    def test_schedule_start_operation_runs(self):
+        pipeline_run = PipelineRunFactory()
+        pipeline_run.pipeline.concurrency = 1
+        pipeline_run.pipeline.save()
+        operation_run1 = OperationRunFactory(pipeline_run=pipeline_run)
+        operation_run2 = OperationRunFactory(pipeline_run=pipeline_run)
+        operation_run2.upstream_runs.set([operation_run1])
+        operation_run3 = OperationRunFactory(pipeline_run=pipeline_run)
+
+        with patch('db.models.pipelines.OperationRun._send_task') as mock_fct:
+            mock_fct.return_value = 'task-id'
+            # The pipeline's concurrency is reached
+            assert pipeline_run.schedule_start_operation_runs() is True
+
+        assert mock_fct.call_count == 1
+        statuses = dict(pipeline_run.operation_runs.values_list('id', 'status__status'))
+        scheduled = {op_run_id for op_run_id, status in statuses.items()
+                     if status == OperationStatuses.SCHEDULED}
+        assert len(scheduled) == 1
+        assert scheduled < {operation_run1.id, operation_run3.id}
+        # The upstream is not done yet
+        assert statuses[operation_run2.id] == OperationStatuses.CREATED
+        assert set(pipeline_run.operation_runs.filter(id__in=scheduled).values_list(
+            'celery_task_id', flat=True)) == {'task-id'}
+
+    def test_schedule_start_operation_runs_ignores_running_upstream_runs_of_other_pipelines(self):
+        pipeline_run = PipelineRunFactory()
+        pipeline_run.pipeline.concurrency = 1
+        pipeline_run.pipeline.save()
+        operation_run1 = OperationRunFactory(pipeline_run=pipeline_run)
+        operation_run2 = OperationRunFactory(pipeline_run=pipeline_run)
+        # The upstream run of another pipeline run is running
+        other_operation_run = OperationRunFactory()
+        OperationRunStatus.objects.create(status=OperationStatuses.RUNNING,
+                                          operation_run=other_operation_run)
+        operation_run2.upstream_runs.set([other_operation_run])
+
+        with patch('db.models.pipelines.OperationRun._send_task') as mock_fct:
+            mock_fct.return_value = 'task-id'
+            assert pipeline_run.schedule_start_operation_runs() is False
+
+        assert mock_fct.call_count == 1
+        operation_run1.refresh_from_db()
+        assert operation_run1.last_status == OperationStatuses.SCHEDULED
+
+    def test_schedule_start_operation_runs_with_failed_upstream(self):
+        pipeline_run = PipelineRunFactory()
+        operation_run1 = OperationRunFactory(pipeline_run=pipeline_run)
+        operation_run2 = OperationRunFactory(pipeline_run=pipeline_run)
+        operation_run2.upstream_runs.set([operation_run1])
+        operation_run3 = OperationRunFactory(pipeline_run=pipeline_run)
+        operation_run3.upstream_runs.set([operation_run2])
+        with patch('pipelines.tasks.pipelines_start_operation.apply_async') as mock_fct:
+            OperationRunStatus.objects.create(status=OperationStatuses.FAILED,
+                                              operation_run=operation_run1)
+        assert mock_fct.call_count == 1
+
+        with patch('db.models.pipelines.OperationRun._send_task') as mock_fct:
+            assert pipeline_run.schedule_start_operation_runs() is False
+
+        assert mock_fct.call_count == 0
+        # The failure is propagated to all the downstream runs in one pass
+        for operation_run in [operation_run2, operation_run3]:
+            operation_run.refresh_from_db()
+            assert operation_run.last_status == OperationStatuses.UPSTREAM_FAILED
+            assert operation_run.started_at is not None
+            assert operation_run.finished_at is not None
+
 
 @pytest.mark.pipelines_mark
 class TestOperationRunModel(BaseTest):
@@ -0,0 +1,59 @@
+import uuid
+
+import pytest
+
+from db.redis.containers import RedisJobContainers
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisJobContainers(BaseTest):
+    def set_container(self, container_id, job_uuid, experiment_uuid):
+        red = RedisJobContainers.connection()
+        red.sadd(RedisJobContainers.KEY_CONTAINERS, container_id)
+        red.hset(RedisJobContainers.KEY_CONTAINERS_TO_JOBS, container_id, job_uuid)
+        red.sadd(RedisJobContainers.KEY_JOBS_TO_CONTAINERS.format(job_uuid), container_id)
+        red.hset(RedisJobContainers.KEY_JOBS_TO_EXPERIMENTS, job_uuid, experiment_uuid)
+
+    def test_get_jobs(self):
+        experiment_uuid = uuid.uuid4().hex
+        job_uuid1 = uuid.uuid4().hex
+        job_uuid2 = uuid.uuid4().hex
+        self.set_container('container1', job_uuid1, experiment_uuid)
+        self.set_container('container2', job_uuid1, experiment_uuid)
+        self.set_container('container3', job_uuid2, experiment_uuid)
+
+        assert RedisJobContainers.get_jobs(['container1', 'container3', 'unknown']) == {
+            'container1': (job_uuid1, experiment_uuid),
+            'container3': (job_uuid2, experiment_uuid),
+            'unknown': (None, None),
+        }
+        assert RedisJobContainers.get_job('container2') == (job_uuid1, experiment_uuid)
+        assert RedisJobContainers.get_jobs([]) == {}
+
+    def test_remove_jobs(self):
+        experiment_uuid = uuid.uuid4().hex
+        job_uuid1 = uuid.uuid4().hex
+        job_uuid2 = uuid.uuid4().hex
+        job_uuid3 = uuid.uuid4().hex
+        self.set_container('container1', job_uuid1, experiment_uuid)
+        self.set_container('container2', job_uuid1, experiment_uuid)
+        self.set_container('container3', job_uuid2, experiment_uuid)
+        self.set_container('container4', job_uuid3, experiment_uuid)
+
+        RedisJobContainers.remove_jobs([job_uuid1, job_uuid2])
+        assert set(RedisJobContainers.get_containers()) == {'container4'}
+        assert RedisJobContainers.get_jobs(['container1', 'container3']) == {
+            'container1': (None, None),
+            'container3': (None, None),
+        }
+        assert RedisJobContainers.get_experiment_for_job(job_uuid1) is None
+        assert RedisJobContainers.get_job('container4') == (job_uuid3, experiment_uuid)
+
+    def test_remove_containers(self):
+        job_uuid = uuid.uuid4().hex
+        self.set_container('container1', job_uuid, uuid.uuid4().hex)
+        self.set_container('container2', job_uuid, uuid.uuid4().hex)
+
+        RedisJobContainers.remove_containers(['container1', 'container2'])
+        assert RedisJobContainers.get_containers() == []
@@ -0,0 +1,23 @@
+import pytest
+
+from db.redis.events_buffer import RedisEventsBuffer
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisEventsBuffer(BaseTest):
+    def test_append_and_drain(self):
+        assert RedisEventsBuffer.drain() == []
+
+        # Only the first event requires scheduling a flush
+        assert RedisEventsBuffer.append(event={'type': 'foo', 'data': {'id': 1}}) is True
+        assert RedisEventsBuffer.append(event={'type': 'bar', 'data': {'id': 2}}) is False
+
+        assert RedisEventsBuffer.drain() == [
+            {'type': 'foo', 'data': {'id': 1}},
+            {'type': 'bar', 'data': {'id': 2}},
+        ]
+        assert RedisEventsBuffer.drain() == []
+
+        # A new flush is required after draining
+        assert RedisEventsBuffer.append(event={'type': 'foo', 'data': {'id': 1}}) is True
@@ -72,3 +72,15 @@ class TestRedisHeartBeat(BaseTest):
         RedisHeartBeat.build_ping(1)
         self.assertEqual(heartbeat.is_alive(), True)
         self.assertEqual(RedisHeartBeat.build_is_alive(1), True)
+
+    def test_redis_heartbeat_get_dead_runs(self):
+        self.assertEqual(RedisHeartBeat.get_dead_experiments([]), [])
+        RedisHeartBeat.experiment_ping(1)
+        RedisHeartBeat.experiment_ping(3)
+        self.assertEqual(RedisHeartBeat.get_dead_experiments([1, 2, 3, 4]), [2, 4])
+
+        RedisHeartBeat.job_ping(2)
+        self.assertEqual(RedisHeartBeat.get_dead_jobs([1, 2]), [1])
+
+        RedisHeartBeat.build_ping(1)
+        self.assertEqual(RedisHeartBeat.get_dead_builds([1, 2]), [2])
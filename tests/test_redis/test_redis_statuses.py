@@ -0,0 +1,37 @@
+import uuid
+
+import pytest
+
+from db.redis.statuses import RedisStatuses
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisStatuses(BaseTest):
+    def test_publish_status(self):
+        run_uuid = uuid.uuid4().hex
+        other_run_uuid = uuid.uuid4().hex
+        assert RedisStatuses.get_statuses([run_uuid, other_run_uuid]) == {
+            run_uuid: None,
+            other_run_uuid: None
+        }
+
+        pubsub = RedisStatuses.subscribe()
+        RedisStatuses.publish_status(run_uuid=run_uuid, status='running')
+        assert RedisStatuses.get_statuses([run_uuid, other_run_uuid]) == {
+            run_uuid: 'running',
+            other_run_uuid: None
+        }
+
+        # The first message read is the subscription confirmation
+        message = None
+        for _ in range(3):
+            message = pubsub.get_message(timeout=1)
+            if message:
+                break
+        pubsub.close()
+        assert RedisStatuses.get_run_uuid(message['channel'].decode('utf-8')) == run_uuid
+        assert message['data'].decode('utf-8') == 'running'
+
+    def test_get_statuses_empty(self):
+        assert RedisStatuses.get_statuses([]) == {}
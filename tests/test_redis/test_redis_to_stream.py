@@ -1,3 +1,4 @@
+import json
 import uuid
 
 import pytest
@@ -8,6 +9,15 @@ from tests.utils import BaseTest
 
 @pytest.mark.redis_mark
 class TestRedisToStream(BaseTest):
+    @staticmethod
+    def get_published_payload(pubsub):
+        # The first message read is the subscription confirmation
+        for _ in range(3):
+            message = pubsub.get_message(timeout=1)
+            if message:
+                return json.loads(message['data'].decode('utf-8'))
+        return None
+
     def test_monitor_job_resources(self):
         job_uuid = uuid.uuid4().hex
         RedisToStream.monitor_job_resources(job_uuid)
@@ -105,3 +115,42 @@ class TestRedisToStream(BaseTest):
         assert RedisToStream.is_monitored_experiment_logs(experiment_uuid) is True
         RedisToStream.remove_experiment_logs(experiment_uuid)
         assert RedisToStream.is_monitored_experiment_logs(experiment_uuid) is False
+
+    def test_publish_resources(self):
+        job_uuid = uuid.uuid4().hex
+        experiment_uuid = uuid.uuid4().hex
+        job_pubsub = RedisToStream.subscribe(RedisToStream.get_job_resources_channel(job_uuid))
+        experiment_pubsub = RedisToStream.subscribe(
+            RedisToStream.get_experiment_resources_channel(experiment_uuid))
+        payload = {'job_uuid': job_uuid, 'experiment_uuid': experiment_uuid, 'cpu_percentage': 1.}
+
+        RedisToStream.publish_resources([payload])
+        assert self.get_published_payload(job_pubsub) == payload
+        assert self.get_published_payload(experiment_pubsub) == payload
+        payload['job_name'] = 'master.0'
+        assert payload == RedisToStream.get_latest_job_resources(job_uuid, 'master.0', True)
+        job_pubsub.close()
+        experiment_pubsub.close()
+
+    def test_get_latest_resources(self):
+        job_uuid1 = uuid.uuid4().hex
+        job_uuid2 = uuid.uuid4().hex
+        RedisToStream.set_latest_job_resources(job_uuid1, {'job_uuid': job_uuid1})
+        RedisToStream.set_latest_job_resources(job_uuid2, {'job_uuid': job_uuid2})
+
+        assert RedisToStream.get_latest_resources([job_uuid1, job_uuid2, 'unknown']) == {
+            job_uuid1: {'job_uuid': job_uuid1},
+            job_uuid2: {'job_uuid': job_uuid2},
+        }
+        assert RedisToStream.get_latest_experiment_resources(
+            [{'uuid': job_uuid1, 'name': 'master.1'}, {'uuid': 'unknown', 'name': 'worker.2'}],
+            as_json=True) == [{'job_uuid': job_uuid1, 'job_name': 'master.1'}]
+
+    def test_get_monitored_resources(self):
+        job_uuid = uuid.uuid4().hex
+        experiment_uuid = uuid.uuid4().hex
+        RedisToStream.monitor_job_resources(job_uuid)
+        RedisToStream.monitor_experiment_resources(experiment_uuid)
+        job_uuids, experiment_uuids = RedisToStream.get_monitored_resources()
+        assert job_uuid in job_uuids
+        assert experiment_uuid in experiment_uuids
@@ -0,0 +1,69 @@
+import asyncio
+
+from collections import namedtuple
+
+import pytest
+
+from mock import patch
+from rest_framework.exceptions import AuthenticationFailed
+
+from db.models.tokens import Token
+from factories.factory_users import UserFactory
+from streams.authentication import SanicTokenAuthentication, tokens_cache
+from tests.utils import BaseTest
+
+Request = namedtuple('Request', ['headers', 'args'])
+
+
+async def run_db_inline(func, *args, **kwargs):
+    # The test's transaction is not visible from the executor's connections
+    return func(*args, **kwargs)
+
+
+@pytest.mark.streams_mark
+@patch('streams.authentication.run_db', new=run_db_inline)
+class TestSanicTokenAuthentication(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.get_event_loop()
+        self.user = UserFactory()
+        self.token = Token.objects.create(user=self.user)
+        tokens_cache.clear()
+
+    def tearDown(self):
+        tokens_cache.clear()
+        super().tearDown()
+
+    def authenticate(self, headers=None, args=None):
+        request = Request(headers=headers or {}, args=args or {})
+        return self.loop.run_until_complete(
+            SanicTokenAuthentication().authenticate_async(request))
+
+    def test_get_token(self):
+        authentication = SanicTokenAuthentication()
+        assert authentication.get_token(Request(headers={}, args={})) is None
+        assert authentication.get_token(Request(
+            headers={'Authorization': 'token {}'.format(self.token.key)}, args={})) == \
+            self.token.key
+        assert authentication.get_token(Request(
+            headers={'Authorization': 'foo {}'.format(self.token.key)}, args={})) is None
+        assert authentication.get_token(Request(
+            headers={}, args={'token': self.token.key})) == self.token.key
+
+    def test_authenticate_caches_valid_tokens(self):
+        assert self.authenticate() is None
+
+        with self.assertNumQueries(1):
+            user, token = self.authenticate(args={'token': self.token.key})
+            assert (user, token) == (self.user, self.token)
+            # The second authentication is cached
+            user, token = self.authenticate(
+                headers={'Authorization': 'token {}'.format(self.token.key)})
+            assert (user, token) == (self.user, self.token)
+
+    def test_authenticate_does_not_cache_invalid_tokens(self):
+        with self.assertNumQueries(2):
+            for _ in range(2):
+                with self.assertRaises(AuthenticationFailed):
+                    self.authenticate(args={'token': 'invalid'})
+        assert tokens_cache.get('invalid') is None
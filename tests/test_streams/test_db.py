@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+import pytest
+
+from mock import patch
+
+from constants.experiments import ExperimentLifeCycle
+from db.models.experiments import Experiment
+from factories.factory_experiments import ExperimentFactory
+from streams.db import TTLCache, get_last_status, run_db, statuses_cache
+from tests.utils import BaseTest
+
+
+async def run_db_inline(func, *args, **kwargs):
+    # The test's transaction is not visible from the executor's connections
+    return func(*args, **kwargs)
+
+
+@pytest.mark.streams_mark
+class TestRunDb(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.get_event_loop()
+
+    def test_run_db_returns_the_result(self):
+        def get_thread(value, other=None):
+            return value, other, threading.get_ident()
+
+        value, other, thread = self.loop.run_until_complete(run_db(get_thread, 1, other=2))
+        assert (value, other) == (1, 2)
+        # The call does not run on the loop's thread
+        assert thread != threading.get_ident()
+
+    def test_run_db_raises_the_exception(self):
+        def fail():
+            raise ValueError('db error')
+
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(run_db(fail))
+
+
+@pytest.mark.streams_mark
+class TestTTLCache(BaseTest):
+    def test_get_and_set(self):
+        cache = TTLCache(ttl=10)
+        assert cache.get('key') is None
+        assert cache.get('key', 'default') == 'default'
+        cache.set('key', 'value')
+        assert cache.get('key') == 'value'
+        cache.clear()
+        assert cache.get('key') is None
+
+    def test_values_expire(self):
+        cache = TTLCache(ttl=10)
+        with patch('streams.db.time.time') as mock_time:
+            mock_time.return_value = 100
+            cache.set('key', 'value')
+            mock_time.return_value = 110
+            assert cache.get('key') == 'value'
+            mock_time.return_value = 111
+            assert cache.get('key') is None
+
+    def test_evicts_expired_then_oldest_values(self):
+        cache = TTLCache(ttl=10, maxsize=2)
+        with patch('streams.db.time.time') as mock_time:
+            mock_time.return_value = 100
+            cache.set('key1', 'value1')
+            mock_time.return_value = 105
+            cache.set('key2', 'value2')
+            # The expired key is evicted
+            mock_time.return_value = 111
+            cache.set('key3', 'value3')
+            assert cache.get('key1') is None
+            assert cache.get('key2') == 'value2'
+            assert cache.get('key3') == 'value3'
+
+            # No key expired, the oldest key is evicted
+            cache.set('key4', 'value4')
+            assert cache.get('key2') is None
+            assert cache.get('key3') == 'value3'
+            assert cache.get('key4') == 'value4'
+
+
+@pytest.mark.streams_mark
+class TestGetLastStatus(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.get_event_loop()
+        statuses_cache.clear()
+
+    def tearDown(self):
+        statuses_cache.clear()
+        super().tearDown()
+
+    def get_last_status(self, run_id):
+        return self.loop.run_until_complete(get_last_status(model=Experiment, run_id=run_id))
+
+    @patch('streams.db.run_db', new=run_db_inline)
+    def test_get_last_status(self):
+        experiment = ExperimentFactory()
+        assert self.get_last_status(experiment.id) == ExperimentLifeCycle.CREATED
+
+        # The status is cached
+        experiment.set_status(ExperimentLifeCycle.SCHEDULED)
+        assert self.get_last_status(experiment.id) == ExperimentLifeCycle.CREATED
+
+        statuses_cache.clear()
+        assert self.get_last_status(experiment.id) == ExperimentLifeCycle.SCHEDULED
+
+    @patch('streams.db.run_db', new=run_db_inline)
+    def test_get_last_status_of_a_missing_run_is_cached(self):
+        with self.assertNumQueries(1):
+            assert self.get_last_status(-1) is None
+            assert self.get_last_status(-1) is None
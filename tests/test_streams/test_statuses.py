@@ -0,0 +1,122 @@
+import asyncio
+import uuid
+
+from collections import namedtuple
+
+import pytest
+
+from mock import patch
+
+from constants.experiments import ExperimentLifeCycle
+from db.models.experiments import Experiment
+from streams.statuses import StatusesWatcher
+from tests.utils import BaseTest
+
+Run = namedtuple('Run', ['id', 'uuid'])
+
+
+@pytest.mark.streams_mark
+class TestStatusesWatcher(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.get_event_loop()
+        self.run = Run(id=1, uuid=uuid.uuid4())
+        self.run_uuid = self.run.uuid.hex
+        self.watcher = StatusesWatcher()
+
+    def get_status(self):
+        return self.loop.run_until_complete(
+            self.watcher.get_status(model=Experiment, run=self.run))
+
+    @patch.object(StatusesWatcher, 'stop')
+    @patch.object(StatusesWatcher, 'start')
+    def test_watch_and_unwatch(self, mock_start, mock_stop):
+        self.watcher.watch(self.run_uuid)
+        self.watcher.watch(self.run_uuid)
+        assert mock_start.call_count == 2
+        assert self.watcher.watched == {self.run_uuid: 2}
+
+        self.watcher.set_status(run_uuid=self.run_uuid, status=ExperimentLifeCycle.RUNNING)
+        self.watcher.unwatch(self.run_uuid)
+        assert self.watcher.watched == {self.run_uuid: 1}
+        assert self.watcher.statuses == {self.run_uuid: ExperimentLifeCycle.RUNNING}
+        assert mock_stop.call_count == 0
+
+        # The last watcher stops the listener and drops the run's status
+        self.watcher.unwatch(self.run_uuid)
+        assert self.watcher.watched == {}
+        assert self.watcher.statuses == {}
+        assert mock_stop.call_count == 1
+
+        # Statuses of the runs that are not watched are ignored
+        self.watcher.set_status(run_uuid=self.run_uuid, status=ExperimentLifeCycle.SUCCEEDED)
+        assert self.watcher.statuses == {}
+
+    @patch.object(StatusesWatcher, 'start')
+    def test_wait_for_status_wakes_up_on_new_status(self, _):
+        self.watcher.watch(self.run_uuid)
+        self.watcher.set_status(run_uuid=self.run_uuid, status=ExperimentLifeCycle.RUNNING)
+
+        self.loop.call_later(0.01,
+                             self.watcher.set_status,
+                             self.run_uuid,
+                             ExperimentLifeCycle.SUCCEEDED)
+        start = self.loop.time()
+        status = self.loop.run_until_complete(
+            self.watcher.wait_for_status(model=Experiment,
+                                         run=self.run,
+                                         last_status=ExperimentLifeCycle.RUNNING,
+                                         timeout=10))
+        assert status == ExperimentLifeCycle.SUCCEEDED
+        assert self.loop.time() - start < 10
+
+        # A different status is returned without waiting
+        status = self.loop.run_until_complete(
+            self.watcher.wait_for_status(model=Experiment,
+                                         run=self.run,
+                                         last_status=ExperimentLifeCycle.RUNNING,
+                                         timeout=10))
+        assert status == ExperimentLifeCycle.SUCCEEDED
+
+    @patch.object(StatusesWatcher, 'start')
+    def test_wait_for_status_times_out(self, _):
+        self.watcher.watch(self.run_uuid)
+        self.watcher.set_status(run_uuid=self.run_uuid, status=ExperimentLifeCycle.RUNNING)
+
+        status = self.loop.run_until_complete(
+            self.watcher.wait_for_status(model=Experiment,
+                                         run=self.run,
+                                         last_status=ExperimentLifeCycle.RUNNING,
+                                         timeout=0.01))
+        assert status == ExperimentLifeCycle.RUNNING
+
+    @patch.object(StatusesWatcher, 'start')
+    def test_get_status_from_redis(self, _):
+        self.watcher.watch(self.run_uuid)
+        with patch('streams.statuses.RedisStatuses.get_statuses') as mock_get_statuses:
+            mock_get_statuses.return_value = {self.run_uuid: ExperimentLifeCycle.RUNNING}
+            with patch('streams.statuses.get_last_status') as mock_get_last_status:
+                assert self.get_status() == ExperimentLifeCycle.RUNNING
+
+        assert mock_get_statuses.call_count == 1
+        assert mock_get_last_status.call_count == 0
+        assert self.watcher.statuses == {self.run_uuid: ExperimentLifeCycle.RUNNING}
+
+    @patch.object(StatusesWatcher, 'start')
+    def test_get_status_falls_back_to_the_db(self, _):
+        calls = []
+
+        async def get_last_status(model, run_id):
+            calls.append((model, run_id))
+            return ExperimentLifeCycle.CREATED
+
+        self.watcher.watch(self.run_uuid)
+        with patch('streams.statuses.RedisStatuses.get_statuses') as mock_get_statuses:
+            mock_get_statuses.return_value = {self.run_uuid: None}
+            with patch('streams.statuses.get_last_status', new=get_last_status):
+                assert self.get_status() == ExperimentLifeCycle.CREATED
+                # The status is kept for the watched run
+                assert self.get_status() == ExperimentLifeCycle.CREATED
+
+        assert mock_get_statuses.call_count == 1
+        assert calls == [(Experiment, self.run.id)]